@@ -1,6 +1,12 @@
 # app/api/auth_utils.py
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from app.config import settings
@@ -10,7 +16,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -29,6 +35,105 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+# bcrypt releases the GIL, so verifications in this pool run in parallel without
+# stalling the event loop. Its size caps the CPU a burst of logins can take.
+_password_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_VERIFY_WORKERS, thread_name_prefix="password-verify")
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
+
+@lru_cache(maxsize=1)
+def get_demo_password_hash() -> Optional[str]:
+    """
+    Hash the demo login is checked against: DEMO_PASSWORD_HASH if configured,
+    otherwise DEMO_PASSWORD hashed once and kept for the life of the process.
+    """
+    if settings.DEMO_PASSWORD_HASH:
+        return settings.DEMO_PASSWORD_HASH
+    if settings.DEMO_PASSWORD:
+        return get_password_hash(settings.DEMO_PASSWORD)
+    return None
+
+class TokenCache:
+    """
+    Thread-safe LRU map of verified token -> subject. An entry is only returned
+    before the token's `exp`, so a cached token never outlives its expiry.
+    """
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.enabled = max_entries > 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    def get(self, token: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            subject, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[token]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return subject
+
+    def put(self, token: str, subject: str, expires_at: float):
+        with self._lock:
+            self._entries[token] = (subject, expires_at)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+            }
+
+token_cache = TokenCache(settings.TOKEN_CACHE_MAX_ENTRIES)
+
+def _request_token(request: Request) -> Optional[str]:
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        token = auth_header.split(" ")[1]
+        if token:
+            return token
+    return request.cookies.get("access_token")
+
+def verified_token_subject(token: str) -> Optional[str]:
+    """
+    Returns the `sub` of a valid token (None if it has none) and raises JWTError
+    for an invalid one. Tokens seen before are answered from `token_cache`.
+    """
+    if token_cache.enabled:
+        subject = token_cache.get(token)
+        if subject is not None:
+            return subject
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    subject = payload.get("sub")
+    expires_at = payload.get("exp")
+    # Tokens without an expiry are valid forever, so they are never cached.
+    if token_cache.enabled and subject is not None and isinstance(expires_at, (int, float)):
+        token_cache.put(token, subject, expires_at)
+    return subject
+
 async def get_current_user(request: Request):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -36,50 +141,33 @@ async def get_current_user(request: Request):
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    auth_header = request.headers.get("Authorization")
-    token_to_check = None
-    if auth_header and auth_header.startswith("Bearer "):
-        token_to_check = auth_header.split(" ")[1]
-
-    if not token_to_check:
-        token_to_check = request.cookies.get("access_token")
-
+    token_to_check = _request_token(request)
     if not token_to_check:
         logger.warning("Token not found in header or cookie.")
         raise credentials_exception
 
     try:
-        payload = jwt.decode(token_to_check, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
+        username = verified_token_subject(token_to_check)
         if username is None:
             logger.warning("Invalid token payload: missing 'sub'")
             raise credentials_exception
         return username
     except JWTError as e:
-        logger.warning(f"JWT decoding failed: {e}")
+        logger.warning("JWT decoding failed: %s", e)
         raise credentials_exception
     
 async def get_current_user_optional(request: Request):
-    token_to_check = None
-    auth_header = request.headers.get("Authorization")
-    
-    if auth_header and auth_header.startswith("Bearer "):
-        token_to_check = auth_header.split(" ")[1]
-
-    if not token_to_check:
-        token_to_check = request.cookies.get("access_token")
-
+    token_to_check = _request_token(request)
     if not token_to_check:
         logger.info("Optional token check: No token found. Returning None.")
         return None
 
     try:
-        payload = jwt.decode(token_to_check, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
+        username = verified_token_subject(token_to_check)
         if username is None:
             logger.warning("Optional token check: Invalid token payload. Returning None.")
             return None
         return username
     except JWTError:
         logger.warning("Optional token check: JWT decoding failed. Returning None.")
-        return None
\ No newline at end of file
+        return None
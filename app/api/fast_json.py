@@ -0,0 +1,61 @@
+# app/api/fast_json.py
+# Fast JSON responses for large list and summary endpoints.
+#
+# When an endpoint returns pydantic models under a response_model, FastAPI dumps
+# them to dicts, validates those against the response model again and encodes the
+# result with json.dumps. `fast_json_response` serializes the models once,
+# straight to bytes, with pydantic-core's TypeAdapter.dump_json. Endpoints keep
+# their response_model, which still documents the response in the OpenAPI schema.
+#
+# `fast_json_rows` does the same for the plain-dict row projections returned by
+# the list functions of app.database, through a TypedDict with the model's field
+# types, so the dicts are serialized as typed fields rather than inferred values.
+
+from functools import lru_cache
+from typing import Any, Dict, List, Type
+
+from typing_extensions import TypedDict
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.config import settings
+
+@lru_cache(maxsize=None)
+def _type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+@lru_cache(maxsize=None)
+def _row_list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    row_type = TypedDict(f"{model.__name__}Row", {name: field.annotation for name, field in model.model_fields.items()}, total=False)
+    return TypeAdapter(List[row_type])
+
+def _json_response(body: bytes, response: Response) -> Response:
+    fast_response = Response(content=body, status_code=response.status_code or 200, media_type="application/json")
+    fast_response.raw_headers.extend(
+        (name, value) for name, value in response.raw_headers if name not in (b"content-length", b"content-type")
+    )
+    return fast_response
+
+def fast_json_response(content: Any, response_type: Any, response: Response) -> Any:
+    """
+    Returns `content` (already of `response_type`) as a serialized JSON response,
+    carrying over the status code and headers set on the endpoint's injected
+    `response` (ETag, Cache-Control, X-Next-Cursor, ...). With
+    FAST_JSON_RESPONSES disabled, `content` is returned unchanged for FastAPI to
+    validate and serialize as usual.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return content
+    return _json_response(_type_adapter(response_type).dump_json(content), response)
+
+def fast_json_rows(rows: List[Dict[str, Any]], model: Type[BaseModel], response: Response) -> Any:
+    """
+    Returns a list of plain dicts keyed by the field names of `model` as a
+    serialized JSON array, like `fast_json_response`. With FAST_JSON_RESPONSES
+    disabled, the rows are turned into `model` instances for FastAPI to handle as
+    usual.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return _type_adapter(List[model]).validate_python(rows, by_name=True)
+    return _json_response(_row_list_adapter(model).dump_json(rows), response)
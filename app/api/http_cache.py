@@ -0,0 +1,97 @@
+# app/api/http_cache.py
+# ETag revalidation and Cache-Control headers for the JSON API.
+#
+# Every cacheable GET endpoint depends on `conditional_get(...)`, which builds a
+# weak ETag from the change counters of the tables the response is read from.
+# A matching If-None-Match short-circuits the request with 304 Not Modified
+# before the endpoint queries anything else.
+
+import calendar
+import hashlib
+from datetime import date
+from typing import Callable, Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import async_database
+from app.config import settings
+from app.database import get_async_db, DBFixedCost, DBDailyExpense, DBIncome, DBCashOnHand, DBDailyRollup, DBCashMovement, DBCashSnapshot
+from app.api.auth_utils import get_current_user
+
+FIXED_COST_TABLES = (DBFixedCost.__tablename__,)
+DAILY_EXPENSE_TABLES = (DBDailyExpense.__tablename__,)
+INCOME_TABLES = (DBIncome.__tablename__,)
+CASH_ON_HAND_TABLES = (DBCashOnHand.__tablename__, DBCashMovement.__tablename__, DBCashSnapshot.__tablename__)
+SUMMARY_TABLES = (DBFixedCost.__tablename__, DBDailyExpense.__tablename__, DBIncome.__tablename__, DBDailyRollup.__tablename__)
+DASHBOARD_TABLES = SUMMARY_TABLES + CASH_ON_HAND_TABLES
+SEARCH_TABLES = FIXED_COST_TABLES + DAILY_EXPENSE_TABLES + INCOME_TABLES
+
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+def _query_int(request: Request, name: str, default: int) -> Optional[int]:
+    try:
+        return int(request.query_params.get(name, default))
+    except ValueError:
+        return None
+
+def month_period_end(request: Request) -> Optional[date]:
+    """
+    Last day of the month selected by the `year`/`month` query parameters.
+    """
+    today = date.today()
+    year, month = _query_int(request, "year", today.year), _query_int(request, "month", today.month)
+    if year is None or month is None or not 1 <= month <= 12 or not 1 <= year <= 9999:
+        return None
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+def year_period_end(request: Request) -> Optional[date]:
+    """
+    Last day of the year selected by the `year` query parameter.
+    """
+    year = _query_int(request, "year", date.today().year)
+    if year is None or not 1 <= year <= 9999:
+        return None
+    return date(year, 12, 31)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 8.8.3.2): the W/ prefix is ignored.
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+def conditional_get(*table_names: str, period_end: Optional[Callable[[Request], Optional[date]]] = None):
+    """
+    Returns a dependency that sets ETag and Cache-Control on the response and raises
+    304 Not Modified when the client already holds the current representation.
+
+    With `period_end`, responses for a period that ended before today are sent with
+    a long-lived immutable Cache-Control instead of forcing revalidation.
+    """
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: dict = Depends(get_current_user)
+    ) -> None:
+        versions = await async_database.get_table_versions(db, list(table_names))
+        today = date.today()
+        # The date is part of the tag because endpoints default their period to "now".
+        fingerprint = f"{request.url.path}?{request.url.query}|{today.isoformat()}|" + ",".join(
+            f"{table_name}:{version}" for table_name, version in sorted(versions.items())
+        )
+        etag = f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+
+        last_day = period_end(request) if period_end else None
+        if last_day is not None and last_day < today:
+            cache_control = f"private, max-age={settings.CLOSED_PERIOD_MAX_AGE_SECONDS}, immutable"
+        else:
+            cache_control = REVALIDATE_CACHE_CONTROL
+
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+    return dependency
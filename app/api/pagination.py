@@ -0,0 +1,83 @@
+# app/api/pagination.py
+# Shared filtering, ordering and keyset pagination parameters for the list endpoints.
+#
+# Pages are ordered by (date, id). The cursor handed out in the X-Next-Cursor
+# response header is an opaque token holding the (date, id) of the last row of the
+# page; passing it back as `cursor` continues right after that row.
+
+import base64
+import calendar
+from datetime import date
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Query, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(row_date: date, row_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{row_date.isoformat()}|{row_id}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        row_date, row_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return date.fromisoformat(row_date), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+
+class ListQueryParams:
+    """
+    Query parameters accepted by the list endpoints. `year`/`month` and `from`/`to`
+    can be combined; the result is their intersection. Without `limit` every
+    matching row is returned.
+    """
+    def __init__(
+        self,
+        year: Optional[int] = Query(None, ge=1, le=9999, description="Only entries from this year"),
+        month: Optional[int] = Query(None, ge=1, le=12, description="Only entries from this month (requires year)"),
+        from_date: Optional[date] = Query(None, alias="from", description="Only entries on or after this date (YYYY-MM-DD)"),
+        to_date: Optional[date] = Query(None, alias="to", description="Only entries on or before this date (YYYY-MM-DD)"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of entries to return"),
+        order: str = Query("desc", pattern="^(asc|desc)$", description="Sort by date and ID: 'asc' or 'desc'"),
+        cursor: Optional[str] = Query(None, description="Value of the X-Next-Cursor header of the previous page"),
+    ):
+        if month is not None and year is None:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="month requires year.")
+        self.start_date = from_date
+        self.end_date = to_date
+        if year is not None:
+            first_month, last_month = (month, month) if month is not None else (1, 12)
+            period_start = date(year, first_month, 1)
+            period_end = date(year, last_month, calendar.monthrange(year, last_month)[1])
+            self.start_date = max(period_start, from_date) if from_date else period_start
+            self.end_date = min(period_end, to_date) if to_date else period_end
+        self.limit = limit
+        self.descending = order == "desc"
+        self.after = decode_cursor(cursor) if cursor else None
+
+    def page_kwargs(self) -> dict:
+        """
+        Keyword arguments for the database.get_*_page functions. One extra row is
+        requested to find out whether another page follows.
+        """
+        return {
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "after": self.after,
+            "descending": self.descending,
+            "limit": self.limit + 1 if self.limit is not None else None,
+        }
+
+    def trim_page(self, rows: list, response: Response, date_field: str) -> list:
+        """
+        Drops the look-ahead row and, if there was one, sets X-Next-Cursor to the
+        key of the last row returned. Rows are the dicts of the database.get_*_page
+        functions.
+        """
+        if self.limit is None or len(rows) <= self.limit:
+            return rows
+        rows = rows[:self.limit]
+        last_row = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last_row[date_field], last_row["doc_id"])
+        return rows
@@ -1,13 +1,16 @@
 # app/api/routers/daily_expenses.py
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Response
 from typing import List, Dict, Any
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import database
-from app.database import get_db
+from app import async_database
+from app.database import get_async_db, parse_entry_date
 from app.models import DailyExpense, PaymentMethod
 from app.api.auth_utils import get_current_user
+from app.api.http_cache import conditional_get, DAILY_EXPENSE_TABLES
+from app.api.pagination import ListQueryParams
+from app.api.fast_json import fast_json_rows
 
 logger = logging.getLogger(__name__)
 
@@ -17,79 +20,99 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("/", response_model=List[DailyExpense], summary="Retrieve all daily expenses")
-async def get_daily_expenses(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+@router.get("/", response_model=List[DailyExpense], dependencies=[Depends(conditional_get(*DAILY_EXPENSE_TABLES))], summary="Retrieve daily expenses")
+async def get_daily_expenses(
+    response: Response,
+    params: ListQueryParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
     """
-    Retrieves a list of all daily expense entries from the database.
+    Retrieves daily expense entries ordered by date and ID, optionally filtered by
+    year/month or a date range. With `limit`, the X-Next-Cursor response header
+    holds the cursor for the next page.
     """
-    logger.info("Attempting to retrieve all daily expenses.")
-    expenses = database.get_all_daily_expenses(db)
-    logger.info(f"Successfully retrieved {len(expenses)} daily expenses.")
-    return expenses
+    logger.info("Attempting to retrieve daily expenses.")
+    expenses = await async_database.get_daily_expenses_page(db, **params.page_kwargs())
+    expenses = params.trim_page(expenses, response, "cost_date")
+    logger.info("Successfully retrieved %s daily expenses.", len(expenses))
+    return fast_json_rows(expenses, DailyExpense, response)
 
-@router.get("/{doc_id}", response_model=DailyExpense, summary="Retrieve a specific daily expense by ID")
-async def get_daily_expense_by_id(doc_id: int, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+@router.get("/{doc_id}", response_model=DailyExpense, dependencies=[Depends(conditional_get(*DAILY_EXPENSE_TABLES))], summary="Retrieve a specific daily expense by ID")
+async def get_daily_expense_by_id(doc_id: int, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Retrieves a single daily expense entry by its document ID.
     Raises a 404 error if the expense is not found.
     """
-    logger.info(f"Attempting to retrieve daily expense with ID: {doc_id}")
-    expense = database.get_daily_expense_by_id(db, doc_id)
+    logger.info("Attempting to retrieve daily expense with ID: %s", doc_id)
+    expense = await async_database.get_daily_expense_by_id(db, doc_id)
     if not expense:
-        logger.warning(f"Daily expense with ID {doc_id} not found.")
+        logger.warning("Daily expense with ID %s not found.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Daily expense not found")
-    logger.info(f"Successfully retrieved daily expense with ID: {doc_id}")
+    logger.info("Successfully retrieved daily expense with ID: %s", doc_id)
     return expense
 
 @router.post("/", response_model=DailyExpense, status_code=status.HTTP_201_CREATED, summary="Create a new daily expense")
-async def create_daily_expense(daily_expense: DailyExpense, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def create_daily_expense(daily_expense: DailyExpense, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Adds a new daily expense entry to the database.
     """
-    logger.info(f"Attempting to create a new daily expense: {daily_expense.description}")
+    logger.info("Attempting to create a new daily expense: %s", daily_expense.description)
     try:
-        new_expense = database.add_daily_expense(db, daily_expense)
-        logger.info(f"Daily expense created successfully with ID: {new_expense.doc_id}")
+        new_expense = await async_database.add_daily_expense(db, daily_expense)
+        logger.info("Daily expense created successfully with ID: %s", new_expense.doc_id)
         return new_expense
     except Exception as e:
-        logger.error(f"Failed to create daily expense: {e}", exc_info=True)
+        logger.error("Failed to create daily expense: %s", e, exc_info=True)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error adding daily expense: {e}")
 
 @router.put("/{doc_id}", response_model=DailyExpense, summary="Update an existing daily expense by ID")
-async def update_daily_expense_api(doc_id: int, updates: Dict[str, Any], db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def update_daily_expense_api(doc_id: int, updates: Dict[str, Any], db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Updates an existing daily expense entry by its document ID.
     """
-    logger.info(f"Attempting to update daily expense with ID {doc_id} with updates: {updates}")
+    logger.info("Attempting to update daily expense with ID %s with updates: %s", doc_id, updates)
 
     if 'payment_method' in updates and isinstance(updates['payment_method'], str):
         try:
             updates['payment_method'] = PaymentMethod(updates['payment_method'])
         except ValueError:
-            logger.warning(f"Invalid payment_method provided for daily expense update: {updates['payment_method']}")
+            logger.warning("Invalid payment_method provided for daily expense update: %s", updates['payment_method'])
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid payment_method provided")
 
-    success = database.update_daily_expense(db, doc_id, updates)
+    if 'cost_date' in updates:
+        try:
+            updates['cost_date'] = parse_entry_date(updates['cost_date'])
+        except ValueError:
+            logger.warning("Invalid cost_date provided for daily expense update: %s", updates['cost_date'])
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cost_date provided")
+
+    try:
+        success = await async_database.update_daily_expense(db, doc_id, updates)
+    except ValueError as e:
+        # Raised before anything is written: an unknown field or a value the model rejects.
+        logger.warning("Invalid update for daily expense with ID %s: %s", doc_id, e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid update: {e}")
     if not success:
-        logger.warning(f"Daily expense with ID {doc_id} not found or update failed.")
+        logger.warning("Daily expense with ID %s not found or update failed.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Daily expense with ID {doc_id} not found or update failed.")
     
-    updated_expense = database.get_daily_expense_by_id(db, doc_id)
+    updated_expense = await async_database.get_daily_expense_by_id(db, doc_id)
     if not updated_expense:
-        logger.error(f"Failed to retrieve updated daily expense with ID {doc_id} after successful update operation.")
+        logger.error("Failed to retrieve updated daily expense with ID %s after successful update operation.", doc_id)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve updated daily expense.")
-    logger.info(f"Daily expense with ID {doc_id} updated successfully.")
+    logger.info("Daily expense with ID %s updated successfully.", doc_id)
     return updated_expense
 
 @router.delete("/{doc_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a daily expense by ID")
-async def delete_daily_expense_api(doc_id: int, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def delete_daily_expense_api(doc_id: int, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Deletes a daily expense entry by its document ID.
     """
-    logger.info(f"Attempting to delete daily expense with ID: {doc_id}")
-    success = database.delete_daily_expense(db, doc_id)
+    logger.info("Attempting to delete daily expense with ID: %s", doc_id)
+    success = await async_database.delete_daily_expense(db, doc_id)
     if not success:
-        logger.warning(f"Daily expense with ID {doc_id} not found or deletion failed.")
+        logger.warning("Daily expense with ID %s not found or deletion failed.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Daily expense not found")
-    logger.info(f"Daily expense with ID {doc_id} deleted successfully.")
+    logger.info("Daily expense with ID %s deleted successfully.", doc_id)
     return {"message": "Daily expense deleted successfully"}
@@ -0,0 +1,80 @@
+# app/api/routers/export.py
+from fastapi import APIRouter, Depends, HTTPException, Path, Query as FastAPIQuery, status
+from fastapi.responses import StreamingResponse
+from datetime import date, datetime
+from enum import Enum
+from typing import AsyncIterator, Optional
+import csv
+import io
+import json
+import logging
+
+from app.database import AsyncSessionLocal, EXPORT_TABLES, get_export_statement
+from app.api.auth_utils import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/export",
+    tags=["Export"],
+)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+def _export_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_export_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+def _ndjson_chunk(columns, rows) -> str:
+    return "".join(
+        json.dumps({column: _export_value(value) for column, value in zip(columns, row)}) + "\n" for row in rows
+    )
+
+async def _stream_export(table_name: str, export_format: str, start_date: Optional[date], end_date: Optional[date]) -> AsyncIterator[str]:
+    # The session is opened here rather than through get_async_db, because the
+    # request's dependencies are closed before the response body is streamed.
+    statement = get_export_statement(table_name, start_date, end_date)
+    row_count = 0
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(statement)
+        columns = list(result.keys())
+        if export_format == "csv":
+            yield _csv_chunk([columns])
+        async for rows in result.partitions():
+            row_count += len(rows)
+            yield _csv_chunk(rows) if export_format == "csv" else _ndjson_chunk(columns, rows)
+    logger.info("Exported %s rows from %s as %s.", row_count, table_name, export_format)
+
+@router.get("/{table_name}.{export_format}", summary="Stream a table as CSV or NDJSON")
+async def export_table_api(
+    table_name: str = Path(..., pattern=f"^({'|'.join(EXPORT_TABLES)})$", description="Table to export: fixed-costs, daily-expenses or income"),
+    export_format: str = Path(..., pattern="^(csv|ndjson)$", description="Output format: csv or ndjson"),
+    start_date: Optional[date] = FastAPIQuery(None, alias="from", description="Only entries on or after this date (YYYY-MM-DD)"),
+    end_date: Optional[date] = FastAPIQuery(None, alias="to", description="Only entries on or before this date (YYYY-MM-DD)"),
+    current_user: dict = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Streams every entry of a table, ordered by date and ID, optionally limited to a
+    date range. Rows are read from a server-side cursor in batches and written out
+    as they arrive, so memory use does not grow with the size of the table.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="'from' must not be after 'to'.")
+    logger.info("Request to export %s as %s (%s to %s).", table_name, export_format, start_date, end_date)
+    filename = f"{table_name}.{export_format}"
+    return StreamingResponse(
+        _stream_export(table_name, export_format, start_date, end_date),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,13 +1,16 @@
 # app/api/routers/fixed_costs.py
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Response
 from typing import List, Dict, Any
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import database
-from app.database import get_db
+from app import async_database
+from app.database import get_async_db, parse_entry_date
 from app.models import FixedCost, PaymentMethod
 from app.api.auth_utils import get_current_user
+from app.api.http_cache import conditional_get, FIXED_COST_TABLES
+from app.api.pagination import ListQueryParams
+from app.api.fast_json import fast_json_rows
 
 logger = logging.getLogger(__name__)
 
@@ -17,79 +20,99 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("/", response_model=List[FixedCost], summary="Retrieve all fixed costs")
-async def get_fixed_costs(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+@router.get("/", response_model=List[FixedCost], dependencies=[Depends(conditional_get(*FIXED_COST_TABLES))], summary="Retrieve fixed costs")
+async def get_fixed_costs(
+    response: Response,
+    params: ListQueryParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
     """
-    Retrieves a list of all fixed cost entries from the database.
+    Retrieves fixed cost entries ordered by date and ID, optionally filtered by
+    year/month or a date range. With `limit`, the X-Next-Cursor response header
+    holds the cursor for the next page.
     """
-    logger.info("Attempting to retrieve all fixed costs.")
-    costs = database.get_all_fixed_costs(db)
-    logger.info(f"Successfully retrieved {len(costs)} fixed costs.")
-    return costs
+    logger.info("Attempting to retrieve fixed costs.")
+    costs = await async_database.get_fixed_costs_page(db, **params.page_kwargs())
+    costs = params.trim_page(costs, response, "cost_date")
+    logger.info("Successfully retrieved %s fixed costs.", len(costs))
+    return fast_json_rows(costs, FixedCost, response)
 
-@router.get("/{doc_id}", response_model=FixedCost, summary="Retrieve a specific fixed cost by ID")
-async def get_fixed_cost_by_id(doc_id: int, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+@router.get("/{doc_id}", response_model=FixedCost, dependencies=[Depends(conditional_get(*FIXED_COST_TABLES))], summary="Retrieve a specific fixed cost by ID")
+async def get_fixed_cost_by_id(doc_id: int, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Retrieves a single fixed cost entry by its document ID.
     Raises a 404 error if the cost is not found.
     """
-    logger.info(f"Attempting to retrieve fixed cost with ID: {doc_id}")
-    cost = database.get_fixed_cost_by_id(db, doc_id)
+    logger.info("Attempting to retrieve fixed cost with ID: %s", doc_id)
+    cost = await async_database.get_fixed_cost_by_id(db, doc_id)
     if not cost:
-        logger.warning(f"Fixed cost with ID {doc_id} not found.")
+        logger.warning("Fixed cost with ID %s not found.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Fixed cost with ID {doc_id} not found")
-    logger.info(f"Successfully retrieved fixed cost with ID: {doc_id}")
+    logger.info("Successfully retrieved fixed cost with ID: %s", doc_id)
     return cost
 
 @router.post("/", response_model=FixedCost, status_code=status.HTTP_201_CREATED, summary="Create a new fixed cost")
-async def create_fixed_cost(fixed_cost: FixedCost, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def create_fixed_cost(fixed_cost: FixedCost, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Adds a new fixed cost entry to the database.
     """
-    logger.info(f"Attempting to create a new fixed cost: {fixed_cost.description}")
+    logger.info("Attempting to create a new fixed cost: %s", fixed_cost.description)
     try:
-        new_cost = database.add_fixed_cost(db, fixed_cost)
-        logger.info(f"Fixed cost created successfully with ID: {new_cost.doc_id}")
+        new_cost = await async_database.add_fixed_cost(db, fixed_cost)
+        logger.info("Fixed cost created successfully with ID: %s", new_cost.doc_id)
         return new_cost
     except Exception as e:
-        logger.error(f"Failed to create fixed cost: {e}", exc_info=True)
+        logger.error("Failed to create fixed cost: %s", e, exc_info=True)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error adding fixed cost: {e}")
 
 @router.put("/{doc_id}", response_model=FixedCost, summary="Update an existing fixed cost by ID")
-async def update_fixed_cost_api(doc_id: int, updates: Dict[str, Any], db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def update_fixed_cost_api(doc_id: int, updates: Dict[str, Any], db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Updates an existing fixed cost entry by its document ID.
     """
-    logger.info(f"Attempting to update fixed cost with ID {doc_id} with updates: {updates}")
+    logger.info("Attempting to update fixed cost with ID %s with updates: %s", doc_id, updates)
     
     if 'payment_method' in updates and isinstance(updates['payment_method'], str):
         try:
             updates['payment_method'] = PaymentMethod(updates['payment_method'])
         except ValueError:
-            logger.warning(f"Invalid payment_method provided for fixed cost update: {updates['payment_method']}")
+            logger.warning("Invalid payment_method provided for fixed cost update: %s", updates['payment_method'])
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid payment_method provided")
 
-    success = database.update_fixed_cost(db, doc_id, updates)
+    if 'cost_date' in updates:
+        try:
+            updates['cost_date'] = parse_entry_date(updates['cost_date'])
+        except ValueError:
+            logger.warning("Invalid cost_date provided for fixed cost update: %s", updates['cost_date'])
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cost_date provided")
+
+    try:
+        success = await async_database.update_fixed_cost(db, doc_id, updates)
+    except ValueError as e:
+        # Raised before anything is written: an unknown field or a value the model rejects.
+        logger.warning("Invalid update for fixed cost with ID %s: %s", doc_id, e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid update: {e}")
     if not success:
-        logger.warning(f"Fixed cost with ID {doc_id} not found or update failed.")
+        logger.warning("Fixed cost with ID %s not found or update failed.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Fixed cost with ID {doc_id} not found or update failed.")
     
-    updated_cost = database.get_fixed_cost_by_id(db, doc_id)
+    updated_cost = await async_database.get_fixed_cost_by_id(db, doc_id)
     if not updated_cost:
-        logger.error(f"Failed to retrieve updated fixed cost with ID {doc_id} after successful update operation.")
+        logger.error("Failed to retrieve updated fixed cost with ID %s after successful update operation.", doc_id)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve updated fixed cost.")
-    logger.info(f"Fixed cost with ID {doc_id} updated successfully.")
+    logger.info("Fixed cost with ID %s updated successfully.", doc_id)
     return updated_cost
 
 @router.delete("/{doc_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a fixed cost by ID")
-async def delete_fixed_cost_api(doc_id: int, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def delete_fixed_cost_api(doc_id: int, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Deletes a fixed cost entry by its document ID.
     """
-    logger.info(f"Attempting to delete fixed cost with ID: {doc_id}")
-    success = database.delete_fixed_cost(db, doc_id)
+    logger.info("Attempting to delete fixed cost with ID: %s", doc_id)
+    success = await async_database.delete_fixed_cost(db, doc_id)
     if not success:
-        logger.warning(f"Fixed cost with ID {doc_id} not found or deletion failed.")
+        logger.warning("Fixed cost with ID %s not found or deletion failed.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Fixed cost with ID {doc_id} not found or deletion failed.")
-    logger.info(f"Fixed cost with ID {doc_id} deleted successfully.")
+    logger.info("Fixed cost with ID %s deleted successfully.", doc_id)
     return {"message": "Fixed cost deleted successfully"}
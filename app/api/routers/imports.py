@@ -0,0 +1,54 @@
+# app/api/routers/imports.py
+from fastapi import APIRouter, Depends, File, HTTPException, Path, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+import csv
+import io
+import logging
+
+from app import async_database
+from app.database import get_async_db, IMPORT_TABLES
+from app.models import ImportResult, ImportRowError
+from app.api.auth_utils import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/import",
+    tags=["Import"],
+)
+
+@router.post("/{table_name}", response_model=ImportResult, summary="Import entries from a CSV file")
+async def import_table_api(
+    table_name: str = Path(..., pattern=f"^({'|'.join(IMPORT_TABLES)})$", description="Table to import into: fixed-costs, daily-expenses or income"),
+    file: UploadFile = File(..., description="CSV file with a header row naming the entry fields"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Imports every row of an uploaded CSV file in a single transaction. The header row
+    names the fields of the entry model (as in the CSV export; doc_id and timestamp
+    columns are ignored). If any row is invalid nothing is imported, and the response
+    is a 422 listing the invalid rows by line number.
+    """
+    logger.info("Request to import %s into %s.", file.filename, table_name)
+    reader = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8-sig", newline=""))
+    try:
+        # Large uploads are spooled to disk and reading them blocks, so the file is
+        # decoded and parsed in a worker thread before the rows are imported.
+        fieldnames, rows = await run_in_threadpool(lambda: (reader.fieldnames, [(reader.line_num, row) for row in reader]))
+        _, schema, _ = IMPORT_TABLES[table_name]
+        columns = {name.strip() for name in fieldnames or [] if name}
+        missing_columns = [name for name, field in schema.model_fields.items() if field.is_required() and name not in columns]
+        if missing_columns:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=ImportResult(
+                table=table_name, imported=0, cash_on_hand_delta=0.0,
+                errors=[ImportRowError(row=1, errors=[f"missing column: {name}" for name in missing_columns])]
+            ).model_dump(mode="json"))
+        result = await async_database.import_entries(db, table_name, rows)
+    except (UnicodeDecodeError, csv.Error) as e:
+        logger.warning("Import into %s failed to parse at line %s: %s", table_name, reader.line_num, e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not read CSV file at line {reader.line_num}: {e}")
+    if result.errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=result.model_dump(mode="json"))
+    return result
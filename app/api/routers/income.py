@@ -1,14 +1,17 @@
 # app/api/routers/income.py
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
 from datetime import datetime, date
 from typing import List
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import database
-from app.database import get_db
+from app import async_database
+from app.database import get_async_db
 from app.models import Income, AggregatedIncome
 from app.api.auth_utils import get_current_user
+from app.api.http_cache import conditional_get, INCOME_TABLES
+from app.api.pagination import ListQueryParams
+from app.api.fast_json import fast_json_rows
 
 logger = logging.getLogger(__name__)
 
@@ -18,65 +21,68 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("/", response_model=List[AggregatedIncome], summary="Retrieve all aggregated income entries by date")
-async def get_aggregated_income(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)) -> List[AggregatedIncome]:
+@router.get("/", response_model=List[AggregatedIncome], dependencies=[Depends(conditional_get(*INCOME_TABLES))], summary="Retrieve all aggregated income entries by date")
+async def get_aggregated_income(response: Response, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)) -> List[AggregatedIncome]:
     """
     Retrieves a list of all income entries from the database, aggregated by date.
     """
     logger.info("Attempting to retrieve all aggregated income entries.")
-    aggregated_incomes = database.get_aggregated_income_by_date(db)
-    logger.info(f"Successfully retrieved {len(aggregated_incomes)} aggregated income entries.")
-    return aggregated_incomes
+    aggregated_incomes = await async_database.get_aggregated_income_by_date(db)
+    logger.info("Successfully retrieved %s aggregated income entries.", len(aggregated_incomes))
+    return fast_json_rows(aggregated_incomes, AggregatedIncome, response)
 
-@router.get("/all-individual", response_model=List[Income], summary="Retrieve all individual income entries")
-async def get_all_individual_income(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)) -> List[Income]:
+@router.get("/all-individual", response_model=List[Income], dependencies=[Depends(conditional_get(*INCOME_TABLES))], summary="Retrieve individual income entries")
+async def get_all_individual_income(
+    response: Response,
+    params: ListQueryParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+) -> List[Income]:
     """
-    Retrieves a list of all individual income entries from the database.
+    Retrieves individual income entries ordered by date and ID, optionally filtered by
+    year/month or a date range. With `limit`, the X-Next-Cursor response header
+    holds the cursor for the next page.
     This endpoint is for internal use where non-aggregated data is needed (e.g., calculations).
     """
-    logger.info("Attempting to retrieve all individual income entries.")
-    incomes_from_db = database.get_all_income(db)
-    processed_incomes = []
-    for income_item in incomes_from_db:
-        tours_revenue = income_item.tours_revenue_eur if income_item.tours_revenue_eur is not None else 0.0
-        transfers_revenue = income_item.transfers_revenue_eur if income_item.transfers_revenue_eur is not None else 0.0
-        income_item.daily_total_eur = tours_revenue + transfers_revenue
-        processed_incomes.append(income_item)
-    logger.info(f"Successfully retrieved and processed {len(processed_incomes)} individual income entries.")
-    return processed_incomes
+    logger.info("Attempting to retrieve individual income entries.")
+    # daily_total_eur is computed by the query.
+    incomes = await async_database.get_income_page(db, **params.page_kwargs())
+    incomes = params.trim_page(incomes, response, "income_date")
+    logger.info("Successfully retrieved and processed %s individual income entries.", len(incomes))
+    return fast_json_rows(incomes, Income, response)
 
     
-@router.get("/daily-summary", response_model=AggregatedIncome, summary="Retrieve aggregated income for a single day")
+@router.get("/daily-summary", response_model=AggregatedIncome, dependencies=[Depends(conditional_get(*INCOME_TABLES))], summary="Retrieve aggregated income for a single day")
 async def get_single_day_income_summary_api(
     date_param: str = Query(..., description="Date for the summary (YYYY-MM-DD)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> AggregatedIncome:
     try:
         parsed_date = datetime.strptime(date_param, "%Y-%m-%d").date()
         target_datetime = datetime.combine(parsed_date, datetime.min.time())
-        daily_summary = database.get_single_day_income_summary(db, target_datetime)
-        logger.info(f"Successfully retrieved single day income summary for {date_param}: {daily_summary.total_daily_income_eur:.2f} EUR")
+        daily_summary = await async_database.get_single_day_income_summary(db, target_datetime)
+        logger.info("Successfully retrieved single day income summary for %s: %.2f EUR", date_param, daily_summary.total_daily_income_eur)
         return daily_summary
     except ValueError as ve:
-        logger.error(f"API: Date parsing error for '{date_param}': {ve}")
+        logger.error("API: Date parsing error for '%s': %s", date_param, ve)
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Invalid date format. Expected YYYY-MM-DD. Error: {ve}")
     except Exception as e:
-        logger.error(f"API: Unhandled error in get_single_day_income_summary_api for date {date_param}: {e}", exc_info=True)
+        logger.error("API: Unhandled error in get_single_day_income_summary_api for date %s: %s", date_param, e, exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error loading comparison data: HTTP error! status: 422 for today's income")
 
-@router.get("/{doc_id}", response_model=Income, summary="Retrieve a specific income entry by ID")
-async def get_income_by_id(doc_id: int, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)) -> Income:
+@router.get("/{doc_id}", response_model=Income, dependencies=[Depends(conditional_get(*INCOME_TABLES))], summary="Retrieve a specific income entry by ID")
+async def get_income_by_id(doc_id: int, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)) -> Income:
     """
     Retrieves a single income entry by its document ID and calculates
     the daily_total_eur for it.
     Raises a 404 error if the income is not found.
     """
-    logger.info(f"Attempting to retrieve income entry with ID: {doc_id}")
+    logger.info("Attempting to retrieve income entry with ID: %s", doc_id)
     
-    inc = database.get_income_by_id(db, doc_id)
+    inc = await async_database.get_income_by_id(db, doc_id)
     if not inc:
-        logger.warning(f"Income entry with ID {doc_id} not found.")
+        logger.warning("Income entry with ID %s not found.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Income entry with ID {doc_id} not found.")
     
     tours_revenue = inc.tours_revenue_eur if inc.tours_revenue_eur is not None else 0.0
@@ -84,67 +90,72 @@ async def get_income_by_id(doc_id: int, db: Session = Depends(get_db), current_u
     
     inc.daily_total_eur = tours_revenue + transfers_revenue
     
-    logger.info(f"Successfully retrieved and processed income entry with ID: {doc_id}.")
+    logger.info("Successfully retrieved and processed income entry with ID: %s.", doc_id)
     return inc
 
 @router.post("/", response_model=Income, status_code=status.HTTP_201_CREATED, summary="Create a new income entry")
-async def create_income_api(income: Income, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)) -> Income:
+async def create_income_api(income: Income, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)) -> Income:
     """
     Creates a new income entry in the database.
     """
-    logger.info(f"Attempting to create a new income entry: {income.dict()}")
+    logger.info("Attempting to create a new income entry: %s", income.dict())
     income_data = income.dict(exclude_unset=True)
     if 'daily_total_eur' in income_data:
         del income_data['daily_total_eur']
 
-    new_income = database.add_income(db, income=income)
+    new_income = await async_database.add_income(db, income=income)
     
     if new_income:
         tours_revenue = new_income.tours_revenue_eur if new_income.tours_revenue_eur is not None else 0.0
         transfers_revenue = new_income.transfers_revenue_eur if new_income.transfers_revenue_eur is not None else 0.0
         new_income.daily_total_eur = tours_revenue + transfers_revenue
     
-    logger.info(f"Income entry created successfully with ID: {new_income.doc_id}")
+    logger.info("Income entry created successfully with ID: %s", new_income.doc_id)
     return new_income
 
 
 @router.put("/{doc_id}", response_model=Income, summary="Update an existing income entry")
-async def update_income_api(doc_id: int, income: Income, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)) -> Income:
+async def update_income_api(doc_id: int, income: Income, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)) -> Income:
     """
     Updates an existing income entry identified by its document ID.
     Raises a 404 error if the income is not found.
     """
-    logger.info(f"Attempting to update income entry with ID: {doc_id} with data: {income.dict()}")
+    logger.info("Attempting to update income entry with ID: %s with data: %s", doc_id, income.dict())
     
     updates = income.dict(exclude_unset=True)
     if 'daily_total_eur' in updates:
         del updates['daily_total_eur']
 
-    success = database.update_income(db, doc_id, updates)
+    try:
+        success = await async_database.update_income(db, doc_id, updates)
+    except ValueError as e:
+        # Raised before anything is written: an unknown field or a value the model rejects.
+        logger.warning("Invalid update for income entry with ID %s: %s", doc_id, e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid update: {e}")
     if not success:
-        logger.warning(f"Income entry with ID {doc_id} not found or update failed.")
+        logger.warning("Income entry with ID %s not found or update failed.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Income entry with ID {doc_id} not found or update failed.")
     
-    updated_income = database.get_income_by_id(db, doc_id)
+    updated_income = await async_database.get_income_by_id(db, doc_id)
     if not updated_income:
-        logger.error(f"Failed to retrieve updated income entry with ID {doc_id} after successful update operation.")
+        logger.error("Failed to retrieve updated income entry with ID %s after successful update operation.", doc_id)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve updated income entry.")
     
     tours_revenue = updated_income.tours_revenue_eur if updated_income.tours_revenue_eur is not None else 0.0
     transfers_revenue = updated_income.transfers_revenue_eur if updated_income.transfers_revenue_eur is not None else 0.0
     updated_income.daily_total_eur = tours_revenue + transfers_revenue
     
-    logger.info(f"Income entry with ID {doc_id} updated successfully.")
+    logger.info("Income entry with ID %s updated successfully.", doc_id)
     return updated_income
 
 @router.delete("/{doc_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete an income entry by ID")
-async def delete_income_api(doc_id: int, db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def delete_income_api(doc_id: int, db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)):
     """
     Deletes an income entry by its document ID.
     """
-    logger.info(f"Attempting to delete income entry with ID: {doc_id}")
-    success = database.delete_income(db, doc_id)
+    logger.info("Attempting to delete income entry with ID: %s", doc_id)
+    success = await async_database.delete_income(db, doc_id)
     if not success:
-        logger.warning(f"Income entry with ID {doc_id} not found or deletion failed.")
+        logger.warning("Income entry with ID %s not found or deletion failed.", doc_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Income entry with ID {doc_id} not found or deletion failed.")
-    logger.info(f"Income entry with ID {doc_id} deleted successfully.")
\ No newline at end of file
+    logger.info("Income entry with ID %s deleted successfully.", doc_id)
\ No newline at end of file
@@ -0,0 +1,58 @@
+# app/api/routers/internal.py
+from fastapi import APIRouter, Depends, Query
+from typing import Dict, Any
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import database, async_database
+from app.database import get_async_db
+from app.summary_cache import summary_cache
+from app.api.auth_utils import get_current_user, token_cache
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+)
+
+@router.get("/pool-stats", summary="Get live database connection pool statistics")
+async def get_pool_stats_api(current_user: dict = Depends(get_current_user)) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieves connection pool occupancy (checked out, overflow) and checkout
+    wait times for the sync and async database engines.
+    """
+    logger.info("Request for connection pool statistics.")
+    return database.get_connection_pool_stats()
+
+@router.get("/cache-stats", summary="Get summary cache statistics")
+async def get_cache_stats_api(current_user: dict = Depends(get_current_user)) -> Dict[str, Any]:
+    """
+    Retrieves hit, miss, eviction and invalidation counters of the in-process
+    summary cache.
+    """
+    logger.info("Request for summary cache statistics.")
+    return summary_cache.stats()
+
+@router.get("/token-cache-stats", summary="Get verified-token cache statistics")
+async def get_token_cache_stats_api(current_user: dict = Depends(get_current_user)) -> Dict[str, Any]:
+    """
+    Retrieves size, hit, miss and expiry counters of the in-process cache of
+    verified access tokens.
+    """
+    logger.info("Request for token cache statistics.")
+    return token_cache.stats()
+
+@router.post("/reconcile-cash", summary="Verify the cash snapshots and balance against the cash ledger")
+async def reconcile_cash_api(
+    full: bool = Query(False, description="Recheck every snapshot, not only those affected by new movements"),
+    repair: bool = Query(False, description="Overwrite wrong snapshots and a drifted balance with the ledger's values"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Checks the monthly cash snapshots and the cash on hand balance against the
+    append-only cash ledger and reports any difference.
+    """
+    logger.info("Request to reconcile the cash ledger (full=%s, repair=%s).", full, repair)
+    return await async_database.reconcile_cash_ledger(db, full=full, repair=repair)
@@ -0,0 +1,43 @@
+# app/api/routers/search.py
+from fastapi import APIRouter, Depends, Response, Query as FastAPIQuery
+from typing import List
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import async_database
+from app.database import get_async_db
+from app.models import SearchHit
+from app.api.auth_utils import get_current_user
+from app.api.http_cache import conditional_get, SEARCH_TABLES
+from app.api.fast_json import fast_json_response
+
+logger = logging.getLogger(__name__)
+
+NEXT_OFFSET_HEADER = "X-Next-Offset"
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"],
+)
+
+@router.get("", response_model=List[SearchHit], dependencies=[Depends(conditional_get(*SEARCH_TABLES))], summary="Full-text search across all entries")
+async def search_entries_api(
+    response: Response,
+    q: str = FastAPIQuery(..., min_length=1, max_length=200, description="Search terms; every term must match a word or word prefix"),
+    limit: int = FastAPIQuery(50, ge=1, le=200, description="Maximum number of hits to return"),
+    offset: int = FastAPIQuery(0, ge=0, description="Number of hits to skip"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+) -> List[SearchHit]:
+    """
+    Searches descriptions, recipients, categories, payment methods, amounts and dates
+    of fixed costs, daily expenses and income entries, best matches first. When more
+    hits follow, the X-Next-Offset response header holds the offset of the next page.
+    """
+    logger.info("Search request for '%s' (limit %s, offset %s).", q, limit, offset)
+    hits = await async_database.search_entries(db, q, limit + 1, offset)
+    if len(hits) > limit:
+        hits = hits[:limit]
+        response.headers[NEXT_OFFSET_HEADER] = str(offset + limit)
+    logger.info("Search for '%s' returned %s hits.", q, len(hits))
+    return fast_json_response(hits, List[SearchHit], response)
@@ -1,14 +1,17 @@
 # app/api/routers/summary.py
-from fastapi import APIRouter, Query as FastAPIQuery, Depends
-from typing import Dict
-from datetime import datetime
+from fastapi import APIRouter, Query as FastAPIQuery, Depends, HTTPException, Response, status
+from typing import Dict, Optional
+from datetime import datetime, date, timedelta
+import calendar
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import database
-from app.database import get_db
-from app.models import CashOnHand
+from app import async_database
+from app.database import get_async_db, CASH_HISTORY_BUCKETS
+from app.models import CashOnHand, CashHistory, DashboardSummary
 from app.api.auth_utils import get_current_user
+from app.api.http_cache import conditional_get, month_period_end, year_period_end, SUMMARY_TABLES, CASH_ON_HAND_TABLES, DASHBOARD_TABLES
+from app.api.fast_json import fast_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -17,56 +20,56 @@ router = APIRouter(
     tags=["Summaries"],
 )
 
-@router.get("/monthly", summary="Get monthly expenses, income, and net profit/loss")
+@router.get("/monthly", dependencies=[Depends(conditional_get(*SUMMARY_TABLES, period_end=month_period_end))], summary="Get monthly expenses, income, and net profit/loss")
 async def get_monthly_summary_api(
     year: int = FastAPIQuery(default=datetime.now().year, description="Year for the summary"),
     month: int = FastAPIQuery(default=datetime.now().month, description="Month for the summary (1-12)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
     Retrieves a summary of total expenses, total income, and net profit/loss for a given month.
     """
-    logger.info(f"Request for monthly summary for {year}-{month:02d}.")
-    summary = database.get_monthly_summary(db, year, month)
-    logger.info(f"Successfully generated monthly summary for {year}-{month:02d}.")
+    logger.info("Request for monthly summary for %s-%02d.", year, month)
+    summary = await async_database.get_monthly_summary(db, year, month)
+    logger.info("Successfully generated monthly summary for %s-%02d.", year, month)
     return summary
 
-@router.get("/expense-categories", summary="Get monthly expenses by category")
+@router.get("/expense-categories", dependencies=[Depends(conditional_get(*SUMMARY_TABLES, period_end=month_period_end))], summary="Get monthly expenses by category")
 async def get_expense_categories_summary_api(
     year: int = FastAPIQuery(default=datetime.now().year, description="Year for the summary"),
     month: int = FastAPIQuery(default=datetime.now().month, description="Month for the summary (1-12)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
     Retrieves a summary of expenses grouped by category for a given month.
     """
-    logger.info(f"Request for expense categories summary for {year}-{month:02d}.")
-    summary = database.get_expense_categories_summary(db, year, month)
-    logger.info(f"Successfully generated expense categories summary for {year}-{month:02d}.")
+    logger.info("Request for expense categories summary for %s-%02d.", year, month)
+    summary = await async_database.get_expense_categories_summary(db, year, month)
+    logger.info("Successfully generated expense categories summary for %s-%02d.", year, month)
     return summary
 
-@router.get("/income-sources", summary="Get monthly income by source")
+@router.get("/income-sources", dependencies=[Depends(conditional_get(*SUMMARY_TABLES, period_end=month_period_end))], summary="Get monthly income by source")
 async def get_income_sources_summary_api(
     year: int = FastAPIQuery(default=datetime.now().year, description="Year for the summary"),
     month: int = FastAPIQuery(default=datetime.now().month, description="Month for the summary (1-12)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
     Retrieves a summary of income grouped by source (Tours, Transfers) for a given month.
     """
-    logger.info(f"Request for income sources summary for {year}-{month:02d}.")
-    summary = database.get_income_sources_summary(db, year, month)
-    logger.info(f"Successfully generated income sources summary for {year}-{month:02d}.")
+    logger.info("Request for income sources summary for %s-%02d.", year, month)
+    summary = await async_database.get_income_sources_summary(db, year, month)
+    logger.info("Successfully generated income sources summary for %s-%02d.", year, month)
     return summary
 
-@router.get("/weekly", summary="Get weekly expenses, income, and net profit/loss")
+@router.get("/weekly", dependencies=[Depends(conditional_get(*SUMMARY_TABLES))], summary="Get weekly expenses, income, and net profit/loss")
 async def get_weekly_summary_api(
     start_date: str = FastAPIQuery(description="Start date for the summary (YYYY-MM-DD)"),
     end_date: str = FastAPIQuery(description="End date for the summary (YYYY-MM-DD)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
@@ -74,16 +77,16 @@ async def get_weekly_summary_api(
     """
     start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
     end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
-    logger.info(f"Request for weekly summary for {start_date} to {end_date}.")
-    summary = database.get_weekly_summary(db, start_date_obj, end_date_obj)
-    logger.info(f"Successfully generated weekly summary for {start_date} to {end_date}.")
+    logger.info("Request for weekly summary for %s to %s.", start_date, end_date)
+    summary = await async_database.get_weekly_summary(db, start_date_obj, end_date_obj)
+    logger.info("Successfully generated weekly summary for %s to %s.", start_date, end_date)
     return summary
 
-@router.get("/weekly-expense-categories", summary="Get weekly expenses by category")
+@router.get("/weekly-expense-categories", dependencies=[Depends(conditional_get(*SUMMARY_TABLES))], summary="Get weekly expenses by category")
 async def get_weekly_expense_categories_summary_api(
     start_date: str = FastAPIQuery(description="Start date for the summary (YYYY-MM-DD)"),
     end_date: str = FastAPIQuery(description="End date for the summary (YYYY-MM-DD)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
@@ -91,16 +94,16 @@ async def get_weekly_expense_categories_summary_api(
     """
     start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
     end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
-    logger.info(f"Request for weekly expense categories summary for {start_date} to {end_date}.")
-    summary = database.get_weekly_expense_categories_summary(db, start_date_obj, end_date_obj)
-    logger.info(f"Successfully generated weekly expense categories summary for {start_date} to {end_date}.")
+    logger.info("Request for weekly expense categories summary for %s to %s.", start_date, end_date)
+    summary = await async_database.get_weekly_expense_categories_summary(db, start_date_obj, end_date_obj)
+    logger.info("Successfully generated weekly expense categories summary for %s to %s.", start_date, end_date)
     return summary
 
-@router.get("/weekly-income-sources", summary="Get weekly income by source")
+@router.get("/weekly-income-sources", dependencies=[Depends(conditional_get(*SUMMARY_TABLES))], summary="Get weekly income by source")
 async def get_weekly_income_sources_summary_api(
     start_date: str = FastAPIQuery(description="Start date for the summary (YYYY-MM-DD)"),
     end_date: str = FastAPIQuery(description="End date for the summary (YYYY-MM-DD)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
@@ -108,57 +111,130 @@ async def get_weekly_income_sources_summary_api(
     """
     start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
     end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
-    logger.info(f"Request for weekly income sources summary for {start_date} to {end_date}.")
-    summary = database.get_weekly_income_sources_summary(db, start_date_obj, end_date_obj)
-    logger.info(f"Successfully generated weekly income sources summary for {start_date} to {end_date}.")
+    logger.info("Request for weekly income sources summary for %s to %s.", start_date, end_date)
+    summary = await async_database.get_weekly_income_sources_summary(db, start_date_obj, end_date_obj)
+    logger.info("Successfully generated weekly income sources summary for %s to %s.", start_date, end_date)
     return summary
 
-@router.get("/yearly", summary="Get yearly expenses, income, and net profit/loss")
+@router.get("/yearly", dependencies=[Depends(conditional_get(*SUMMARY_TABLES, period_end=year_period_end))], summary="Get yearly expenses, income, and net profit/loss")
 async def get_yearly_summary_api(
     year: int = FastAPIQuery(default=datetime.now().year, description="Year for the summary"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
     Retrieves a summary of total expenses, total income, and net profit/loss for a given year.
     """
-    logger.info(f"Request for yearly summary for {year}.")
-    summary = database.get_yearly_summary(db, year)
-    logger.info(f"Successfully generated yearly summary for {year}.")
+    logger.info("Request for yearly summary for %s.", year)
+    summary = await async_database.get_yearly_summary(db, year)
+    logger.info("Successfully generated yearly summary for %s.", year)
     return summary
 
-@router.get("/global", summary="Get global expenses, income, and net profit/loss")
-async def get_global_summary_api(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)) -> Dict[str, float]:
+@router.get("/global", dependencies=[Depends(conditional_get(*SUMMARY_TABLES))], summary="Get global expenses, income, and net profit/loss")
+async def get_global_summary_api(db: AsyncSession = Depends(get_async_db), current_user: dict = Depends(get_current_user)) -> Dict[str, float]:
     """
     Retrieves a summary of total expenses, total income, and net profit/loss across all records.
     """
     logger.info("Request for global summary.")
-    summary = database.get_global_summary(db)
+    summary = await async_database.get_global_summary(db)
     logger.info("Successfully generated global summary.")
     return summary
 
-@router.get("/cash-on-hand", response_model=CashOnHand, summary="Get current cash on hand balance")
-async def get_cash_on_hand_api(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
+@router.get("/cash-on-hand", dependencies=[Depends(conditional_get(*CASH_ON_HAND_TABLES))], response_model=CashOnHand, summary="Get current cash on hand balance")
+async def get_cash_on_hand_api(
+    as_of: Optional[date] = FastAPIQuery(None, description="Return the balance at the end of this day instead (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
     """
-    Retrieves the current cash on hand balance.
+    Retrieves the current cash on hand balance, or with `as_of` the balance at the
+    end of a given day as recorded in the cash ledger.
     """
+    if as_of is not None:
+        logger.info("Request for cash on hand balance as of %s.", as_of)
+        return CashOnHand(balance=await async_database.get_cash_balance_at(db, as_of))
     logger.info("Request for cash on hand balance.")
-    balance = database.get_cash_on_hand_balance(db)
-    logger.info(f"Successfully retrieved cash on hand balance: {balance.balance:.2f}")
+    balance = await async_database.get_cash_on_hand_balance(db)
+    logger.info("Successfully retrieved cash on hand balance: %.2f", balance.balance)
     return balance
 
-@router.get("/daily-income-average", summary="Get daily average income for a given date range (considering days with income)")
+@router.get("/cash-on-hand/history", dependencies=[Depends(conditional_get(*CASH_ON_HAND_TABLES))], response_model=CashHistory, summary="Get cash on hand over time")
+async def get_cash_on_hand_history_api(
+    response: Response,
+    start_date: Optional[date] = FastAPIQuery(None, alias="from", description="First day of the period (YYYY-MM-DD); defaults to one year before 'to'"),
+    end_date: Optional[date] = FastAPIQuery(None, alias="to", description="Last day of the period (YYYY-MM-DD); defaults to today"),
+    bucket: str = FastAPIQuery("day", pattern=f"^({'|'.join(CASH_HISTORY_BUCKETS)})$", description="Bucket size: 'day', 'week' or 'month'"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Retrieves the cash on hand balance curve for a period as compact arrays of bucket
+    start dates, net changes and end-of-bucket balances.
+    """
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=365)
+    if start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="'from' must not be after 'to'.")
+    logger.info("Request for cash on hand history from %s to %s by %s.", start_date, end_date, bucket)
+    history = await async_database.get_cash_history(db, start_date, end_date, bucket)
+    logger.info("Successfully retrieved cash on hand history with %s buckets.", len(history.dates))
+    return fast_json_response(history, CashHistory, response)
+
+@router.get("/daily-income-average", dependencies=[Depends(conditional_get(*SUMMARY_TABLES))], summary="Get daily average income for a given date range (considering days with income)")
 async def get_daily_income_average_api(
     start_date: datetime = FastAPIQuery(..., description="Start date for the period (YYYY-MM-DD)"),
     end_date: datetime = FastAPIQuery(..., description="End date for the period (YYYY-MM-DD)"),
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     current_user: dict = Depends(get_current_user)
 ) -> Dict[str, float]:
     """
     Retrieves the daily average income for a specified date range,
     only counting days where income was recorded.
     """
-    logger.info(f"Request for daily income average from {start_date.date()} to {end_date.date()}.")
-    average_income = database.get_daily_income_average_for_period(db, start_date, end_date)
-    logger.info(f"Successfully generated daily income average: {average_income}.")
-    return {"daily_average_income": average_income}
\ No newline at end of file
+    logger.info("Request for daily income average from %s to %s.", start_date.date(), end_date.date())
+    average_income = await async_database.get_daily_income_average_for_period(db, start_date, end_date)
+    logger.info("Successfully generated daily income average: %s.", average_income)
+    return {"daily_average_income": average_income}
+
+def _same_day_last_month(day: date) -> date:
+    """
+    Returns the same day of the previous month, clamped to that month's last day
+    (e.g. 31 March -> 28/29 February), matching the dashboard comparison buttons.
+    """
+    year, month = (day.year - 1, 12) if day.month == 1 else (day.year, day.month - 1)
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+@router.get("/dashboard", dependencies=[Depends(conditional_get(*DASHBOARD_TABLES))], response_model=DashboardSummary, summary="Get all dashboard figures in a single response")
+async def get_dashboard_summary_api(
+    period: str = FastAPIQuery("month", pattern="^(month|week)$", description="Summary period: 'month' or 'week'"),
+    year: int = FastAPIQuery(default=datetime.now().year, description="Year for a monthly summary"),
+    month: int = FastAPIQuery(default=datetime.now().month, ge=1, le=12, description="Month for a monthly summary (1-12)"),
+    start_date: Optional[date] = FastAPIQuery(None, description="Start date for a weekly summary (YYYY-MM-DD)"),
+    end_date: Optional[date] = FastAPIQuery(None, description="End date for a weekly summary (YYYY-MM-DD)"),
+    today: Optional[date] = FastAPIQuery(None, description="Client's local date for the daily income comparisons (YYYY-MM-DD)"),
+    recent_limit: int = FastAPIQuery(10, ge=1, le=100, description="Number of recent entries per table"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: dict = Depends(get_current_user)
+) -> DashboardSummary:
+    """
+    Retrieves the period summary, expense categories, income sources, daily income
+    average, cash on hand, global summary, daily income comparisons and the most
+    recent entries in one round trip, replacing the dashboard's individual requests.
+    """
+    if period == "week":
+        if start_date is None or end_date is None:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="start_date and end_date are required for a weekly summary.")
+    else:
+        start_date = date(year, month, 1)
+        end_date = date(year, month, calendar.monthrange(year, month)[1])
+
+    today = today or date.today()
+    comparison_dates = {
+        "today": today,
+        "last_week": today - timedelta(days=7),
+        "last_month": _same_day_last_month(today),
+    }
+    logger.info("Request for dashboard summary (%s) for %s to %s.", period, start_date, end_date)
+    dashboard = await async_database.get_dashboard_summary(db, period, start_date, end_date, comparison_dates, recent_limit)
+    logger.info("Successfully generated dashboard summary (%s) for %s to %s.", period, start_date, end_date)
+    return dashboard
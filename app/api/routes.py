@@ -1,30 +1,41 @@
 # app/api/routes.py
 from fastapi import FastAPI, Request, HTTPException, status, Depends, Response
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 import logging
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.exception_handlers import http_exception_handler as default_http_exception_handler
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routers import fixed_costs, daily_expenses, income, summary
-from app.database import get_db, create_all_tables, get_cash_on_hand_balance, set_initial_cash_on_hand
+from app.api.routers import fixed_costs, daily_expenses, income, summary, internal, search, export, imports
+from app.database import create_all_tables, get_cash_on_hand_balance, set_initial_cash_on_hand, ensure_daily_rollup, ensure_search_index, ensure_cash_ledger, take_cash_snapshots, startup_lock
 from app.config import settings
+from app.metrics import MetricsMiddleware, render_metrics
 from app.database import SessionLocal
-from app.api.auth_utils import create_access_token, verify_password, get_password_hash, get_current_user, get_current_user_optional
+from app.api.auth_utils import create_access_token, verify_password_async, get_demo_password_hash, get_current_user, get_current_user_optional
 
 logger = logging.getLogger(__name__)
 
-class ForceHTTPSMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if "x-forwarded-proto" in request.headers and request.headers["x-forwarded-proto"] == "https":
-            request.scope["scheme"] = "https"
-        response = await call_next(request)
-        return response
+class ForceHTTPSMiddleware:
+    """
+    Marks requests forwarded by an HTTPS proxy as https. A plain ASGI middleware:
+    it only rewrites the scope and passes receive/send through untouched.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-proto":
+                    if value == b"https":
+                        scope["scheme"] = "https"
+                    break
+        await self.app(scope, receive, send)
 
 app = FastAPI(
     title="Cash-On-Hand Business Manager Demo API",
@@ -47,6 +58,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added last so it wraps the other middleware and times them too.
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 templates = Jinja2Templates(directory="templates")
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -55,6 +70,10 @@ app.include_router(fixed_costs.router)
 app.include_router(daily_expenses.router)
 app.include_router(income.router)
 app.include_router(summary.router)
+app.include_router(internal.router)
+app.include_router(search.router)
+app.include_router(export.router)
+app.include_router(imports.router)
 
 PROTECTED_HTML_PATHS = [
     "/",
@@ -63,22 +82,38 @@ PROTECTED_HTML_PATHS = [
     "/data-management"
 ]
 
+def initialize_database():
+    """
+    Creates and upgrades the schema and sets up the derived data (opening balance,
+    rollup, search index, cash ledger and snapshots). Every step is a no-op once
+    done; startup_lock keeps concurrently starting workers from racing through them.
+    """
+    with startup_lock():
+        create_all_tables()
+        db_session = SessionLocal()
+        try:
+            initial_balance = get_cash_on_hand_balance(db_session)
+            if initial_balance is None:
+                set_initial_cash_on_hand(db_session, 1000.00)
+                logger.info("Initial cash on hand balance set to 1000.00 EUR.")
+            else:
+                logger.info("Cash on hand balance already exists: %.2f EUR.", initial_balance.balance)
+            ensure_daily_rollup(db_session)
+            ensure_search_index(db_session)
+            ensure_cash_ledger(db_session)
+            take_cash_snapshots(db_session)
+        finally:
+            db_session.close()
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("Application startup event triggered.")
-    create_all_tables()
-    logger.info(f"FastAPI is starting with APP_ENV: {settings.APP_ENV}")
-
-    db_session = SessionLocal()
-    try:
-        initial_balance = get_cash_on_hand_balance(db_session)
-        if initial_balance is None:
-            set_initial_cash_on_hand(db_session, 1000.00)
-            logger.info("Initial cash on hand balance set to 1000.00 EUR.")
-        else:
-            logger.info(f"Cash on hand balance already exists: {initial_balance.balance:.2f} EUR.")
-    finally:
-        db_session.close()
+    logger.info("FastAPI is starting with APP_ENV: %s", settings.APP_ENV)
+    # Hash the demo password now rather than on the first login.
+    get_demo_password_hash()
+    # app.server initialises the database itself before forking workers.
+    if settings.DATABASE_INIT_ON_STARTUP:
+        initialize_database()
 
 # --- HTML Endpoints ---
 @app.exception_handler(HTTPException)
@@ -86,7 +121,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     if exc.status_code == status.HTTP_401_UNAUTHORIZED and request.url.path in PROTECTED_HTML_PATHS:
         logger.warning("Unauthorized access to root path, redirecting to login.")
         return RedirectResponse(url="/login", status_code=status.HTTP_302_FOUND)
-    return exc
+    return await default_http_exception_handler(request, exc)
 
 @app.get("/login", response_class=HTMLResponse, summary="Serve the login page")
 async def login_page(request: Request):
@@ -94,22 +129,22 @@ async def login_page(request: Request):
     return templates.TemplateResponse("login.html", {"request": request, "datetime": datetime})
 
 @app.get("/", response_class=HTMLResponse, summary="Serve the main dashboard HTML page")
-async def read_root(request: Request, db: Session = Depends(get_db), user = Depends(get_current_user)):
+async def read_root(request: Request, user = Depends(get_current_user)):
     logger.info("Serving dashboard_content.html")
     return templates.TemplateResponse("dashboard_content.html", {"request": request, "datetime": datetime})
 
 @app.get("/register-expenses", response_class=HTMLResponse, summary="Serve the expense registration page")
-async def register_expenses_page(request: Request, db: Session = Depends(get_db), user = Depends(get_current_user)):
+async def register_expenses_page(request: Request, user = Depends(get_current_user)):
     logger.info("Serving register_expenses.html")
     return templates.TemplateResponse("register_expenses.html", {"request": request, "datetime": datetime})
 
 @app.get("/register-income", response_class=HTMLResponse, summary="Serve the income registration page")
-async def register_income_page(request: Request, db: Session = Depends(get_db), user = Depends(get_current_user)):
+async def register_income_page(request: Request, user = Depends(get_current_user)):
     logger.info("Serving register_income.html")
     return templates.TemplateResponse("register_income.html", {"request": request, "datetime": datetime})
 
 @app.get("/data-management", response_class=HTMLResponse, summary="Serve the data management page")
-async def data_management_page(request: Request, db: Session = Depends(get_db), user = Depends(get_current_user)):
+async def data_management_page(request: Request, user = Depends(get_current_user)):
     logger.info("Serving data_management.html")
     return templates.TemplateResponse("data_management.html", {"request": request, "datetime": datetime})
 
@@ -118,6 +153,16 @@ async def health_check():
     logger.info("Health check endpoint accessed.")
     return {"status": "ok"}
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics_endpoint():
+    """
+    Request latency, response size and SQL timing metrics in the Prometheus text
+    exposition format.
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/session_check", summary="Existing session check endpoint")
 async def session_check_endpoint(user = Depends(get_current_user_optional)):
     if user:
@@ -130,11 +175,12 @@ async def session_check_endpoint(user = Depends(get_current_user_optional)):
 # --- Authentication Endpoint ---
 @app.post("/login/token")
 async def login(response: Response, form_data: OAuth2PasswordRequestForm = Depends()):
-    hashed_password_from_db = get_password_hash(settings.DEMO_PASSWORD)
+    hashed_password_from_db = get_demo_password_hash()
     
     if (
-        form_data.username == settings.DEMO_USERNAME
-        and verify_password(form_data.password, hashed_password_from_db)
+        hashed_password_from_db is not None
+        and form_data.username == settings.DEMO_USERNAME
+        and await verify_password_async(form_data.password, hashed_password_from_db)
     ):
         access_token = create_access_token(
             data={"sub": form_data.username}
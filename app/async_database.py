@@ -0,0 +1,74 @@
+# app/async_database.py
+# Async variants of the app.database functions for use from `async def` routes.
+#
+# The query logic stays in app.database; each variant runs it through
+# AsyncSession.run_sync, so the driver I/O is awaited on the asyncio engine
+# (aiosqlite / asyncpg) instead of blocking the event loop.
+
+from functools import wraps
+from typing import Any, Callable, Awaitable, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import database
+
+T = TypeVar("T")
+
+def _async_variant(sync_fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Wraps a `fn(db_session, *args)` function from app.database so it can be
+    awaited with an AsyncSession.
+    """
+    @wraps(sync_fn)
+    async def wrapper(db_session: AsyncSession, *args: Any, **kwargs: Any) -> T:
+        return await db_session.run_sync(sync_fn, *args, **kwargs)
+    return wrapper
+
+get_cash_on_hand_balance = _async_variant(database.get_cash_on_hand_balance)
+update_cash_on_hand_balance = _async_variant(database.update_cash_on_hand_balance)
+set_initial_cash_on_hand = _async_variant(database.set_initial_cash_on_hand)
+clear_all_entries = _async_variant(database.clear_all_entries)
+get_cash_balance_at = _async_variant(database.get_cash_balance_at)
+reconcile_cash_ledger = _async_variant(database.reconcile_cash_ledger)
+get_cash_history = _async_variant(database.get_cash_history)
+
+add_fixed_cost = _async_variant(database.add_fixed_cost)
+get_all_fixed_costs = _async_variant(database.get_all_fixed_costs)
+get_fixed_cost_by_id = _async_variant(database.get_fixed_cost_by_id)
+update_fixed_cost = _async_variant(database.update_fixed_cost)
+delete_fixed_cost = _async_variant(database.delete_fixed_cost)
+get_fixed_costs_by_date_range = _async_variant(database.get_fixed_costs_by_date_range)
+get_fixed_costs_page = _async_variant(database.get_fixed_costs_page)
+
+add_daily_expense = _async_variant(database.add_daily_expense)
+get_all_daily_expenses = _async_variant(database.get_all_daily_expenses)
+get_daily_expense_by_id = _async_variant(database.get_daily_expense_by_id)
+update_daily_expense = _async_variant(database.update_daily_expense)
+delete_daily_expense = _async_variant(database.delete_daily_expense)
+get_daily_expenses_by_date_range = _async_variant(database.get_daily_expenses_by_date_range)
+get_daily_expenses_page = _async_variant(database.get_daily_expenses_page)
+
+add_income = _async_variant(database.add_income)
+get_all_income = _async_variant(database.get_all_income)
+get_income_by_id = _async_variant(database.get_income_by_id)
+update_income = _async_variant(database.update_income)
+delete_income = _async_variant(database.delete_income)
+get_income_by_date_range = _async_variant(database.get_income_by_date_range)
+get_income_page = _async_variant(database.get_income_page)
+get_aggregated_income_by_date = _async_variant(database.get_aggregated_income_by_date)
+get_single_day_income_summary = _async_variant(database.get_single_day_income_summary)
+
+get_monthly_summary = _async_variant(database.get_monthly_summary)
+get_expense_categories_summary = _async_variant(database.get_expense_categories_summary)
+get_income_sources_summary = _async_variant(database.get_income_sources_summary)
+get_weekly_summary = _async_variant(database.get_weekly_summary)
+get_weekly_expense_categories_summary = _async_variant(database.get_weekly_expense_categories_summary)
+get_weekly_income_sources_summary = _async_variant(database.get_weekly_income_sources_summary)
+get_daily_income_average_for_period = _async_variant(database.get_daily_income_average_for_period)
+get_yearly_summary = _async_variant(database.get_yearly_summary)
+get_global_summary = _async_variant(database.get_global_summary)
+get_dashboard_summary = _async_variant(database.get_dashboard_summary)
+rebuild_daily_rollup = _async_variant(database.rebuild_daily_rollup)
+get_table_versions = _async_variant(database.get_table_versions)
+search_entries = _async_variant(database.search_entries)
+import_entries = _async_variant(database.import_entries)
+bulk_insert_rows = _async_variant(database.bulk_insert_rows)
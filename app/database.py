@@ -1,27 +1,64 @@
 # app/database.py
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Enum as SQLEnum, func, and_, not_, distinct, cast, Date
-from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy import create_engine, Column, Integer, BigInteger, String, Float, DateTime, Enum as SQLEnum, func, and_, not_, Date, Index, inspect, text, select, insert, event, tuple_, cast, Numeric, type_coerce
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from datetime import datetime, timedelta, date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Iterable
 from collections import defaultdict
+from contextlib import contextmanager
+from enum import Enum
+import io
 import logging
+import os
+import socket
+import threading
+import time
 
-from .models import FixedCost, DailyExpense, Income, CostFrequency, ExpenseCategory, CashOnHand, PaymentMethod, AggregatedIncome
+from pydantic import TypeAdapter, ValidationError
+
+from .models import FixedCost, DailyExpense, Income, CostFrequency, ExpenseCategory, CashOnHand, PaymentMethod, AggregatedIncome, SearchHit, ImportRowError, ImportResult, CashHistory
 from app.config import settings
+from app.db_pool import get_engine_pool_options, get_pool_stats
+from app.metrics import instrument_engine
+from app.summary_cache import summary_cache, cached_summary
+from app import search_index
 
 logger = logging.getLogger(__name__)
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
 if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, **get_engine_pool_options(SQLALCHEMY_DATABASE_URL))
 else:
-    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, **get_engine_pool_options(SQLALCHEMY_DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _get_async_database_url(database_url: str) -> str:
+    """
+    Maps a synchronous database URL onto the matching asyncio driver
+    (sqlite -> aiosqlite, postgresql -> asyncpg).
+    """
+    scheme, separator, rest = database_url.partition("://")
+    base_scheme = scheme.split("+", 1)[0]
+    if base_scheme == "sqlite":
+        return f"sqlite+aiosqlite{separator}{rest}"
+    if base_scheme in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{separator}{rest}"
+    return database_url
+
+ASYNC_SQLALCHEMY_DATABASE_URL = settings.ASYNC_DATABASE_URL or _get_async_database_url(SQLALCHEMY_DATABASE_URL)
+
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, **get_engine_pool_options(ASYNC_SQLALCHEMY_DATABASE_URL, is_async=True))
+
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+
+AsyncSessionLocal = async_sessionmaker(autoflush=False, bind=async_engine, class_=AsyncSession)
+
 Base = declarative_base()
 
 class DBCashOnHand(Base):
@@ -30,53 +67,540 @@ class DBCashOnHand(Base):
     balance = Column(Float, default=0.0)
     last_updated = Column(DateTime, default=datetime.now)
 
+# Sources of cash movements that do not come from an entry; entry movements use the
+# entry type (SEARCH_TYPE_*) as their source.
+CASH_SOURCE_OPENING_BALANCE = "opening-balance"
+CASH_SOURCE_BALANCE_SET = "balance-set"
+CASH_SOURCE_ADJUSTMENT = "adjustment"
+
+class DBCashMovement(Base):
+    """
+    Append-only ledger of every change to cash on hand, dated with the date of the
+    entry that caused it. The balance at the end of a day is the sum of every
+    movement dated on or before it.
+    """
+    __tablename__ = "cash_movements"
+    __table_args__ = (
+        # Covers the balance and history sums, which read only dates and amounts.
+        Index("ix_cash_movements_date_amount", "movement_date", "amount"),
+    )
+    id = Column(Integer, primary_key=True)
+    movement_date = Column(Date, nullable=False)
+    amount = Column(Float, nullable=False)
+    source = Column(String, nullable=False)
+    entry_id = Column(Integer, nullable=True)
+    recorded_at = Column(DateTime, nullable=False, default=datetime.now)
+
+class DBCashSnapshot(Base):
+    """
+    Cash on hand at the end of a month, so balances are read as the nearest snapshot
+    plus the movements after it. Movements dated on or before a snapshot shift it in
+    the same transaction; reconcile_cash_ledger() verifies snapshots against the ledger.
+    """
+    __tablename__ = "cash_snapshots"
+    snapshot_date = Column(Date, primary_key=True)
+    balance = Column(Float, nullable=False)
+    # Highest ledger ID the snapshot has been checked against.
+    verified_movement_id = Column(Integer, nullable=False, default=0)
+    verified_at = Column(DateTime, nullable=True)
+
 class DBFixedCost(Base):
     __tablename__ = "fixed_costs"
+    __table_args__ = (
+        Index("ix_fixed_costs_cost_date_category", "cost_date", "category"),
+        Index("ix_fixed_costs_keyset", "cost_date", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     amount_eur = Column(Float, nullable=False)
     description = Column(String, nullable=False)
     cost_frequency = Column(SQLEnum(CostFrequency), nullable=False)
     category = Column(SQLEnum(ExpenseCategory), nullable=False)
     recipient = Column(String, nullable=True)
-    cost_date = Column(String, nullable=False)
+    cost_date = Column(Date, nullable=False)
     payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
     timestamp = Column(DateTime, default=datetime.now)
 
 class DBDailyExpense(Base):
     __tablename__ = "daily_expenses"
+    __table_args__ = (
+        Index("ix_daily_expenses_cost_date_category", "cost_date", "category"),
+        Index("ix_daily_expenses_keyset", "cost_date", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     amount = Column(Float, nullable=False)
     description = Column(String, nullable=False)
     category = Column(SQLEnum(ExpenseCategory), nullable=False)
-    cost_date = Column(String, nullable=False)
+    cost_date = Column(Date, nullable=False)
     payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
     timestamp = Column(DateTime, default=datetime.now)
 
 class DBIncome(Base):
     __tablename__ = "income"
+    __table_args__ = (
+        Index("ix_income_income_date", "income_date"),
+        Index("ix_income_keyset", "income_date", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    income_date = Column(String, nullable=False)
+    income_date = Column(Date, nullable=False)
     tours_revenue_eur = Column(Float, nullable=False)
     transfers_revenue_eur = Column(Float, nullable=False)
     hours_worked = Column(Float, nullable=False)
     timestamp = Column(DateTime, default=datetime.now)
 
+# Sources recorded in the daily rollup. Expense rows carry their category and payment
+# method; income rows are split into one row per revenue source.
+ROLLUP_SOURCE_DAILY_EXPENSE = "Daily Expense"
+ROLLUP_SOURCE_FIXED_COST = "Fixed Cost"
+ROLLUP_SOURCE_TOURS = "Tours"
+ROLLUP_SOURCE_TRANSFERS = "Transfers"
+ROLLUP_EXPENSE_SOURCES = (ROLLUP_SOURCE_DAILY_EXPENSE, ROLLUP_SOURCE_FIXED_COST)
+ROLLUP_INCOME_SOURCES = (ROLLUP_SOURCE_TOURS, ROLLUP_SOURCE_TRANSFERS)
+
+class DBDailyRollup(Base):
+    """
+    Per-day totals of every entry table, kept up to date by the add/update/delete
+    functions inside their own transaction, so summaries never re-aggregate raw rows.
+    """
+    __tablename__ = "daily_rollup"
+    rollup_date = Column(Date, primary_key=True)
+    category = Column(String, primary_key=True, default="")
+    payment_method = Column(String, primary_key=True, default="")
+    source = Column(String, primary_key=True)
+    amount = Column(Float, nullable=False, default=0.0)
+    hours_worked = Column(Float, nullable=False, default=0.0)
+    entry_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Lets all-time totals group by source and category without sorting.
+        Index("ix_daily_rollup_source_category", "source", "category"),
+    )
+
+ROLLUP_KEY_COLUMNS = ["rollup_date", "category", "payment_method", "source"]
+
+class DBTableVersion(Base):
+    """
+    Change counter per table, bumped in the same transaction as every write to
+    that table, so HTTP ETags can be built without reading the table itself.
+    """
+    __tablename__ = "table_versions"
+    table_name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+
+class DBCacheInvalidation(Base):
+    """
+    Date ranges written by committed transactions, appended only when several workers
+    serve the API (SERVER_WORKERS > 1). Every worker reads the rows added since its
+    last check and evicts the summaries they cover from its own cache. A range
+    without dates stands for every date.
+    """
+    __tablename__ = "cache_invalidations"
+    id = Column(Integer, primary_key=True)
+    start_date = Column(Date, nullable=True)
+    end_date = Column(Date, nullable=True)
+    origin = Column(String, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+
+def get_connection_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns live pool statistics (checked-out connections, overflow and
+    checkout wait times) for the sync and async engines.
+    """
+    return {
+        "sync": get_pool_stats(engine.pool),
+        "async": get_pool_stats(async_engine.sync_engine.pool),
+    }
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """
+    Yields an AsyncSession for the API routers, so database I/O is awaited
+    instead of blocking the event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
         
-# Helper function to get the appropriate date column expression based on dialect
-def _get_date_column_expression(db_session: Session, column: Column) -> ColumnElement:
+def _to_date(value) -> date:
+    """
+    Normalizes a date, datetime or 'YYYY-MM-DD' string to a date for comparisons against Date columns.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+_DATE_ADAPTER = TypeAdapter(date)
+
+def parse_entry_date(value) -> date:
+    """
+    Strictly parses a date received in an update: a date, a datetime or a 'YYYY-MM-DD'
+    string. Raises ValueError (a pydantic ValidationError) for anything else, such as
+    '2025-03-05xyz', rather than truncating it like _to_date.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return _DATE_ADAPTER.validate_strings(value)
+    raise ValueError(f"Invalid date: {value!r}")
+
+def _enum_value(value) -> str:
+    return value.value if isinstance(value, Enum) else (value or "")
+
+def _rollup_rows_for_fixed_cost(cost) -> List[Dict[str, Any]]:
+    return [{
+        "rollup_date": _to_date(cost.cost_date), "category": _enum_value(cost.category),
+        "payment_method": _enum_value(cost.payment_method), "source": ROLLUP_SOURCE_FIXED_COST,
+        "amount": cost.amount_eur, "hours_worked": 0.0, "entry_count": 1,
+    }]
+
+def _rollup_rows_for_daily_expense(expense) -> List[Dict[str, Any]]:
+    return [{
+        "rollup_date": _to_date(expense.cost_date), "category": _enum_value(expense.category),
+        "payment_method": _enum_value(expense.payment_method), "source": ROLLUP_SOURCE_DAILY_EXPENSE,
+        "amount": expense.amount, "hours_worked": 0.0, "entry_count": 1,
+    }]
+
+def _rollup_rows_for_income(income) -> List[Dict[str, Any]]:
+    income_date = _to_date(income.income_date)
+    return [
+        {"rollup_date": income_date, "category": "", "payment_method": "", "source": ROLLUP_SOURCE_TOURS,
+         "amount": income.tours_revenue_eur, "hours_worked": income.hours_worked, "entry_count": 1},
+        {"rollup_date": income_date, "category": "", "payment_method": "", "source": ROLLUP_SOURCE_TRANSFERS,
+         "amount": income.transfers_revenue_eur, "hours_worked": 0.0, "entry_count": 1},
+    ]
+
+# Dates written in the current transaction; cached summaries covering them are
+# evicted once the transaction commits.
+SUMMARY_CACHE_DATES_KEY = "summary_cache_dates"
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_summary_cache_after_commit(db_session: Session):
+    written_dates = db_session.info.pop(SUMMARY_CACHE_DATES_KEY, None)
+    if written_dates:
+        summary_cache.invalidate_dates(written_dates)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_summary_cache_dates_after_rollback(db_session: Session):
+    db_session.info.pop(SUMMARY_CACHE_DATES_KEY, None)
+
+# Identifies this process's rows in cache_invalidations; its own writes are already
+# evicted by the after_commit hook above.
+CACHE_INVALIDATION_ORIGIN = f"{socket.gethostname()}:{os.getpid()}"
+# Every this many rows, rows older than CACHE_INVALIDATION_RETENTION_SECONDS are deleted.
+CACHE_INVALIDATION_PRUNE_EVERY = 1000
+
+def _record_cache_invalidation(db_session: Session, start_date: Optional[date] = None, end_date: Optional[date] = None):
+    """
+    Tells the other workers, in the caller's transaction, to evict cached summaries
+    covering start_date..end_date (every summary without dates). Runs on the
+    session's connection so the row does not count as a table change for ETags.
+    """
+    if settings.SERVER_WORKERS <= 1:
+        return
+    connection = db_session.connection()
+    result = connection.execute(insert(DBCacheInvalidation.__table__).values(
+        start_date=start_date, end_date=end_date, origin=CACHE_INVALIDATION_ORIGIN, created_at=datetime.now()
+    ))
+    if result.inserted_primary_key[0] % CACHE_INVALIDATION_PRUNE_EVERY == 0:
+        cutoff = datetime.now() - timedelta(seconds=settings.CACHE_INVALIDATION_RETENTION_SECONDS)
+        connection.execute(DBCacheInvalidation.__table__.delete().where(DBCacheInvalidation.created_at < cutoff))
+
+@event.listens_for(Session, "before_commit")
+def _publish_summary_cache_dates_before_commit(db_session: Session):
+    written_dates = db_session.info.get(SUMMARY_CACHE_DATES_KEY)
+    if written_dates:
+        _record_cache_invalidation(db_session, min(written_dates), max(written_dates))
+
+# Rows below the highest ID seen that are read again on every check: IDs come from a
+# sequence, so on PostgreSQL a transaction may commit a lower ID after a higher one.
+CACHE_INVALIDATION_LOOKBACK = 100
+
+class _CacheInvalidationPoller:
+    """
+    Reads the cache_invalidations rows other workers added since the last check
+    and applies them to this process's summary cache. Installed as the cache's
+    sync hook, so it runs before a cached summary is served.
+
+    The lock only guards the bookkeeping, never the query: on the async path the
+    query yields to the event loop, and another request of the same loop waiting
+    for the lock would block it.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_id: Optional[int] = None
+        self._applied_ids: set = set()
+        self._checked_at = 0.0
+
+    def __call__(self, db_session: Session):
+        with self._lock:
+            now = time.monotonic()
+            if self._last_id is not None and now - self._checked_at < settings.SUMMARY_CACHE_SYNC_INTERVAL_SECONDS:
+                return
+            self._checked_at = now
+            last_id = self._last_id
+        if last_id is None:
+            # The cache starts empty, so existing rows count as applied.
+            recent_ids = db_session.execute(
+                select(DBCacheInvalidation.id).order_by(DBCacheInvalidation.id.desc()).limit(CACHE_INVALIDATION_LOOKBACK)
+            ).scalars().all()
+            with self._lock:
+                self._last_id = max([self._last_id or 0, *recent_ids])
+                self._applied_ids.update(recent_ids)
+            return
+        rows = db_session.execute(
+            select(DBCacheInvalidation.id, DBCacheInvalidation.start_date, DBCacheInvalidation.end_date, DBCacheInvalidation.origin)
+            .where(DBCacheInvalidation.id > last_id - CACHE_INVALIDATION_LOOKBACK).order_by(DBCacheInvalidation.id)
+        ).all()
+        with self._lock:
+            new_rows = [row for row in rows if row[0] not in self._applied_ids]
+            if not new_rows:
+                return
+            # Evicting under the lock keeps a concurrent check from serving an entry
+            # whose row is marked applied but not yet evicted.
+            for _, start_date, end_date, origin in new_rows:
+                if origin == CACHE_INVALIDATION_ORIGIN:
+                    continue
+                if start_date is None:
+                    summary_cache.clear()
+                else:
+                    summary_cache.invalidate_range(start_date, end_date)
+            self._last_id = max(self._last_id, rows[-1][0])
+            self._applied_ids.update(row[0] for row in new_rows)
+            self._applied_ids = {applied_id for applied_id in self._applied_ids if applied_id > self._last_id - CACHE_INVALIDATION_LOOKBACK}
+
+if settings.SERVER_WORKERS > 1:
+    summary_cache.sync_hook = _CacheInvalidationPoller()
+
+# Tables written in the current transaction; their versions are bumped right before
+# it commits. Covers objects flushed by the unit of work as well as ORM-enabled
+# insert/update/delete statements (bulk inserts, query.update(), query.delete()).
+CHANGED_TABLES_KEY = "changed_tables"
+
+@event.listens_for(Session, "before_flush")
+def _track_flushed_tables(db_session: Session, flush_context, instances):
+    changed_tables = db_session.info.setdefault(CHANGED_TABLES_KEY, set())
+    for instance in (*db_session.new, *db_session.dirty, *db_session.deleted):
+        changed_tables.add(instance.__tablename__)
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_executed_tables(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info.setdefault(CHANGED_TABLES_KEY, set()).add(orm_execute_state.statement.table.name)
+
+@event.listens_for(Session, "before_commit")
+def _bump_table_versions_before_commit(db_session: Session):
+    db_session.flush()
+    changed_tables = db_session.info.pop(CHANGED_TABLES_KEY, set()) - {DBTableVersion.__tablename__}
+    if not changed_tables:
+        return
+    dialect_insert = postgresql_insert if db_session.bind.dialect.name == "postgresql" else sqlite_insert
+    # A table's first version is the current time in milliseconds rather than 1, so
+    # versions never repeat if the database is recreated.
+    initial_version = int(datetime.now().timestamp() * 1000)
+    for table_name in sorted(changed_tables):
+        statement = dialect_insert(DBTableVersion).values(table_name=table_name, version=initial_version)
+        db_session.execute(statement.on_conflict_do_update(
+            index_elements=["table_name"], set_={"version": DBTableVersion.version + 1}
+        ))
+    db_session.info.pop(CHANGED_TABLES_KEY, None)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_tables_after_rollback(db_session: Session):
+    db_session.info.pop(CHANGED_TABLES_KEY, None)
+
+def get_table_versions(db_session: Session, table_names: List[str]) -> Dict[str, int]:
+    """
+    Returns the change counter of each table; tables never written have version 0.
+    """
+    versions = dict(db_session.execute(
+        select(DBTableVersion.table_name, DBTableVersion.version).where(DBTableVersion.table_name.in_(table_names))
+    ).all())
+    return {table_name: versions.get(table_name, 0) for table_name in table_names}
+
+def _apply_rollup_rows(db_session: Session, rows: List[Dict[str, Any]], sign: int = 1):
+    """
+    Adds (sign=1) or removes (sign=-1) entry contributions to the daily rollup with an
+    upsert, in the caller's transaction. Rows whose last entry was removed are deleted.
+    """
+    dialect_insert = postgresql_insert if db_session.bind.dialect.name == "postgresql" else sqlite_insert
+    db_session.info.setdefault(SUMMARY_CACHE_DATES_KEY, set()).update(row["rollup_date"] for row in rows)
+    for row in rows:
+        values = dict(row, amount=sign * row["amount"], hours_worked=sign * row["hours_worked"], entry_count=sign * row["entry_count"])
+        statement = dialect_insert(DBDailyRollup).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=ROLLUP_KEY_COLUMNS,
+            set_={
+                "amount": DBDailyRollup.amount + statement.excluded.amount,
+                "hours_worked": DBDailyRollup.hours_worked + statement.excluded.hours_worked,
+                "entry_count": DBDailyRollup.entry_count + statement.excluded.entry_count,
+            }
+        )
+        db_session.execute(statement)
+        if sign < 0:
+            db_session.query(DBDailyRollup).filter(
+                *(getattr(DBDailyRollup, key) == row[key] for key in ROLLUP_KEY_COLUMNS),
+                DBDailyRollup.entry_count <= 0
+            ).delete(synchronize_session=False)
+
+def rebuild_daily_rollup(db_session: Session) -> int:
+    """
+    Recomputes the daily rollup from the fixed_costs, daily_expenses and income tables.
+    Used to repair the rollup and to populate it for databases created before it existed.
+    """
+    db_session.query(DBDailyRollup).delete()
+    rows = []
+    for cost_date, category, payment_method, amount, entry_count in db_session.query(
+        DBFixedCost.cost_date, DBFixedCost.category, DBFixedCost.payment_method,
+        func.sum(DBFixedCost.amount_eur), func.count(DBFixedCost.id)
+    ).group_by(DBFixedCost.cost_date, DBFixedCost.category, DBFixedCost.payment_method):
+        rows.append({"rollup_date": cost_date, "category": category.value, "payment_method": payment_method.value,
+                     "source": ROLLUP_SOURCE_FIXED_COST, "amount": amount, "hours_worked": 0.0, "entry_count": entry_count})
+    for cost_date, category, payment_method, amount, entry_count in db_session.query(
+        DBDailyExpense.cost_date, DBDailyExpense.category, DBDailyExpense.payment_method,
+        func.sum(DBDailyExpense.amount), func.count(DBDailyExpense.id)
+    ).group_by(DBDailyExpense.cost_date, DBDailyExpense.category, DBDailyExpense.payment_method):
+        rows.append({"rollup_date": cost_date, "category": category.value, "payment_method": payment_method.value,
+                     "source": ROLLUP_SOURCE_DAILY_EXPENSE, "amount": amount, "hours_worked": 0.0, "entry_count": entry_count})
+    for income_date, tours, transfers, hours_worked, entry_count in db_session.query(
+        DBIncome.income_date, func.sum(DBIncome.tours_revenue_eur), func.sum(DBIncome.transfers_revenue_eur),
+        func.sum(DBIncome.hours_worked), func.count(DBIncome.id)
+    ).group_by(DBIncome.income_date):
+        rows.append({"rollup_date": income_date, "category": "", "payment_method": "", "source": ROLLUP_SOURCE_TOURS,
+                     "amount": tours, "hours_worked": hours_worked, "entry_count": entry_count})
+        rows.append({"rollup_date": income_date, "category": "", "payment_method": "", "source": ROLLUP_SOURCE_TRANSFERS,
+                     "amount": transfers, "hours_worked": 0.0, "entry_count": entry_count})
+    if rows:
+        db_session.execute(insert(DBDailyRollup), rows)
+    _record_cache_invalidation(db_session)
+    db_session.commit()
+    summary_cache.clear()
+    logger.info("Rebuilt daily rollup with %s rows.", len(rows))
+    return len(rows)
+
+def ensure_daily_rollup(db_session: Session):
+    """
+    Populates the daily rollup if it is empty while entries exist, e.g. right after
+    upgrading a database that predates the rollup table.
+    """
+    if db_session.query(DBDailyRollup.rollup_date).first() is not None:
+        return
+    has_entries = any(
+        db_session.query(model.id).first() is not None for model in (DBFixedCost, DBDailyExpense, DBIncome)
+    )
+    if has_entries:
+        logger.info("Daily rollup is empty but entries exist; rebuilding it.")
+        rebuild_daily_rollup(db_session)
+
+# Entry types in search results, named after their API paths. A search document's key
+# is entry_id * SEARCH_KEY_STRIDE + the type's code.
+SEARCH_TYPE_FIXED_COST = "fixed-costs"
+SEARCH_TYPE_DAILY_EXPENSE = "daily-expenses"
+SEARCH_TYPE_INCOME = "income"
+SEARCH_TYPE_CODES = {SEARCH_TYPE_FIXED_COST: 1, SEARCH_TYPE_DAILY_EXPENSE: 2, SEARCH_TYPE_INCOME: 3}
+SEARCH_KEY_STRIDE = 4
+
+def _search_key(entry_type: str, entry_id: int) -> int:
+    return entry_id * SEARCH_KEY_STRIDE + SEARCH_TYPE_CODES[entry_type]
+
+def _search_content(entry_type: str, entry) -> str:
+    """
+    Text indexed for an entry: its description, recipient, category, payment method,
+    frequency, amounts and date.
+    """
+    if entry_type == SEARCH_TYPE_INCOME:
+        parts = [
+            "Income Tours Transfers", f"{entry.tours_revenue_eur:.2f}", f"{entry.transfers_revenue_eur:.2f}",
+            f"{entry.tours_revenue_eur + entry.transfers_revenue_eur:.2f}", _to_date(entry.income_date).isoformat(),
+        ]
+    elif entry_type == SEARCH_TYPE_FIXED_COST:
+        parts = [
+            entry.description, entry.recipient, _enum_value(entry.category), _enum_value(entry.payment_method),
+            _enum_value(entry.cost_frequency), f"{entry.amount_eur:.2f}", _to_date(entry.cost_date).isoformat(),
+        ]
+    else:
+        parts = [
+            entry.description, _enum_value(entry.category), _enum_value(entry.payment_method),
+            f"{entry.amount:.2f}", _to_date(entry.cost_date).isoformat(),
+        ]
+    return " ".join(part for part in parts if part)
+
+def _index_search_entry(db_session: Session, entry_type: str, entry_id: int, entry):
+    entry_date = entry.income_date if entry_type == SEARCH_TYPE_INCOME else entry.cost_date
+    search_index.index_document(db_session, _search_key(entry_type, entry_id), _search_content(entry_type, entry), _to_date(entry_date))
+
+def rebuild_search_index(db_session: Session) -> int:
+    """
+    Recomputes the full-text search index from the fixed_costs, daily_expenses and income tables.
+    """
+    search_index.clear_documents(db_session)
+    document_count = 0
+    for entry_type, model in ((SEARCH_TYPE_FIXED_COST, DBFixedCost), (SEARCH_TYPE_DAILY_EXPENSE, DBDailyExpense), (SEARCH_TYPE_INCOME, DBIncome)):
+        for entry in db_session.query(model).yield_per(1000):
+            _index_search_entry(db_session, entry_type, entry.id, entry)
+            document_count += 1
+    db_session.commit()
+    logger.info("Rebuilt search index with %s documents.", document_count)
+    return document_count
+
+def ensure_search_index(db_session: Session):
+    """
+    Populates the search index if it is empty while entries exist, e.g. right after
+    upgrading a database that predates it.
+    """
+    if search_index.has_documents(db_session):
+        return
+    has_entries = any(
+        db_session.query(model.id).first() is not None for model in (DBFixedCost, DBDailyExpense, DBIncome)
+    )
+    if has_entries:
+        logger.info("Search index is empty but entries exist; rebuilding it.")
+        rebuild_search_index(db_session)
+
+def search_entries(db_session: Session, query: str, limit: int = 50, offset: int = 0) -> List[SearchHit]:
     """
-    Returns the SQLAlchemy expression for a date column, handling dialect differences.
+    Full-text search across fixed costs, daily expenses and income. Every term must
+    match (as a word or word prefix); hits are ordered by relevance, then date.
     """
-    if db_session.bind.dialect.name == 'postgresql':
-        return cast(column, Date)
-    else: # Default to SQLite or other dialects where func.date() works
-        return func.date(column)
+    matches = search_index.match_documents(db_session, query, limit, offset)
+    ids_by_type = defaultdict(list)
+    for doc_key, _ in matches:
+        ids_by_type[doc_key % SEARCH_KEY_STRIDE].append(doc_key // SEARCH_KEY_STRIDE)
+
+    entries = {}
+    for entry_type, model, schema in (
+        (SEARCH_TYPE_FIXED_COST, DBFixedCost, FixedCost),
+        (SEARCH_TYPE_DAILY_EXPENSE, DBDailyExpense, DailyExpense),
+        (SEARCH_TYPE_INCOME, DBIncome, Income),
+    ):
+        ids = ids_by_type.get(SEARCH_TYPE_CODES[entry_type])
+        if ids:
+            for row in db_session.query(model).filter(model.id.in_(ids)):
+                entries[_search_key(entry_type, row.id)] = (entry_type, schema.model_validate(row))
+
+    hits = []
+    for doc_key, score in matches:
+        if doc_key not in entries:
+            continue
+        entry_type, entry = entries[doc_key]
+        if entry_type == SEARCH_TYPE_INCOME:
+            entry.daily_total_eur = entry.tours_revenue_eur + entry.transfers_revenue_eur
+        hits.append(SearchHit(
+            entry_type=entry_type,
+            doc_id=entry.doc_id,
+            entry_date=entry.income_date if entry_type == SEARCH_TYPE_INCOME else entry.cost_date,
+            score=round(score, 6),
+            entry=entry
+        ))
+    logger.info("Search for '%s' returned %s hits (offset %s).", query, len(hits), offset)
+    return hits
 
 def get_cash_on_hand_balance(db_session: Session) -> CashOnHand:
     balance_entry = db_session.query(DBCashOnHand).first()
@@ -88,29 +612,363 @@ def get_cash_on_hand_balance(db_session: Session) -> CashOnHand:
         logger.info("Initialized cash on hand balance to 0.0.")
         # Ensure that the validated model is returned even if it's the newly created one
         return CashOnHand.model_validate(initial_balance_data)
-    logger.debug(f"Retrieved cash on hand balance: {balance_entry.balance}")
+    logger.debug("Retrieved cash on hand balance: %s", balance_entry.balance)
     return CashOnHand.model_validate(balance_entry)
 
-def update_cash_on_hand_balance(db_session: Session, amount: float):
-    current_balance_entry = get_cash_on_hand_balance(db_session)
-    new_balance = current_balance_entry.balance + amount
-    # Corrected: Use current_balance_entry.doc_id instead of .id
-    db_session.query(DBCashOnHand).filter(DBCashOnHand.id == current_balance_entry.doc_id).update(
-        {'balance': round(new_balance, 2), 'last_updated': datetime.now()}
+def _cash_delta(entry_type: str, entry) -> float:
+    """
+    Change to cash on hand caused by one entry: income adds its total, fixed costs
+    and daily expenses paid in cash subtract their amount.
+    """
+    if entry_type == SEARCH_TYPE_INCOME:
+        return entry.tours_revenue_eur + entry.transfers_revenue_eur
+    if entry.payment_method != PaymentMethod.CASH:
+        return 0.0
+    return -(entry.amount_eur if entry_type == SEARCH_TYPE_FIXED_COST else entry.amount)
+
+def _rounded_sum(column, amount: float):
+    # Postgres only rounds NUMERIC, so the float sum is cast before rounding.
+    return func.round(cast(column + amount, Numeric), 2)
+
+def _adjust_cash_on_hand(db_session: Session, amount: float):
+    """
+    Adds an amount to the cash on hand balance in the caller's transaction, with a
+    single `UPDATE ... SET balance = balance + :amount` so concurrent writers cannot
+    lose each other's changes.
+    """
+    updated_count = db_session.query(DBCashOnHand).update(
+        {"balance": _rounded_sum(DBCashOnHand.balance, amount), "last_updated": datetime.now()},
+        synchronize_session=False
+    )
+    if not updated_count:
+        db_session.add(DBCashOnHand(balance=round(amount, 2), last_updated=datetime.now()))
+        db_session.flush()
+
+def _get_entry_for_update(db_session: Session, model, schema, doc_id: int):
+    """
+    Reads an entry that is about to be updated or deleted and locks its row until the
+    transaction ends (SELECT ... FOR UPDATE, where the database supports it), so two
+    concurrent changes to the same entry cannot both reverse its old cash effect.
+    """
+    entry = db_session.query(model).filter(model.id == doc_id).with_for_update().first()
+    return schema.model_validate(entry) if entry else None
+
+# Entry fields an update cannot set: the ID addresses the row, the timestamp is set
+# on every write and Income.daily_total_eur is computed, not stored.
+_READ_ONLY_ENTRY_FIELDS = {"doc_id", "timestamp", "daily_total_eur"}
+
+def _validated_entry_update(schema, old_entry, updates: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Applies updates to an entry read by _get_entry_for_update and validates the result
+    against the API model before anything is written, so an invalid value never reaches
+    the rollup, ledger or cash arithmetic. Read-only fields in updates are ignored.
+    Returns the updated entry and the column values to write; raises ValueError for an
+    unknown field and a pydantic ValidationError (also a ValueError) for an invalid value.
+    """
+    updates = {name: value for name, value in updates.items() if name not in _READ_ONLY_ENTRY_FIELDS}
+    unknown_fields = sorted(set(updates) - set(schema.model_fields))
+    if unknown_fields:
+        raise ValueError(f"Unknown fields: {', '.join(unknown_fields)}")
+    new_entry = schema.model_validate({**old_entry.model_dump(exclude={"doc_id"}), **updates, "timestamp": datetime.now()})
+    new_entry.doc_id = old_entry.doc_id
+    return new_entry, {name: getattr(new_entry, name) for name in [*updates, "timestamp"]}
+
+def _entry_cash_movement(entry_type: str, entry_id: int, entry, sign: int = 1) -> Dict[str, Any]:
+    entry_date = entry.income_date if entry_type == SEARCH_TYPE_INCOME else entry.cost_date
+    return {
+        "movement_date": _to_date(entry_date), "amount": round(sign * _cash_delta(entry_type, entry), 2),
+        "source": entry_type, "entry_id": entry_id,
+    }
+
+def _entry_update_cash_movements(entry_type: str, entry_id: int, old_entry, new_entry) -> List[Dict[str, Any]]:
+    """
+    Movements reversing an entry's old cash effect and applying its new one, merged
+    into a single movement when the entry keeps its date.
+    """
+    reversal = _entry_cash_movement(entry_type, entry_id, old_entry, sign=-1)
+    movement = _entry_cash_movement(entry_type, entry_id, new_entry)
+    if reversal["movement_date"] == movement["movement_date"]:
+        return [dict(movement, amount=round(movement["amount"] + reversal["amount"], 2))]
+    return [reversal, movement]
+
+def _append_cash_movements(db_session: Session, movements: List[Dict[str, Any]]) -> float:
+    """
+    Appends movements (dicts with movement_date, amount, source and entry_id) to the
+    cash ledger in the caller's transaction and shifts the snapshots taken on or after
+    their dates. Returns their total; cash on hand itself is left to the caller.
+    """
+    movements = [movement for movement in movements if movement["amount"]]
+    if not movements:
+        return 0.0
+    recorded_at = datetime.now()
+    db_session.execute(insert(DBCashMovement), [dict(movement, recorded_at=recorded_at) for movement in movements])
+    latest_snapshot_date = db_session.query(func.max(DBCashSnapshot.snapshot_date)).scalar()
+    if latest_snapshot_date is not None:
+        amounts_by_date = defaultdict(float)
+        for movement in movements:
+            if movement["movement_date"] <= latest_snapshot_date:
+                amounts_by_date[movement["movement_date"]] += movement["amount"]
+        for movement_date, amount in sorted(amounts_by_date.items()):
+            db_session.query(DBCashSnapshot).filter(DBCashSnapshot.snapshot_date >= movement_date).update(
+                {"balance": _rounded_sum(DBCashSnapshot.balance, amount)}, synchronize_session=False
+            )
+    return round(sum(movement["amount"] for movement in movements), 2)
+
+def _record_cash_movements(db_session: Session, movements: List[Dict[str, Any]]) -> float:
+    """
+    Appends movements to the cash ledger and adds their total to cash on hand, all in
+    the caller's transaction. Returns the total.
+    """
+    total = _append_cash_movements(db_session, movements)
+    if total:
+        _adjust_cash_on_hand(db_session, total)
+    return total
+
+def get_cash_balance_at(db_session: Session, as_of: Optional[date] = None) -> float:
+    """
+    Cash on hand at the end of a day (or including every movement, without `as_of`),
+    read as the latest snapshot on or before that day plus the movements after it.
+    """
+    snapshot_query = db_session.query(DBCashSnapshot.snapshot_date, DBCashSnapshot.balance)
+    if as_of is not None:
+        snapshot_query = snapshot_query.filter(DBCashSnapshot.snapshot_date <= _to_date(as_of))
+    snapshot = snapshot_query.order_by(DBCashSnapshot.snapshot_date.desc()).first()
+    tail_query = db_session.query(func.sum(DBCashMovement.amount))
+    if snapshot is not None:
+        tail_query = tail_query.filter(DBCashMovement.movement_date > snapshot.snapshot_date)
+    if as_of is not None:
+        tail_query = tail_query.filter(DBCashMovement.movement_date <= _to_date(as_of))
+    return round((snapshot.balance if snapshot else 0.0) + (tail_query.scalar() or 0.0), 2)
+
+CASH_HISTORY_BUCKETS = ("day", "week", "month")
+
+def _cash_history_bucket(bind, bucket: str):
+    """
+    SQL expression for the first day of the bucket containing a movement's date.
+    """
+    movement_date = DBCashMovement.movement_date
+    if bucket == "day":
+        return movement_date
+    if bind.dialect.name == "postgresql":
+        return cast(func.date_trunc(bucket, movement_date), Date)
+    # SQLite: 'weekday 0' moves forward to Sunday (or stays on it), six days back is Monday.
+    modifiers = ("weekday 0", "-6 days") if bucket == "week" else ("start of month",)
+    return type_coerce(func.date(movement_date, *modifiers), Date)
+
+def get_cash_history(db_session: Session, start_date: date, end_date: date, bucket: str = "day") -> CashHistory:
+    """
+    Cash on hand over a period, per day, week or month. The net change per bucket and
+    its running total are computed in one query with a window function
+    (SUM(SUM(amount)) OVER (ORDER BY bucket)) over the cash ledger, on top of the
+    opening balance read from the nearest snapshot.
+    """
+    start_date, end_date = _to_date(start_date), _to_date(end_date)
+    opening_balance = get_cash_balance_at(db_session, start_date - timedelta(days=1))
+    bucket_start = _cash_history_bucket(db_session.bind, bucket).label("bucket_start")
+    net_change = func.sum(DBCashMovement.amount)
+    rows = db_session.execute(
+        select(bucket_start, net_change.label("net_change"), func.sum(net_change).over(order_by=bucket_start).label("running_total"))
+        .where(DBCashMovement.movement_date >= start_date, DBCashMovement.movement_date <= end_date)
+        .group_by(bucket_start)
+        .order_by(bucket_start)
+    ).all()
+    history = CashHistory(
+        bucket=bucket,
+        start_date=start_date,
+        end_date=end_date,
+        opening_balance=opening_balance,
+        closing_balance=round(opening_balance + (rows[-1].running_total if rows else 0.0), 2),
+        dates=[_to_date(row.bucket_start) for row in rows],
+        changes=[round(row.net_change, 2) for row in rows],
+        balances=[round(opening_balance + row.running_total, 2) for row in rows],
     )
+    logger.info("Retrieved cash history from %s to %s in %s %s buckets.", start_date, end_date, len(rows), bucket)
+    return history
+
+def _month_end(day: date) -> date:
+    return _month_date_range(day.year, day.month)[1]
+
+def take_cash_snapshots(db_session: Session) -> int:
+    """
+    Adds a snapshot for the end of every month that has ended since the latest one
+    (or since the first movement). Returns the number of snapshots added.
+    """
+    today = date.today()
+    max_movement_id = db_session.query(func.max(DBCashMovement.id)).scalar() or 0
+    latest = db_session.query(DBCashSnapshot).order_by(DBCashSnapshot.snapshot_date.desc()).first()
+    if latest is not None:
+        previous_date, balance = latest.snapshot_date, latest.balance
+        month_end = _month_end(previous_date + timedelta(days=1))
+    else:
+        first_movement_date = db_session.query(func.min(DBCashMovement.movement_date)).scalar()
+        if first_movement_date is None:
+            return 0
+        previous_date, balance = None, 0.0
+        month_end = _month_end(first_movement_date)
+
+    snapshot_count = 0
+    while month_end < today:
+        movements_query = db_session.query(func.sum(DBCashMovement.amount)).filter(DBCashMovement.movement_date <= month_end)
+        if previous_date is not None:
+            movements_query = movements_query.filter(DBCashMovement.movement_date > previous_date)
+        balance = round(balance + (movements_query.scalar() or 0.0), 2)
+        db_session.add(DBCashSnapshot(
+            snapshot_date=month_end, balance=balance, verified_movement_id=max_movement_id, verified_at=datetime.now()
+        ))
+        previous_date, month_end = month_end, _month_end(month_end + timedelta(days=1))
+        snapshot_count += 1
+    db_session.commit()
+    if snapshot_count:
+        logger.info("Took %s cash snapshots up to %s.", snapshot_count, previous_date)
+    return snapshot_count
+
+def reconcile_cash_ledger(db_session: Session, full: bool = False, repair: bool = False) -> Dict[str, Any]:
+    """
+    Verifies the cash snapshots and the cash on hand balance against the ledger.
+
+    Only snapshots that movements recorded since their last check could affect are
+    recomputed, unless `full` is set. With `repair`, wrong snapshots and a drifted
+    cash on hand balance are overwritten with the values derived from the ledger.
+    """
+    max_movement_id = db_session.query(func.max(DBCashMovement.id)).scalar() or 0
+    snapshots = db_session.query(DBCashSnapshot).order_by(DBCashSnapshot.snapshot_date).all()
+    if full or not snapshots:
+        check_from = None
+    else:
+        verified_movement_id = min(snapshot.verified_movement_id for snapshot in snapshots)
+        check_from = db_session.query(func.min(DBCashMovement.movement_date)).filter(
+            DBCashMovement.id > verified_movement_id
+        ).scalar() or date.max
+
+    # Snapshots before check_from are unaffected by unchecked movements and are trusted.
+    trusted = [snapshot for snapshot in snapshots if check_from is not None and snapshot.snapshot_date < check_from]
+    previous_date, balance = (trusted[-1].snapshot_date, trusted[-1].balance) if trusted else (None, 0.0)
+    mismatches = []
+    checked_count = 0
+    for snapshot in snapshots[len(trusted):]:
+        movements_query = db_session.query(func.sum(DBCashMovement.amount)).filter(DBCashMovement.movement_date <= snapshot.snapshot_date)
+        if previous_date is not None:
+            movements_query = movements_query.filter(DBCashMovement.movement_date > previous_date)
+        balance = round(balance + (movements_query.scalar() or 0.0), 2)
+        checked_count += 1
+        if abs(snapshot.balance - balance) >= 0.005:
+            mismatches.append({"snapshot_date": snapshot.snapshot_date.isoformat(), "recorded": snapshot.balance, "expected": balance})
+            logger.warning("Cash snapshot %s is %.2f, ledger says %.2f.", snapshot.snapshot_date, snapshot.balance, balance)
+            if not repair:
+                previous_date = snapshot.snapshot_date
+                continue
+            snapshot.balance = balance
+        snapshot.verified_movement_id = max_movement_id
+        snapshot.verified_at = datetime.now()
+        previous_date = snapshot.snapshot_date
+
+    tail_query = db_session.query(func.sum(DBCashMovement.amount))
+    if previous_date is not None:
+        tail_query = tail_query.filter(DBCashMovement.movement_date > previous_date)
+    ledger_balance = round(balance + (tail_query.scalar() or 0.0), 2)
+    cash_on_hand = get_cash_on_hand_balance(db_session).balance
+    drift = round(cash_on_hand - ledger_balance, 2)
+    if drift:
+        logger.warning("Cash on hand is %.2f, ledger says %.2f.", cash_on_hand, ledger_balance)
+        if repair:
+            db_session.query(DBCashOnHand).update({"balance": ledger_balance, "last_updated": datetime.now()}, synchronize_session=False)
     db_session.commit()
-    logger.info(f"Cash on hand updated by {amount:.2f}. New balance: {new_balance:.2f}")
+    logger.info("Reconciled cash ledger: %s snapshots checked, %s mismatched, drift %.2f.", checked_count, len(mismatches), drift)
+    return {
+        "movements": max_movement_id,
+        "snapshots": len(snapshots),
+        "snapshots_checked": checked_count,
+        "snapshot_mismatches": mismatches,
+        "ledger_balance": ledger_balance,
+        "cash_on_hand_balance": cash_on_hand,
+        "cash_on_hand_drift": drift,
+        "repaired": repair and bool(mismatches or drift),
+    }
+
+def ensure_cash_ledger(db_session: Session):
+    """
+    Populates the cash ledger for a database that predates it: one movement per cash
+    entry, plus an opening balance movement that makes the ledger add up to the
+    current cash on hand.
+    """
+    if db_session.query(DBCashMovement.id).first() is not None:
+        return
+    entry_sources = ((SEARCH_TYPE_FIXED_COST, DBFixedCost), (SEARCH_TYPE_DAILY_EXPENSE, DBDailyExpense), (SEARCH_TYPE_INCOME, DBIncome))
+    has_entries = any(db_session.query(model.id).first() is not None for _, model in entry_sources)
+    cash_on_hand = get_cash_on_hand_balance(db_session).balance
+    if not has_entries and not cash_on_hand:
+        return
+    logger.info("Cash ledger is empty but cash on hand or entries exist; backfilling it.")
+    entries_total = round(
+        (db_session.query(func.sum(DBIncome.tours_revenue_eur + DBIncome.transfers_revenue_eur)).scalar() or 0.0)
+        - (db_session.query(func.sum(DBFixedCost.amount_eur)).filter(DBFixedCost.payment_method == PaymentMethod.CASH).scalar() or 0.0)
+        - (db_session.query(func.sum(DBDailyExpense.amount)).filter(DBDailyExpense.payment_method == PaymentMethod.CASH).scalar() or 0.0),
+        2
+    )
+    # The opening balance is dated on the first entry's date, or today without entries.
+    first_date = min(
+        db_session.query(func.min(DBFixedCost.cost_date)).scalar() or date.max,
+        db_session.query(func.min(DBDailyExpense.cost_date)).scalar() or date.max,
+        db_session.query(func.min(DBIncome.income_date)).scalar() or date.max,
+        date.today(),
+    )
+    opening_balance = round(cash_on_hand - entries_total, 2)
+    _append_cash_movements(db_session, [{
+        "movement_date": first_date, "amount": opening_balance, "source": CASH_SOURCE_OPENING_BALANCE, "entry_id": None,
+    }])
+    for entry_type, model in entry_sources:
+        batch = []
+        for entry in db_session.query(model).order_by(model.id).yield_per(EXPORT_BATCH_SIZE):
+            batch.append(_entry_cash_movement(entry_type, entry.id, entry))
+            if len(batch) == EXPORT_BATCH_SIZE:
+                _append_cash_movements(db_session, batch)
+                batch = []
+        _append_cash_movements(db_session, batch)
+    db_session.commit()
+
+def update_cash_on_hand_balance(db_session: Session, amount: float):
+    _record_cash_movements(db_session, [{
+        "movement_date": date.today(), "amount": round(amount, 2), "source": CASH_SOURCE_ADJUSTMENT, "entry_id": None,
+    }])
+    db_session.commit()
+    logger.info("Cash on hand updated by %.2f.", amount)
 
 def set_initial_cash_on_hand(db_session: Session, initial_balance: float) -> CashOnHand:
+    # The reset is recorded as the movement that takes the ledger to the new balance.
+    ledger_balance = get_cash_balance_at(db_session)
     db_session.query(DBCashOnHand).delete()
-    db_session.commit()
-    initial_balance_data = DBCashOnHand(balance=round(initial_balance, 2), last_updated=datetime.now())
+    initial_balance_data = DBCashOnHand(balance=ledger_balance, last_updated=datetime.now())
     db_session.add(initial_balance_data)
+    db_session.flush()
+    _record_cash_movements(db_session, [{
+        "movement_date": date.today(), "amount": round(initial_balance - ledger_balance, 2),
+        "source": CASH_SOURCE_BALANCE_SET, "entry_id": None,
+    }])
     db_session.commit()
     db_session.refresh(initial_balance_data)
-    logger.info(f"Initial cash on hand balance set to {initial_balance:.2f}.")
+    logger.info("Initial cash on hand balance set to %.2f.", initial_balance)
     return CashOnHand.model_validate(initial_balance_data)
 
+def clear_all_entries(db_session: Session, initial_balance: float, opening_date: Optional[date] = None):
+    """
+    Deletes every fixed cost, daily expense and income entry together with the rollup,
+    search index, cash ledger and snapshots derived from them, and restarts cash on
+    hand at `initial_balance` with an opening balance movement dated `opening_date`
+    (today by default).
+    """
+    for model in (DBFixedCost, DBDailyExpense, DBIncome, DBDailyRollup, DBCashSnapshot, DBCashMovement, DBCashOnHand):
+        db_session.query(model).delete(synchronize_session=False)
+    search_index.clear_documents(db_session)
+    db_session.add(DBCashOnHand(balance=round(initial_balance, 2), last_updated=datetime.now()))
+    _append_cash_movements(db_session, [{
+        "movement_date": opening_date or date.today(), "amount": round(initial_balance, 2),
+        "source": CASH_SOURCE_OPENING_BALANCE, "entry_id": None,
+    }])
+    _record_cache_invalidation(db_session)
+    db_session.commit()
+    summary_cache.clear()
+    logger.info("Cleared all entries; cash on hand restarted at %.2f.", initial_balance)
+
 def add_fixed_cost(db_session: Session, cost: FixedCost) -> FixedCost:
     db_cost = DBFixedCost(
         amount_eur=cost.amount_eur,
@@ -123,132 +981,77 @@ def add_fixed_cost(db_session: Session, cost: FixedCost) -> FixedCost:
         timestamp=datetime.now()
     )
     db_session.add(db_cost)
+    _apply_rollup_rows(db_session, _rollup_rows_for_fixed_cost(cost))
+    db_session.flush()
+    _index_search_entry(db_session, SEARCH_TYPE_FIXED_COST, db_cost.id, cost)
+    cash_delta = _record_cash_movements(db_session, [_entry_cash_movement(SEARCH_TYPE_FIXED_COST, db_cost.id, cost)])
     db_session.commit()
     db_session.refresh(db_cost)
-    logger.info(f"Added fixed cost: {cost.description} with ID {db_cost.id}")
-    NON_PROFIT_CATEGORIES = {ExpenseCategory.NON_BUSINESS_RELATED, ExpenseCategory.BANK_DEPOSIT}
-    if cost.payment_method == PaymentMethod.CASH and cost.category not in NON_PROFIT_CATEGORIES:
-        update_cash_on_hand_balance(db_session, -cost.amount_eur)
-        logger.info(f"Cash on hand decreased by {cost.amount_eur:.2f} for fixed cost (cash payment, business related).")
-    elif cost.payment_method == PaymentMethod.CASH and cost.category in NON_PROFIT_CATEGORIES:
-        update_cash_on_hand_balance(db_session, -cost.amount_eur)
-        logger.info(f"Cash on hand decreased by {cost.amount_eur:.2f} for fixed cost (cash payment, non-profit related).")
+    logger.info("Added fixed cost: %s with ID %s", cost.description, db_cost.id)
+    if cash_delta:
+        logger.info("Cash on hand decreased by %.2f for fixed cost (cash payment).", cost.amount_eur)
     return FixedCost.model_validate(db_cost)
 
 def get_all_fixed_costs(db_session: Session) -> List[FixedCost]:
     costs = db_session.query(DBFixedCost).all()
-    logger.info(f"Retrieved {len(costs)} fixed costs.")
+    logger.info("Retrieved %s fixed costs.", len(costs))
     return [FixedCost.model_validate(cost) for cost in costs]
 
 def get_fixed_cost_by_id(db_session: Session, doc_id: int) -> Optional[FixedCost]:
     cost = db_session.query(DBFixedCost).filter(DBFixedCost.id == doc_id).first()
     if cost:
-        logger.info(f"Retrieved fixed cost with ID: {doc_id}")
+        logger.info("Retrieved fixed cost with ID: %s", doc_id)
         return FixedCost.model_validate(cost)
-    logger.warning(f"Fixed cost with ID {doc_id} not found.")
+    logger.warning("Fixed cost with ID %s not found.", doc_id)
     return None
 
 def update_fixed_cost(db_session: Session, doc_id: int, updates: Dict[str, Any]) -> bool:
-    old_cost = get_fixed_cost_by_id(db_session, doc_id)
+    old_cost = _get_entry_for_update(db_session, DBFixedCost, FixedCost, doc_id)
     if not old_cost:
-        logger.warning(f"Fixed cost with ID {doc_id} not found for update.")
+        logger.warning("Fixed cost with ID %s not found for update.", doc_id)
         return False
 
-    old_amount = old_cost.amount_eur
-    old_payment_method = old_cost.payment_method
-    old_category = old_cost.category
-
-    if 'cost_frequency' in updates and isinstance(updates['cost_frequency'], str):
-        updates['cost_frequency'] = CostFrequency(updates['cost_frequency'])
-    if 'category' in updates and isinstance(updates['category'], str):
-        updates['category'] = ExpenseCategory(updates['category'])
-    if 'payment_method' in updates and isinstance(updates['payment_method'], str):
-        updates['payment_method'] = PaymentMethod(updates['payment_method'])
-
-    updates['timestamp'] = datetime.now()
+    if 'cost_date' in updates:
+        updates['cost_date'] = parse_entry_date(updates['cost_date'])
+    new_cost, updates = _validated_entry_update(FixedCost, old_cost, updates)
 
+    cash_delta = 0.0
     updated_count = db_session.query(DBFixedCost).filter(DBFixedCost.id == doc_id).update(updates)
+    if updated_count:
+        _apply_rollup_rows(db_session, _rollup_rows_for_fixed_cost(old_cost), sign=-1)
+        _apply_rollup_rows(db_session, _rollup_rows_for_fixed_cost(new_cost))
+        _index_search_entry(db_session, SEARCH_TYPE_FIXED_COST, doc_id, new_cost)
+        # Reverse the old entry's effect on cash and apply the new one's.
+        cash_delta = _record_cash_movements(db_session, _entry_update_cash_movements(SEARCH_TYPE_FIXED_COST, doc_id, old_cost, new_cost))
     db_session.commit()
 
     if updated_count:
-        logger.info(f"Updated fixed cost with ID {doc_id}. Changes: {updates}")
-        new_cost = get_fixed_cost_by_id(db_session, doc_id)
-        new_amount = new_cost.amount_eur
-        new_payment_method = new_cost.payment_method
-        new_category = new_cost.category
-
-        NON_PROFIT_CATEGORIES = {
-            ExpenseCategory.NON_BUSINESS_RELATED,
-            ExpenseCategory.BANK_DEPOSIT
-        }
-
-        old_was_non_profit = old_category in NON_PROFIT_CATEGORIES
-        new_is_non_profit = new_category in NON_PROFIT_CATEGORIES
-
-        if old_was_non_profit == new_is_non_profit:
-            if new_payment_method == PaymentMethod.CASH and old_payment_method != PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, -new_amount)
-                logger.info(f"Fixed cost {doc_id} changed to cash payment. Subtracted {new_amount:.2f} from cash.")
-            elif new_payment_method != PaymentMethod.CASH and old_payment_method == PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, old_amount)
-                logger.info(f"Fixed cost {doc_id} changed from cash payment. Added {old_amount:.2f} back to cash.")
-            elif new_payment_method == PaymentMethod.CASH and old_payment_method == PaymentMethod.CASH:
-                amount_difference = old_amount - new_amount
-                if amount_difference != 0:
-                    update_cash_on_hand_balance(db_session, amount_difference)
-                    logger.info(f"Fixed cost {doc_id} (cash payment) amount changed. Adjusted cash by {amount_difference:.2f}.")
-                else:
-                    logger.info(f"Fixed cost {doc_id} (cash payment) amount unchanged. No cash adjustment needed.")
-            else:
-                logger.info(f"Fixed cost {doc_id} payment method not cash, cash on hand not affected by update.")
-
-        elif not old_was_non_profit and new_is_non_profit:
-            if old_payment_method == PaymentMethod.CASH and new_payment_method != PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, old_amount)
-                logger.info(f"Fixed cost {doc_id} (cash payment) changed from business to non-profit, and from cash to non-cash. Added {old_amount:.2f} back to cash.")
-            elif old_payment_method == PaymentMethod.CASH and new_payment_method == PaymentMethod.CASH:
-                amount_difference = old_amount - new_amount
-                if amount_difference != 0:
-                    update_cash_on_hand_balance(db_session, amount_difference)
-                    logger.info(f"Fixed cost {doc_id} changed from business to non-profit, both cash. Adjusted cash by {amount_difference:.2f}.")
-                else:
-                    logger.info(f"Fixed cost {doc_id} changed from business to non-profit, cash payment, no amount change. No cash adjustment.")
-            else:
-                logger.info(f"Fixed cost {doc_id} changed from business to non-profit. No cash movement relevant to this transition.")
-
-        elif old_was_non_profit and not new_is_non_profit:
-            if old_payment_method != PaymentMethod.CASH and new_payment_method == PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, -new_amount)
-                logger.info(f"Fixed cost {doc_id} changed from non-profit to business, and from non-cash to cash. Subtracted {new_amount:.2f} from cash.")
-            elif old_payment_method == PaymentMethod.CASH and new_payment_method == PaymentMethod.CASH:
-                amount_difference = old_amount - new_amount
-                if amount_difference != 0:
-                    update_cash_on_hand_balance(db_session, amount_difference)
-                    logger.info(f"Fixed cost {doc_id} changed from non-profit to business, both cash. Adjusted cash by {amount_difference:.2f}.")
-                else:
-                    logger.info(f"Fixed cost {doc_id} changed from non-profit to business, cash payment, no amount change. No cash adjustment.")
-            else:
-                logger.info(f"Fixed cost {doc_id} changed from non-profit to business. No cash movement relevant to this transition.")
+        logger.info("Updated fixed cost with ID %s. Changes: %s", doc_id, updates)
+        if cash_delta:
+            logger.info("Fixed cost %s update adjusted cash on hand by %.2f.", doc_id, cash_delta)
         return True
-    logger.warning(f"Fixed cost with ID {doc_id} not found for update (should not happen if updated_count is True).")
+    logger.warning("Fixed cost with ID %s not found for update.", doc_id)
     return False
 
 def delete_fixed_cost(db_session: Session, doc_id: int) -> bool:
-    cost_to_delete = get_fixed_cost_by_id(db_session, doc_id)
+    cost_to_delete = _get_entry_for_update(db_session, DBFixedCost, FixedCost, doc_id)
     if not cost_to_delete:
-        logger.warning(f"Fixed cost with ID {doc_id} not found for deletion.")
+        logger.warning("Fixed cost with ID %s not found for deletion.", doc_id)
         return False
 
     deleted_count = db_session.query(DBFixedCost).filter(DBFixedCost.id == doc_id).delete()
+    if deleted_count:
+        _apply_rollup_rows(db_session, _rollup_rows_for_fixed_cost(cost_to_delete), sign=-1)
+        search_index.remove_document(db_session, _search_key(SEARCH_TYPE_FIXED_COST, doc_id))
+        _record_cash_movements(db_session, [_entry_cash_movement(SEARCH_TYPE_FIXED_COST, doc_id, cost_to_delete, sign=-1)])
     db_session.commit()
 
     if deleted_count:
-        logger.info(f"Deleted fixed cost with ID {doc_id}.")
+        logger.info("Deleted fixed cost with ID %s.", doc_id)
         if cost_to_delete.payment_method == PaymentMethod.CASH:
-            update_cash_on_hand_balance(db_session, cost_to_delete.amount_eur)
-            logger.info(f"Cash on hand increased by {cost_to_delete.amount_eur:.2f} due to deletion of cash-paid fixed cost.")
+            logger.info("Cash on hand increased by %.2f due to deletion of cash-paid fixed cost.", cost_to_delete.amount_eur)
         return True
-    logger.warning(f"Fixed cost with ID {doc_id} not found for deletion.")
+    logger.warning("Fixed cost with ID %s not found for deletion.", doc_id)
     return False
 
 def add_daily_expense(db_session: Session, expense: DailyExpense) -> DailyExpense:
@@ -261,130 +1064,77 @@ def add_daily_expense(db_session: Session, expense: DailyExpense) -> DailyExpens
         timestamp=datetime.now()
     )
     db_session.add(db_expense)
+    _apply_rollup_rows(db_session, _rollup_rows_for_daily_expense(expense))
+    db_session.flush()
+    _index_search_entry(db_session, SEARCH_TYPE_DAILY_EXPENSE, db_expense.id, expense)
+    cash_delta = _record_cash_movements(db_session, [_entry_cash_movement(SEARCH_TYPE_DAILY_EXPENSE, db_expense.id, expense)])
     db_session.commit()
     db_session.refresh(db_expense)
-    logger.info(f"Added daily expense: {expense.description} with ID {db_expense.id}")
-    NON_PROFIT_CATEGORIES = {ExpenseCategory.NON_BUSINESS_RELATED, ExpenseCategory.BANK_DEPOSIT}
-    if expense.payment_method == PaymentMethod.CASH and expense.category not in NON_PROFIT_CATEGORIES:
-        update_cash_on_hand_balance(db_session, -expense.amount)
-        logger.info(f"Cash on hand decreased by {expense.amount:.2f} for daily expense (cash payment, business related).")
-    elif expense.payment_method == PaymentMethod.CASH and expense.category in NON_PROFIT_CATEGORIES:
-        update_cash_on_hand_balance(db_session, -expense.amount)
-        logger.info(f"Cash on hand decreased by {expense.amount:.2f} for daily expense (cash payment, non-profit related).")
+    logger.info("Added daily expense: %s with ID %s", expense.description, db_expense.id)
+    if cash_delta:
+        logger.info("Cash on hand decreased by %.2f for daily expense (cash payment).", expense.amount)
     return DailyExpense.model_validate(db_expense)
 
 def get_all_daily_expenses(db_session: Session) -> List[DailyExpense]:
     expenses = db_session.query(DBDailyExpense).all()
-    logger.info(f"Retrieved {len(expenses)} daily expenses.")
+    logger.info("Retrieved %s daily expenses.", len(expenses))
     return [DailyExpense.model_validate(expense) for expense in expenses]
 
 def get_daily_expense_by_id(db_session: Session, doc_id: int) -> Optional[DailyExpense]:
     expense = db_session.query(DBDailyExpense).filter(DBDailyExpense.id == doc_id).first()
     if expense:
-        logger.info(f"Retrieved daily expense with ID: {doc_id}")
+        logger.info("Retrieved daily expense with ID: %s", doc_id)
         return DailyExpense.model_validate(expense)
-    logger.warning(f"Daily expense with ID {doc_id} not found.")
+    logger.warning("Daily expense with ID %s not found.", doc_id)
     return None
 
 def update_daily_expense(db_session: Session, doc_id: int, updates: Dict[str, Any]) -> bool:
-    old_expense = get_daily_expense_by_id(db_session, doc_id)
+    old_expense = _get_entry_for_update(db_session, DBDailyExpense, DailyExpense, doc_id)
     if not old_expense:
-        logger.warning(f"Daily expense with ID {doc_id} not found for update.")
+        logger.warning("Daily expense with ID %s not found for update.", doc_id)
         return False
 
-    old_amount = old_expense.amount
-    old_payment_method = old_expense.payment_method
-    old_category = old_expense.category
-
-    if 'category' in updates and isinstance(updates['category'], str):
-        updates['category'] = ExpenseCategory(updates['category'])
-    if 'payment_method' in updates and isinstance(updates['payment_method'], str):
-        updates['payment_method'] = PaymentMethod(updates['payment_method'])
-
-    updates['timestamp'] = datetime.now()
+    if 'cost_date' in updates:
+        updates['cost_date'] = parse_entry_date(updates['cost_date'])
+    new_expense, updates = _validated_entry_update(DailyExpense, old_expense, updates)
 
+    cash_delta = 0.0
     updated_count = db_session.query(DBDailyExpense).filter(DBDailyExpense.id == doc_id).update(updates)
+    if updated_count:
+        _apply_rollup_rows(db_session, _rollup_rows_for_daily_expense(old_expense), sign=-1)
+        _apply_rollup_rows(db_session, _rollup_rows_for_daily_expense(new_expense))
+        _index_search_entry(db_session, SEARCH_TYPE_DAILY_EXPENSE, doc_id, new_expense)
+        # Reverse the old entry's effect on cash and apply the new one's.
+        cash_delta = _record_cash_movements(db_session, _entry_update_cash_movements(SEARCH_TYPE_DAILY_EXPENSE, doc_id, old_expense, new_expense))
     db_session.commit()
 
     if updated_count:
-        logger.info(f"Updated daily expense with ID {doc_id}. Changes: {updates}")
-        new_expense = get_daily_expense_by_id(db_session, doc_id)
-        new_amount = new_expense.amount
-        new_payment_method = new_expense.payment_method
-        new_category = new_expense.category
-
-        NON_PROFIT_CATEGORIES = {
-            ExpenseCategory.NON_BUSINESS_RELATED,
-            ExpenseCategory.BANK_DEPOSIT
-        }
-
-        old_was_non_profit = old_category in NON_PROFIT_CATEGORIES
-        new_is_non_profit = new_category in NON_PROFIT_CATEGORIES
-
-        if old_was_non_profit == new_is_non_profit:
-            if new_payment_method == PaymentMethod.CASH and old_payment_method != PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, -new_amount)
-                logger.info(f"Daily expense {doc_id} changed to cash payment. Subtracted {new_amount:.2f} from cash.")
-            elif new_payment_method != PaymentMethod.CASH and old_payment_method == PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, old_amount)
-                logger.info(f"Daily expense {doc_id} changed from cash payment. Added {old_amount:.2f} back to cash.")
-            elif new_payment_method == PaymentMethod.CASH and old_payment_method == PaymentMethod.CASH:
-                amount_difference = old_amount - new_amount
-                if amount_difference != 0:
-                    update_cash_on_hand_balance(db_session, amount_difference)
-                    logger.info(f"Daily expense {doc_id} (cash payment) amount changed. Adjusted cash by {amount_difference:.2f}.")
-                else:
-                    logger.info(f"Daily expense {doc_id} (cash payment) amount unchanged. No cash adjustment needed.")
-            else:
-                logger.info(f"Daily expense {doc_id} payment method not cash, cash on hand not affected by update.")
-
-        elif not old_was_non_profit and new_is_non_profit:
-            if old_payment_method == PaymentMethod.CASH and new_payment_method != PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, old_amount)
-                logger.info(f"Daily expense {doc_id} (cash payment) changed from business to non-profit, and from cash to non-cash. Added {old_amount:.2f} back to cash.")
-            elif old_payment_method == PaymentMethod.CASH and new_payment_method == PaymentMethod.CASH:
-                amount_difference = old_amount - new_amount
-                if amount_difference != 0:
-                    update_cash_on_hand_balance(db_session, amount_difference)
-                    logger.info(f"Daily expense {doc_id} changed from business to non-profit, both cash. Adjusted cash by {amount_difference:.2f}.")
-                else:
-                    logger.info(f"Daily expense {doc_id} changed from business to non-profit, cash payment, no amount change. No cash adjustment.")
-            else:
-                logger.info(f"Daily expense {doc_id} changed from business to non-profit. No cash movement relevant to this transition.")
-
-        elif old_was_non_profit and not new_is_non_profit:
-            if old_payment_method != PaymentMethod.CASH and new_payment_method == PaymentMethod.CASH:
-                update_cash_on_hand_balance(db_session, -new_amount)
-                logger.info(f"Daily expense {doc_id} changed from non-profit to business, and from non-cash to cash. Subtracted {new_amount:.2f} from cash.")
-            elif old_payment_method == PaymentMethod.CASH and new_payment_method == PaymentMethod.CASH:
-                amount_difference = old_amount - new_amount
-                if amount_difference != 0:
-                    update_cash_on_hand_balance(db_session, amount_difference)
-                    logger.info(f"Daily expense {doc_id} changed from non-profit to business, both cash. Adjusted cash by {amount_difference:.2f}.")
-                else:
-                    logger.info(f"Daily expense {doc_id} changed from non-profit to business, cash payment, no amount change. No cash adjustment.")
-            else:
-                logger.info(f"Daily expense {doc_id} changed from non-profit to business. No cash movement relevant to this transition.")
+        logger.info("Updated daily expense with ID %s. Changes: %s", doc_id, updates)
+        if cash_delta:
+            logger.info("Daily expense %s update adjusted cash on hand by %.2f.", doc_id, cash_delta)
         return True
-    logger.warning(f"Daily expense with ID {doc_id} not found for update.")
+    logger.warning("Daily expense with ID %s not found for update.", doc_id)
     return False
 
 def delete_daily_expense(db_session: Session, doc_id: int) -> bool:
-    expense_to_delete = get_daily_expense_by_id(db_session, doc_id)
+    expense_to_delete = _get_entry_for_update(db_session, DBDailyExpense, DailyExpense, doc_id)
     if not expense_to_delete:
-        logger.warning(f"Daily expense with ID {doc_id} not found for deletion.")
+        logger.warning("Daily expense with ID %s not found for deletion.", doc_id)
         return False
 
     deleted_count = db_session.query(DBDailyExpense).filter(DBDailyExpense.id == doc_id).delete()
+    if deleted_count:
+        _apply_rollup_rows(db_session, _rollup_rows_for_daily_expense(expense_to_delete), sign=-1)
+        search_index.remove_document(db_session, _search_key(SEARCH_TYPE_DAILY_EXPENSE, doc_id))
+        _record_cash_movements(db_session, [_entry_cash_movement(SEARCH_TYPE_DAILY_EXPENSE, doc_id, expense_to_delete, sign=-1)])
     db_session.commit()
 
     if deleted_count:
-        logger.info(f"Deleted daily expense with ID {doc_id}.")
+        logger.info("Deleted daily expense with ID %s.", doc_id)
         if expense_to_delete.payment_method == PaymentMethod.CASH:
-            update_cash_on_hand_balance(db_session, expense_to_delete.amount)
-            logger.info(f"Cash on hand increased by {expense_to_delete.amount:.2f} due to deletion of cash-paid daily expense.")
+            logger.info("Cash on hand increased by %.2f due to deletion of cash-paid daily expense.", expense_to_delete.amount)
         return True
-    logger.warning(f"Daily expense with ID {doc_id} not found for deletion.")
+    logger.warning("Daily expense with ID %s not found for deletion.", doc_id)
     return False
 
 def add_income(db_session: Session, income: Income) -> Income:
@@ -396,142 +1146,411 @@ def add_income(db_session: Session, income: Income) -> Income:
         timestamp=datetime.now()
     )
     db_session.add(db_income)
+    _apply_rollup_rows(db_session, _rollup_rows_for_income(income))
+    db_session.flush()
+    _index_search_entry(db_session, SEARCH_TYPE_INCOME, db_income.id, income)
+    total_income_amount = _record_cash_movements(db_session, [_entry_cash_movement(SEARCH_TYPE_INCOME, db_income.id, income)])
     db_session.commit()
     db_session.refresh(db_income)
-    logger.info(f"Added income entry: {income.income_date} with ID {db_income.id}")
-    total_income_amount = income.tours_revenue_eur + income.transfers_revenue_eur
-    update_cash_on_hand_balance(db_session, total_income_amount)
-    logger.info(f"Cash on hand increased by {total_income_amount:.2f} for income.")
+    logger.info("Added income entry: %s with ID %s", income.income_date, db_income.id)
+    logger.info("Cash on hand increased by %.2f for income.", total_income_amount)
     return Income.model_validate(db_income)
 
 def get_all_income(db_session: Session) -> List[Income]:
     incomes = db_session.query(DBIncome).all()
-    logger.info(f"Retrieved {len(incomes)} income entries.")
+    logger.info("Retrieved %s income entries.", len(incomes))
     return [Income.model_validate(income) for income in incomes]
 
 def get_income_by_id(db_session: Session, doc_id: int) -> Optional[Income]:
     income = db_session.query(DBIncome).filter(DBIncome.id == doc_id).first()
     if income:
-        logger.info(f"Retrieved income entry with ID: {doc_id}")
+        logger.info("Retrieved income entry with ID: %s", doc_id)
         return Income.model_validate(income)
-    logger.warning(f"Income entry with ID {doc_id} not found.")
+    logger.warning("Income entry with ID %s not found.", doc_id)
     return None
 
 def update_income(db_session: Session, doc_id: int, updates: Dict[str, Any]) -> bool:
-    old_income = get_income_by_id(db_session, doc_id)
+    old_income = _get_entry_for_update(db_session, DBIncome, Income, doc_id)
     if not old_income:
-        logger.warning(f"Income entry with ID {doc_id} not found for update.")
+        logger.warning("Income entry with ID %s not found for update.", doc_id)
         return False
 
-    old_total_income = old_income.tours_revenue_eur + old_income.transfers_revenue_eur
-
-    updates['timestamp'] = datetime.now()
+    if 'income_date' in updates:
+        updates['income_date'] = parse_entry_date(updates['income_date'])
+    new_income, updates = _validated_entry_update(Income, old_income, updates)
 
+    cash_delta = 0.0
     updated_count = db_session.query(DBIncome).filter(DBIncome.id == doc_id).update(updates)
+    if updated_count:
+        _apply_rollup_rows(db_session, _rollup_rows_for_income(old_income), sign=-1)
+        _apply_rollup_rows(db_session, _rollup_rows_for_income(new_income))
+        _index_search_entry(db_session, SEARCH_TYPE_INCOME, doc_id, new_income)
+        # Reverse the old entry's effect on cash and apply the new one's.
+        cash_delta = _record_cash_movements(db_session, _entry_update_cash_movements(SEARCH_TYPE_INCOME, doc_id, old_income, new_income))
     db_session.commit()
 
     if updated_count:
-        logger.info(f"Updated income entry with ID {doc_id}. Changes: {updates}")
-        new_income = get_income_by_id(db_session, doc_id)
-        new_total_income = new_income.tours_revenue_eur + new_income.transfers_revenue_eur
-        amount_difference = new_total_income - old_total_income
-        update_cash_on_hand_balance(db_session, amount_difference)
-        logger.info(f"Income {doc_id} amount changed. Adjusted cash by {amount_difference:.2f}.")
+        logger.info("Updated income entry with ID %s. Changes: %s", doc_id, updates)
+        if cash_delta:
+            logger.info("Income entry %s update adjusted cash on hand by %.2f.", doc_id, cash_delta)
         return True
-    logger.warning(f"Income entry with ID {doc_id} not found for update.")
+    logger.warning("Income entry with ID %s not found for update.", doc_id)
     return False
 
 def delete_income(db_session: Session, doc_id: int) -> bool:
-    income_to_delete = get_income_by_id(db_session, doc_id)
+    income_to_delete = _get_entry_for_update(db_session, DBIncome, Income, doc_id)
     if not income_to_delete:
-        logger.warning(f"Income entry with ID {doc_id} not found for deletion.")
+        logger.warning("Income entry with ID %s not found for deletion.", doc_id)
         return False
 
     deleted_count = db_session.query(DBIncome).filter(DBIncome.id == doc_id).delete()
+    if deleted_count:
+        _apply_rollup_rows(db_session, _rollup_rows_for_income(income_to_delete), sign=-1)
+        search_index.remove_document(db_session, _search_key(SEARCH_TYPE_INCOME, doc_id))
+        _record_cash_movements(db_session, [_entry_cash_movement(SEARCH_TYPE_INCOME, doc_id, income_to_delete, sign=-1)])
     db_session.commit()
 
     if deleted_count:
-        logger.info(f"Deleted income entry with ID {doc_id}.")
-        total_income_amount = income_to_delete.tours_revenue_eur + income_to_delete.transfers_revenue_eur
-        update_cash_on_hand_balance(db_session, -total_income_amount)
-        logger.info(f"Cash on hand decreased by {total_income_amount:.2f} due to deletion of income.")
+        logger.info("Deleted income entry with ID %s.", doc_id)
+        total_income_amount = _cash_delta(SEARCH_TYPE_INCOME, income_to_delete)
+        logger.info("Cash on hand decreased by %.2f due to deletion of income.", total_income_amount)
         return True
-    logger.warning(f"Income entry with ID {doc_id} not found for deletion.")
+    logger.warning("Income entry with ID %s not found for deletion.", doc_id)
     return False
 
-def get_daily_expenses_by_date_range(db_session: Session, start_date: str, end_date: str) -> List[DailyExpense]:
+def get_daily_expenses_by_date_range(db_session: Session, start_date: date, end_date: date) -> List[DailyExpense]:
     expenses = db_session.query(DBDailyExpense).filter(
-        and_(DBDailyExpense.cost_date >= start_date, DBDailyExpense.cost_date <= end_date)
+        and_(DBDailyExpense.cost_date >= _to_date(start_date), DBDailyExpense.cost_date <= _to_date(end_date))
     ).all()
-    logger.info(f"Retrieved {len(expenses)} daily expenses between {start_date} and {end_date}.")
+    logger.info("Retrieved %s daily expenses between %s and %s.", len(expenses), start_date, end_date)
     return [DailyExpense.model_validate(exp) for exp in expenses]
 
-def get_fixed_costs_by_date_range(db_session: Session, start_date: str, end_date: str) -> List[FixedCost]:
+def get_fixed_costs_by_date_range(db_session: Session, start_date: date, end_date: date) -> List[FixedCost]:
     costs = db_session.query(DBFixedCost).filter(
-        and_(DBFixedCost.cost_date >= start_date, DBFixedCost.cost_date <= end_date)
+        and_(DBFixedCost.cost_date >= _to_date(start_date), DBFixedCost.cost_date <= _to_date(end_date))
     ).all()
-    logger.info(f"Retrieved {len(costs)} fixed costs between {start_date} and {end_date}.")
+    logger.info("Retrieved %s fixed costs between %s and %s.", len(costs), start_date, end_date)
     return [FixedCost.model_validate(cost) for cost in costs]
 
-def get_income_by_date_range(db_session: Session, start_date: str, end_date: str) -> List[Income]:
+def get_income_by_date_range(db_session: Session, start_date: date, end_date: date) -> List[Income]:
     incomes = db_session.query(DBIncome).filter(
-        and_(DBIncome.income_date >= start_date, DBIncome.income_date <= end_date)
+        and_(DBIncome.income_date >= _to_date(start_date), DBIncome.income_date <= _to_date(end_date))
     ).all()
-    logger.info(f"Retrieved {len(incomes)} income entries between {start_date} and {end_date}.")
+    logger.info("Retrieved %s income entries between %s and %s.", len(incomes), start_date, end_date)
     return [Income.model_validate(inc) for inc in incomes]
 
-def get_aggregated_income_by_date(db_session: Session) -> List[AggregatedIncome]:
+def _keyset_page(query, date_column, id_column, start_date: Optional[date], end_date: Optional[date],
+                 after: Optional[Tuple[date, int]], descending: bool, limit: Optional[int]):
+    """
+    Applies an optional inclusive date range, a (date, id) keyset position and a
+    (date, id) ordering to a query. `after` is the key of the last row of the
+    previous page; rows are read through the (date, id) index, so the cost of a
+    page does not depend on how deep into the history it is.
+    """
+    if start_date is not None:
+        query = query.filter(date_column >= _to_date(start_date))
+    if end_date is not None:
+        query = query.filter(date_column <= _to_date(end_date))
+    if after is not None:
+        after_key = tuple_(date_column, id_column)
+        after_value = tuple_(_to_date(after[0]), after[1])
+        query = query.filter(after_key < after_value if descending else after_key > after_value)
+    if descending:
+        query = query.order_by(date_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(date_column.asc(), id_column.asc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+# Read-only projections for the list endpoints: only the columns the API returns,
+# labelled with the API field names and in the order of the API models. Rows are
+# returned as plain dicts, without ORM entities or pydantic validation, and
+# serialized by app.api.fast_json.
+FIXED_COST_ROW_COLUMNS = (
+    DBFixedCost.id.label("doc_id"), DBFixedCost.amount_eur, DBFixedCost.description, DBFixedCost.cost_frequency,
+    DBFixedCost.category, DBFixedCost.recipient, DBFixedCost.cost_date, DBFixedCost.payment_method, DBFixedCost.timestamp,
+)
+DAILY_EXPENSE_ROW_COLUMNS = (
+    DBDailyExpense.id.label("doc_id"), DBDailyExpense.amount, DBDailyExpense.description, DBDailyExpense.category,
+    DBDailyExpense.cost_date, DBDailyExpense.payment_method, DBDailyExpense.timestamp,
+)
+INCOME_ROW_COLUMNS = (
+    DBIncome.id.label("doc_id"), DBIncome.income_date, DBIncome.tours_revenue_eur, DBIncome.transfers_revenue_eur,
+    (DBIncome.tours_revenue_eur + DBIncome.transfers_revenue_eur).label("daily_total_eur"),
+    DBIncome.hours_worked, DBIncome.timestamp,
+)
+
+def _row_dicts(db_session: Session, statement) -> List[Dict[str, Any]]:
+    result = db_session.execute(statement)
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+def get_daily_expenses_page(db_session: Session, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                            after: Optional[Tuple[date, int]] = None, descending: bool = True,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    expenses = _row_dicts(db_session, _keyset_page(
+        select(*DAILY_EXPENSE_ROW_COLUMNS), DBDailyExpense.cost_date, DBDailyExpense.id,
+        start_date, end_date, after, descending, limit
+    ))
+    logger.info("Retrieved page of %s daily expenses (%s to %s, after %s).", len(expenses), start_date, end_date, after)
+    return expenses
+
+def get_fixed_costs_page(db_session: Session, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                         after: Optional[Tuple[date, int]] = None, descending: bool = True,
+                         limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    costs = _row_dicts(db_session, _keyset_page(
+        select(*FIXED_COST_ROW_COLUMNS), DBFixedCost.cost_date, DBFixedCost.id,
+        start_date, end_date, after, descending, limit
+    ))
+    logger.info("Retrieved page of %s fixed costs (%s to %s, after %s).", len(costs), start_date, end_date, after)
+    return costs
+
+def get_income_page(db_session: Session, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                    after: Optional[Tuple[date, int]] = None, descending: bool = True,
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    incomes = _row_dicts(db_session, _keyset_page(
+        select(*INCOME_ROW_COLUMNS), DBIncome.income_date, DBIncome.id,
+        start_date, end_date, after, descending, limit
+    ))
+    logger.info("Retrieved page of %s income entries (%s to %s, after %s).", len(incomes), start_date, end_date, after)
+    return incomes
+
+# Tables that can be exported, by API path name, with the date column they are filtered on.
+EXPORT_TABLES = {
+    "fixed-costs": (DBFixedCost, DBFixedCost.cost_date),
+    "daily-expenses": (DBDailyExpense, DBDailyExpense.cost_date),
+    "income": (DBIncome, DBIncome.income_date),
+}
+EXPORT_BATCH_SIZE = 1000
+
+def get_export_statement(table_name: str, start_date: Optional[date] = None, end_date: Optional[date] = None):
+    """
+    Builds the SELECT for a table export: every column (the primary key labelled
+    doc_id, as in the API models), ordered by date and ID, fetched from a
+    server-side cursor in batches of EXPORT_BATCH_SIZE rows.
+    """
+    model, date_column = EXPORT_TABLES[table_name]
+    columns = [column.label("doc_id") if column.primary_key else column for column in model.__table__.columns]
+    statement = select(*columns)
+    if start_date is not None:
+        statement = statement.where(date_column >= _to_date(start_date))
+    if end_date is not None:
+        statement = statement.where(date_column <= _to_date(end_date))
+    return statement.order_by(date_column, model.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+# Tables that can be imported from CSV, by API path name: the table's model, its API
+# model (which validates the rows) and the function computing its rollup rows.
+IMPORT_TABLES = {
+    SEARCH_TYPE_FIXED_COST: (DBFixedCost, FixedCost, _rollup_rows_for_fixed_cost),
+    SEARCH_TYPE_DAILY_EXPENSE: (DBDailyExpense, DailyExpense, _rollup_rows_for_daily_expense),
+    SEARCH_TYPE_INCOME: (DBIncome, Income, _rollup_rows_for_income),
+}
+IMPORT_BATCH_SIZE = 500
+MAX_IMPORT_ERRORS = 100
+
+def _copy_value(value) -> str:
+    # PostgreSQL COPY text format; enum columns store the member name, as SQLEnum does.
+    if value is None:
+        return "\\N"
+    if isinstance(value, Enum):
+        value = value.name
+    elif isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+def bulk_insert_rows(db_session: Session, model, rows: List[Dict[str, Any]]):
+    """
+    Inserts rows (dicts with the same column keys, primary keys optional) into a table
+    in the caller's transaction: with COPY on PostgreSQL (psycopg2), otherwise with a
+    single executemany. The rollup, search index and cash ledger are left to the caller.
+    """
+    if not rows:
+        return
+    dialect = db_session.bind.dialect
+    if (dialect.name, dialect.driver) != ("postgresql", "psycopg2"):
+        db_session.execute(insert(model), rows)
+        return
+    table_name = model.__tablename__
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    cursor = db_session.connection().connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN", buffer)
+        if "id" in columns:
+            # Rows carried their own IDs; move the sequence past them.
+            cursor.execute(f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), (SELECT max(id) FROM {table_name}))")
+    finally:
+        cursor.close()
+    # COPY bypasses the ORM events that record which tables changed.
+    db_session.info.setdefault(CHANGED_TABLES_KEY, set()).add(table_name)
+
+def _import_batch_errors(error: ValidationError, row_numbers: List[int]) -> Dict[int, List[str]]:
+    errors_by_row = defaultdict(list)
+    for detail in error.errors():
+        index, *field = detail["loc"]
+        location = ".".join(str(part) for part in field)
+        errors_by_row[row_numbers[index]].append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return errors_by_row
+
+def _insert_import_batch(db_session: Session, table_name: str, entries: list, rollup_totals: Dict[tuple, Dict[str, Any]]) -> float:
+    """
+    Inserts one batch of validated entries with a single executemany, indexes them for
+    search and appends their cash movements to the ledger. Their rollup contributions
+    are added to rollup_totals; their net cash effect is returned.
+    """
+    model, schema, rollup_rows_for = IMPORT_TABLES[table_name]
+    columns = [name for name in schema.model_fields if name not in ("doc_id", "timestamp", "daily_total_eur")]
+    now = datetime.now()
+    ids = db_session.execute(
+        insert(model).returning(model.id, sort_by_parameter_order=True),
+        [dict({column: getattr(entry, column) for column in columns}, timestamp=now) for entry in entries]
+    ).scalars().all()
+    search_index.index_documents(db_session, [
+        {"doc_key": _search_key(table_name, entry_id), "content": _search_content(table_name, entry),
+         "entry_date": _to_date(entry.income_date if table_name == SEARCH_TYPE_INCOME else entry.cost_date)}
+        for entry_id, entry in zip(ids, entries)
+    ])
+    for entry in entries:
+        for row in rollup_rows_for(entry):
+            key = tuple(row[column] for column in ROLLUP_KEY_COLUMNS)
+            total = rollup_totals.setdefault(key, dict(row, amount=0.0, hours_worked=0.0, entry_count=0))
+            total["amount"] += row["amount"]
+            total["hours_worked"] += row["hours_worked"]
+            total["entry_count"] += row["entry_count"]
+    return _append_cash_movements(db_session, [
+        _entry_cash_movement(table_name, entry_id, entry) for entry_id, entry in zip(ids, entries)
+    ])
+
+def import_entries(db_session: Session, table_name: str, rows: Iterable[Tuple[int, Dict[str, Any]]]) -> ImportResult:
+    """
+    Imports (row number, CSV row) pairs into a table in a single transaction. Rows are
+    validated against the table's API model and inserted IMPORT_BATCH_SIZE at a time;
+    the daily rollup and cash on hand are each updated once for the whole import.
+    If any row is invalid, the transaction is rolled back and the result lists the
+    invalid rows instead.
+    """
+    _, schema, _ = IMPORT_TABLES[table_name]
+    batch_adapter = TypeAdapter(List[schema])
+    errors: List[ImportRowError] = []
+    rollup_totals: Dict[tuple, Dict[str, Any]] = {}
+    imported = 0
+    cash_delta = 0.0
+
+    def flush_batch(batch: List[Dict[str, Any]], row_numbers: List[int]):
+        nonlocal imported, cash_delta
+        try:
+            entries = batch_adapter.validate_python(batch)
+        except ValidationError as error:
+            for row_number, messages in sorted(_import_batch_errors(error, row_numbers).items()):
+                errors.append(ImportRowError(row=row_number, errors=messages))
+            return
+        if errors:
+            # The import is already failing; keep validating to report every bad row.
+            return
+        cash_delta += _insert_import_batch(db_session, table_name, entries, rollup_totals)
+        imported += len(entries)
+
+    batch, row_numbers = [], []
+    for row_number, row in rows:
+        # Empty cells are missing values, so optional fields become None.
+        batch.append({key.strip(): value for key, value in row.items() if key and value not in ("", None)})
+        row_numbers.append(row_number)
+        if len(batch) == IMPORT_BATCH_SIZE:
+            flush_batch(batch, row_numbers)
+            batch, row_numbers = [], []
+        if len(errors) >= MAX_IMPORT_ERRORS:
+            break
+    if batch and len(errors) < MAX_IMPORT_ERRORS:
+        flush_batch(batch, row_numbers)
+
+    if errors:
+        db_session.rollback()
+        logger.warning("Import into %s rejected: %s invalid rows.", table_name, len(errors))
+        return ImportResult(table=table_name, imported=0, cash_on_hand_delta=0.0, errors=errors[:MAX_IMPORT_ERRORS])
+
+    _apply_rollup_rows(db_session, list(rollup_totals.values()))
+    cash_delta = round(cash_delta, 2)
+    if cash_delta:
+        _adjust_cash_on_hand(db_session, cash_delta)
+    db_session.commit()
+    logger.info("Imported %s entries into %s; cash on hand changed by %.2f.", imported, table_name, cash_delta)
+    return ImportResult(table=table_name, imported=imported, cash_on_hand_delta=cash_delta)
+
+def _get_rollup_totals(db_session: Session, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict[str, Any]:
     """
-    Retrieves and aggregates income entries by income_date.
+    Reads the daily rollup for an inclusive date range (or all time) and returns the
+    expense totals per category, the Tours and Transfers totals and the number of
+    days with income. Reads at most one row per day, source and category.
     """
-    results = db_session.query(
+    query = select(
+        DBDailyRollup.source,
+        DBDailyRollup.category,
+        func.sum(DBDailyRollup.amount),
+        func.count()
+    )
+    if start_date is not None:
+        query = query.where(DBDailyRollup.rollup_date >= _to_date(start_date))
+    if end_date is not None:
+        query = query.where(DBDailyRollup.rollup_date <= _to_date(end_date))
+    rows = db_session.execute(query.group_by(DBDailyRollup.source, DBDailyRollup.category)).all()
+
+    totals = {"expense_categories": defaultdict(float), "Tours": 0.0, "Transfers": 0.0, "days_with_income": 0}
+    for source, category, amount, row_count in rows:
+        if source in ROLLUP_EXPENSE_SOURCES:
+            totals["expense_categories"][ExpenseCategory(category)] += amount or 0.0
+        else:
+            totals[source] += amount or 0.0
+            if source == ROLLUP_SOURCE_TOURS:
+                # Income rows have no category or payment method, so there is one per day.
+                totals["days_with_income"] = row_count
+    return totals
+
+def _profit_expenses(expense_categories: Dict[ExpenseCategory, float]) -> float:
+    excluded_categories_from_profit = {
+        ExpenseCategory.NON_BUSINESS_RELATED,
+        ExpenseCategory.BANK_DEPOSIT
+    }
+    return sum(amount for category, amount in expense_categories.items() if category not in excluded_categories_from_profit)
+
+def get_aggregated_income_by_date(db_session: Session) -> List[Dict[str, Any]]:
+    """
+    Retrieves and aggregates income entries by income_date, as plain dicts with the
+    fields of AggregatedIncome.
+    """
+    aggregated_incomes = _row_dicts(db_session, select(
         DBIncome.income_date,
         func.sum(DBIncome.tours_revenue_eur).label('total_tours_revenue_eur'),
         func.sum(DBIncome.transfers_revenue_eur).label('total_transfers_revenue_eur'),
         func.sum(DBIncome.tours_revenue_eur + DBIncome.transfers_revenue_eur).label('total_daily_income_eur'),
         func.sum(DBIncome.hours_worked).label('total_hours_worked')
-    ).group_by(DBIncome.income_date).order_by(DBIncome.income_date.desc()).all()
+    ).group_by(DBIncome.income_date).order_by(DBIncome.income_date.desc()))
 
-    aggregated_incomes = []
-    for row in results:
-        aggregated_incomes.append(AggregatedIncome.model_validate(row._asdict()))
-    
-    logger.info(f"Retrieved {len(aggregated_incomes)} aggregated income entries.")
+    logger.info("Retrieved %s aggregated income entries.", len(aggregated_incomes))
     return aggregated_incomes
 
-def get_monthly_summary(db_session: Session, year: int, month: int) -> Dict[str, float]:
-    start_date = f"{year}-{month:02d}-01"
+def _month_date_range(year: int, month: int):
+    start_date = date(year, month, 1)
     if month == 12:
-        end_date_dt = datetime(year + 1, 1, 1) - timedelta(days=1)
+        end_date = date(year + 1, 1, 1) - timedelta(days=1)
     else:
-        end_date_dt = datetime(year, month + 1, 1) - timedelta(days=1)
-    end_date = end_date_dt.strftime("%Y-%m-%d")
+        end_date = date(year, month + 1, 1) - timedelta(days=1)
+    return start_date, end_date
 
-    excluded_categories_from_profit = {
-        ExpenseCategory.NON_BUSINESS_RELATED,
-        ExpenseCategory.BANK_DEPOSIT
-    }
-
-    total_monthly_daily_expenses = db_session.query(func.sum(DBDailyExpense.amount)).filter(
-        and_(DBDailyExpense.cost_date >= start_date, DBDailyExpense.cost_date <= end_date),
-        not_(DBDailyExpense.category.in_(excluded_categories_from_profit))
-    ).scalar() or 0.0
-
-    total_monthly_fixed_costs = db_session.query(func.sum(DBFixedCost.amount_eur)).filter(
-        and_(DBFixedCost.cost_date >= start_date, DBFixedCost.cost_date <= end_date),
-        not_(DBFixedCost.category.in_(excluded_categories_from_profit))
-    ).scalar() or 0.0
-
-    total_monthly_expenses = total_monthly_daily_expenses + total_monthly_fixed_costs
+def _day_range(start_date, end_date):
+    return _to_date(start_date), _to_date(end_date)
 
-    income_results = db_session.query(
-        func.sum(DBIncome.tours_revenue_eur),
-        func.sum(DBIncome.transfers_revenue_eur)
-    ).filter(
-        and_(DBIncome.income_date >= start_date, DBIncome.income_date <= end_date)
-    ).first()
+@cached_summary(_month_date_range)
+def get_monthly_summary(db_session: Session, year: int, month: int) -> Dict[str, float]:
+    start_date, end_date = _month_date_range(year, month)
 
-    total_monthly_income = (income_results[0] or 0.0) + (income_results[1] or 0.0)
+    totals = _get_rollup_totals(db_session, start_date, end_date)
+    total_monthly_expenses = _profit_expenses(totals["expense_categories"])
+    total_monthly_income = totals["Tours"] + totals["Transfers"]
 
     net_monthly_profit = total_monthly_income - total_monthly_expenses
 
@@ -540,101 +1559,47 @@ def get_monthly_summary(db_session: Session, year: int, month: int) -> Dict[str,
         "total_monthly_income": round(total_monthly_income, 2),
         "net_monthly_profit": round(net_monthly_profit, 2)
     }
-    logger.info(f"Generated monthly summary for {year}-{month:02d}: {summary}")
+    logger.info("Generated monthly summary for %s-%02d: %s", year, month, summary)
     return summary
 
+@cached_summary(_month_date_range)
 def get_expense_categories_summary(db_session: Session, year: int, month: int) -> Dict[str, float]:
-    start_date = f"{year}-{month:02d}-01"
-    if month == 12:
-        end_date_dt = datetime(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date_dt = datetime(year, month + 1, 1) - timedelta(days=1)
-    end_date = end_date_dt.strftime("%Y-%m-%d")
-
-    category_totals = defaultdict(float)
+    start_date, end_date = _month_date_range(year, month)
 
     excluded_categories_from_summary = {
         ExpenseCategory.NON_BUSINESS_RELATED,
         ExpenseCategory.BANK_DEPOSIT
     }
 
-    daily_expenses = db_session.query(DBDailyExpense).filter(
-        and_(DBDailyExpense.cost_date >= start_date, DBDailyExpense.cost_date <= end_date),
-        not_(DBDailyExpense.category.in_(excluded_categories_from_summary))
-    ).all()
-    for expense in daily_expenses:
-        category_totals[expense.category.value] += expense.amount
+    category_totals = _get_rollup_totals(db_session, start_date, end_date)["expense_categories"]
 
-    fixed_costs = db_session.query(DBFixedCost).filter(
-        and_(DBFixedCost.cost_date >= start_date, DBFixedCost.cost_date <= end_date),
-        not_(DBFixedCost.category.in_(excluded_categories_from_summary))
-    ).all()
-    for cost in fixed_costs:
-        category_totals[cost.category.value] += cost.amount_eur
-
-    summary = {category: round(total, 2) for category, total in category_totals.items()}
-    logger.info(f"Generated expense categories summary for {year}-{month:02d}: {summary}")
+    summary = {
+        category.value: round(total, 2) for category, total in category_totals.items()
+        if category not in excluded_categories_from_summary
+    }
+    logger.info("Generated expense categories summary for %s-%02d: %s", year, month, summary)
     return summary
 
+@cached_summary(_month_date_range)
 def get_income_sources_summary(db_session: Session, year: int, month: int) -> Dict[str, float]:
-    start_date = f"{year}-{month:02d}-01"
-    if month == 12:
-        end_date_dt = datetime(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date_dt = datetime(year, month + 1, 1) - timedelta(days=1)
-    end_date = end_date_dt.strftime("%Y-%m-%d")
+    start_date, end_date = _month_date_range(year, month)
 
-    source_totals = defaultdict(float)
-    income_entries = db_session.query(DBIncome).filter(
-        and_(DBIncome.income_date >= start_date, DBIncome.income_date <= end_date)
-    ).all()
+    totals = _get_rollup_totals(db_session, start_date, end_date)
 
-    for income in income_entries:
-        source_totals['Tours'] += income.tours_revenue_eur
-        source_totals['Transfers'] += income.transfers_revenue_eur
-
-    summary = {source: round(total, 2) for source, total in source_totals.items()}
-    logger.info(f"Generated income sources summary for {year}-{month:02d}: {summary}")
+    summary = {}
+    if totals["days_with_income"]:
+        summary = {source: round(totals[source], 2) for source in ROLLUP_INCOME_SOURCES}
+    logger.info("Generated income sources summary for %s-%02d: %s", year, month, summary)
     return summary
 
+@cached_summary(_day_range)
 def get_weekly_summary(db_session: Session, start_date: datetime, end_date: datetime) -> Dict[str, float]:
     """
     Retrieves a summary of total expenses, total income, and net profit/loss for a given week.
     """
-    excluded_categories_from_profit = {
-        ExpenseCategory.NON_BUSINESS_RELATED,
-        ExpenseCategory.BANK_DEPOSIT
-    }
-
-    total_daily_expenses_for_week = db_session.query(func.sum(DBDailyExpense.amount)).filter(
-        and_(
-            DBDailyExpense.cost_date >= start_date.strftime('%Y-%m-%d'),
-            DBDailyExpense.cost_date <= end_date.strftime('%Y-%m-%d'),
-            not_(DBDailyExpense.category.in_(excluded_categories_from_profit))
-        )
-    ).scalar() or 0.0
-
-    total_fixed_costs_for_week = db_session.query(func.sum(DBFixedCost.amount_eur)).filter(
-        and_(
-            DBFixedCost.cost_date >= start_date.strftime('%Y-%m-%d'),
-            DBFixedCost.cost_date <= end_date.strftime('%Y-%m-%d'),
-            not_(DBFixedCost.category.in_(excluded_categories_from_profit))
-        )
-    ).scalar() or 0.0
-    
-    total_expenses = total_daily_expenses_for_week + total_fixed_costs_for_week
-
-    income_results = db_session.query(
-        func.sum(DBIncome.tours_revenue_eur),
-        func.sum(DBIncome.transfers_revenue_eur)
-    ).filter(
-        and_(
-            DBIncome.income_date >= start_date.strftime('%Y-%m-%d'),
-            DBIncome.income_date <= end_date.strftime('%Y-%m-%d')
-        )
-    ).first()
-
-    total_income = (income_results[0] or 0.0) + (income_results[1] or 0.0)
+    totals = _get_rollup_totals(db_session, start_date.date(), end_date.date())
+    total_expenses = _profit_expenses(totals["expense_categories"])
+    total_income = totals["Tours"] + totals["Transfers"]
     net_profit = total_income - total_expenses
 
     summary = {
@@ -642,123 +1607,51 @@ def get_weekly_summary(db_session: Session, start_date: datetime, end_date: date
         "total_weekly_income": round(total_income, 2),
         "net_weekly_profit": round(net_profit, 2),
     }
-    logger.info(f"Generated weekly summary for {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}: {summary}")
+    logger.info("Generated weekly summary for %s to %s: %s", start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), summary)
     return summary
 
+@cached_summary(_day_range)
 def get_weekly_expense_categories_summary(db_session: Session, start_date: datetime, end_date: datetime) -> Dict[str, float]:
     """
     Retrieves a summary of expenses grouped by category for a given week.
     """
-    daily_expenses_by_category = db_session.query(
-        DBDailyExpense.category,
-        func.sum(DBDailyExpense.amount)
-    ).filter(
-        and_(
-            DBDailyExpense.cost_date >= start_date.strftime('%Y-%m-%d'),
-            DBDailyExpense.cost_date <= end_date.strftime('%Y-%m-%d')
-        )
-    ).group_by(DBDailyExpense.category).all()
-
-    fixed_costs_by_category = db_session.query(
-        DBFixedCost.category,
-        func.sum(DBFixedCost.amount_eur)
-    ).filter(
-        and_(
-            DBFixedCost.cost_date >= start_date.strftime('%Y-%m-%d'),
-            DBFixedCost.cost_date <= end_date.strftime('%Y-%m-%d')
-        )
-    ).group_by(DBFixedCost.category).all()
-
-    expense_summary = defaultdict(float)
-    for category, amount in daily_expenses_by_category:
-        expense_summary[category.value] += amount
-    for category, amount in fixed_costs_by_category:
-        expense_summary[category.value] += amount
-
-    return {category: round(amount, 2) for category, amount in expense_summary.items()}
+    expense_summary = _get_rollup_totals(db_session, start_date.date(), end_date.date())["expense_categories"]
+    return {category.value: round(amount, 2) for category, amount in expense_summary.items()}
 
+@cached_summary(_day_range)
 def get_weekly_income_sources_summary(db_session: Session, start_date: datetime, end_date: datetime) -> Dict[str, float]:
     """
     Retrieves a summary of income by source for a given week.
     """
-    income_summary = db_session.query(
-        func.sum(DBIncome.tours_revenue_eur).label('tours_revenue_eur'),
-        func.sum(DBIncome.transfers_revenue_eur).label('transfers_revenue_eur')
-    ).filter(
-        and_(
-            DBIncome.income_date >= start_date.strftime('%Y-%m-%d'),
-            DBIncome.income_date <= end_date.strftime('%Y-%m-%d')
-        )
-    ).first()
-
-    summary = {
-        "Tours": round(income_summary.tours_revenue_eur, 2) if income_summary.tours_revenue_eur else 0.0,
-        "Transfers": round(income_summary.transfers_revenue_eur, 2) if income_summary.transfers_revenue_eur else 0.0,
-    }
-    return summary
+    totals = _get_rollup_totals(db_session, start_date.date(), end_date.date())
+    return {source: round(totals[source], 2) for source in ROLLUP_INCOME_SOURCES}
 
+@cached_summary(_day_range)
 def get_daily_income_average_for_period(db_session: Session, start_date: datetime, end_date: datetime) -> float:
     """
     Calculates the daily average income over a specified period,
     considering only days that had recorded income.
     """
-    # Apply the helper function to DBIncome.income_date
-    income_date_col = _get_date_column_expression(db_session, DBIncome.income_date)
-
-    total_income_tours = db_session.query(func.sum(DBIncome.tours_revenue_eur)).filter(
-        income_date_col >= start_date, # Use the casted/converted column
-        income_date_col <= end_date    # Use the casted/converted column
-    ).scalar() or 0.0
-
-    total_income_transfers = db_session.query(func.sum(DBIncome.transfers_revenue_eur)).filter(
-        income_date_col >= start_date, # Use the casted/converted column
-        income_date_col <= end_date    # Use the casted/converted column
-    ).scalar() or 0.0
-
-    total_income = total_income_tours + total_income_transfers
-
-    num_days_with_income = db_session.query(func.count(distinct(income_date_col))).filter( # Apply distinct on the casted/converted column
-        income_date_col >= start_date,
-        income_date_col <= end_date
-    ).scalar() or 0
+    totals = _get_rollup_totals(db_session, start_date, end_date)
+    total_income = totals["Tours"] + totals["Transfers"]
+    num_days_with_income = totals["days_with_income"]
 
     if num_days_with_income > 0:
         daily_average_income = total_income / num_days_with_income
     else:
         daily_average_income = 0.0
 
-    logger.info(f"Calculated daily income average for period {start_date} to {end_date}: {daily_average_income:.2f} over {num_days_with_income} days with income.")
+    logger.info("Calculated daily income average for period %s to %s: %.2f over %s days with income.", start_date, end_date, daily_average_income, num_days_with_income)
     return round(daily_average_income, 2)
 
+@cached_summary(lambda year: (date(year, 1, 1), date(year, 12, 31)))
 def get_yearly_summary(db_session: Session, year: int) -> Dict[str, float]:
-    start_date = f"{year}-01-01"
-    end_date = f"{year}-12-31"
-
-    excluded_categories_from_profit = {
-        ExpenseCategory.NON_BUSINESS_RELATED,
-        ExpenseCategory.BANK_DEPOSIT
-    }
+    start_date = date(year, 1, 1)
+    end_date = date(year, 12, 31)
 
-    total_yearly_daily_expenses = db_session.query(func.sum(DBDailyExpense.amount)).filter(
-        and_(DBDailyExpense.cost_date >= start_date, DBDailyExpense.cost_date <= end_date),
-        not_(DBDailyExpense.category.in_(excluded_categories_from_profit))
-    ).scalar() or 0.0
-
-    total_yearly_fixed_costs = db_session.query(func.sum(DBFixedCost.amount_eur)).filter(
-        and_(DBFixedCost.cost_date >= start_date, DBFixedCost.cost_date <= end_date),
-        not_(DBFixedCost.category.in_(excluded_categories_from_profit))
-    ).scalar() or 0.0
-
-    total_yearly_expenses = total_yearly_daily_expenses + total_yearly_fixed_costs
-
-    income_results = db_session.query(
-        func.sum(DBIncome.tours_revenue_eur),
-        func.sum(DBIncome.transfers_revenue_eur)
-    ).filter(
-        and_(DBIncome.income_date >= start_date, DBIncome.income_date <= end_date)
-    ).first()
-
-    total_yearly_income = (income_results[0] or 0.0) + (income_results[1] or 0.0)
+    totals = _get_rollup_totals(db_session, start_date, end_date)
+    total_yearly_expenses = _profit_expenses(totals["expense_categories"])
+    total_yearly_income = totals["Tours"] + totals["Transfers"]
 
     net_yearly_profit = total_yearly_income - total_yearly_expenses
 
@@ -767,49 +1660,268 @@ def get_yearly_summary(db_session: Session, year: int) -> Dict[str, float]:
         "total_yearly_income": round(total_yearly_income, 2),
         "net_yearly_profit": round(net_yearly_profit, 2)
     }
-    logger.info(f"Generated yearly summary for {year}: {summary}")
+    logger.info("Generated yearly summary for %s: %s", year, summary)
     return summary
 
+@cached_summary(lambda: None)
 def get_global_summary(db_session: Session) -> Dict[str, float]:
+    totals = _get_rollup_totals(db_session)
+    total_global_expenses = _profit_expenses(totals["expense_categories"])
+    total_global_income = totals["Tours"] + totals["Transfers"]
+    net_global_profit = total_global_income - total_global_expenses
+
+    summary = {
+        "total_global_expenses": round(total_global_expenses, 2),
+        "total_global_income": round(total_global_income, 2),
+        "net_global_profit": round(net_global_profit, 2)
+    }
+    logger.info("Generated global summary: %s", summary)
+    return summary
+
+def get_dashboard_summary(
+    db_session: Session,
+    period: str,
+    start_date: date,
+    end_date: date,
+    comparison_dates: Dict[str, date],
+    recent_limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Computes every figure the dashboard shows in one session: the period summary,
+    expense categories, income sources, daily income average, cash on hand, the
+    global summary, income for the comparison days and the most recent entries.
+    Each figure matches the corresponding /summary or /income endpoint.
+    """
+    start_date = _to_date(start_date)
+    end_date = _to_date(end_date)
     excluded_categories_from_profit = {
         ExpenseCategory.NON_BUSINESS_RELATED,
         ExpenseCategory.BANK_DEPOSIT
     }
 
-    total_global_daily_expenses = db_session.query(func.sum(DBDailyExpense.amount)).filter(
-        not_(DBDailyExpense.category.in_(excluded_categories_from_profit))
-    ).scalar() or 0.0
-    total_global_fixed_costs = db_session.query(func.sum(DBFixedCost.amount_eur)).filter(
-        not_(DBFixedCost.category.in_(excluded_categories_from_profit))
-    ).scalar() or 0.0
-    total_global_expenses = total_global_daily_expenses + total_global_fixed_costs
-
-    income_results = db_session.query(
-        func.sum(DBIncome.tours_revenue_eur),
-        func.sum(DBIncome.transfers_revenue_eur)
-    ).first()
+    # 1-2. Period expenses per category, income totals and days with income from the rollup.
+    period_totals = _get_rollup_totals(db_session, start_date, end_date)
+    all_categories = period_totals["expense_categories"]
+    total_expenses = _profit_expenses(all_categories)
+    if period == "week":
+        expense_categories = {category.value: round(amount, 2) for category, amount in all_categories.items()}
+    else:
+        expense_categories = {
+            category.value: round(amount, 2) for category, amount in all_categories.items()
+            if category not in excluded_categories_from_profit
+        }
 
-    total_global_income = (income_results[0] or 0.0) + (income_results[1] or 0.0)
-    net_global_profit = total_global_income - total_global_expenses
+    tours_total = period_totals["Tours"]
+    transfers_total = period_totals["Transfers"]
+    days_with_income = period_totals["days_with_income"]
+    total_income = tours_total + transfers_total
+    net_profit = total_income - total_expenses
 
-    summary = {
+    if period == "week":
+        period_summary = {
+            "total_weekly_expenses": round(total_expenses, 2),
+            "total_weekly_income": round(total_income, 2),
+            "net_weekly_profit": round(net_profit, 2),
+        }
+        income_sources = {"Tours": round(tours_total, 2), "Transfers": round(transfers_total, 2)}
+    else:
+        period_summary = {
+            "total_monthly_expenses": round(total_expenses, 2),
+            "total_monthly_income": round(total_income, 2),
+            "net_monthly_profit": round(net_profit, 2)
+        }
+        income_sources = {"Tours": round(tours_total, 2), "Transfers": round(transfers_total, 2)} if days_with_income else {}
+
+    daily_average_income = round(total_income / days_with_income, 2) if days_with_income else 0.0
+
+    # 3. Global totals from the rollup.
+    global_totals = _get_rollup_totals(db_session)
+    total_global_expenses = _profit_expenses(global_totals["expense_categories"])
+    total_global_income = global_totals["Tours"] + global_totals["Transfers"]
+    global_summary = {
         "total_global_expenses": round(total_global_expenses, 2),
         "total_global_income": round(total_global_income, 2),
-        "net_global_profit": round(net_global_profit, 2)
+        "net_global_profit": round(total_global_income - total_global_expenses, 2)
+    }
+
+    # 4. Cash on hand.
+    cash_on_hand = get_cash_on_hand_balance(db_session)
+
+    # 5. Income for every comparison day in one grouped statement.
+    comparison_dates = {name: _to_date(day) for name, day in comparison_dates.items()}
+    daily_rows = {
+        row.income_date: row for row in db_session.execute(
+            select(
+                DBIncome.income_date,
+                func.sum(DBIncome.tours_revenue_eur).label('total_tours_revenue_eur'),
+                func.sum(DBIncome.transfers_revenue_eur).label('total_transfers_revenue_eur'),
+                func.sum(DBIncome.hours_worked).label('total_hours_worked')
+            ).where(DBIncome.income_date.in_(set(comparison_dates.values()))).group_by(DBIncome.income_date)
+        ).all()
+    }
+    daily_income = {}
+    for name, day in comparison_dates.items():
+        row = daily_rows.get(day)
+        tours = (row.total_tours_revenue_eur or 0.0) if row else 0.0
+        transfers = (row.total_transfers_revenue_eur or 0.0) if row else 0.0
+        daily_income[name] = AggregatedIncome(
+            income_date=day,
+            total_tours_revenue_eur=round(tours, 2),
+            total_transfers_revenue_eur=round(transfers, 2),
+            total_daily_income_eur=round(tours + transfers, 2),
+            total_hours_worked=round((row.total_hours_worked or 0.0) if row else 0.0, 2)
+        )
+
+    # 6-8. Most recent entries for the dashboard tables.
+    recent_income = db_session.execute(
+        select(
+            DBIncome.income_date,
+            func.sum(DBIncome.tours_revenue_eur).label('total_tours_revenue_eur'),
+            func.sum(DBIncome.transfers_revenue_eur).label('total_transfers_revenue_eur'),
+            func.sum(DBIncome.tours_revenue_eur + DBIncome.transfers_revenue_eur).label('total_daily_income_eur'),
+            func.sum(DBIncome.hours_worked).label('total_hours_worked')
+        ).group_by(DBIncome.income_date).order_by(DBIncome.income_date.desc()).limit(recent_limit)
+    ).all()
+    recent_daily_expenses = db_session.query(DBDailyExpense).order_by(
+        DBDailyExpense.cost_date.desc(), DBDailyExpense.id.desc()
+    ).limit(recent_limit).all()
+    recent_fixed_costs = db_session.query(DBFixedCost).order_by(
+        DBFixedCost.cost_date.desc(), DBFixedCost.id.desc()
+    ).limit(recent_limit).all()
+
+    logger.info("Generated dashboard summary for %s %s to %s.", period, start_date, end_date)
+    return {
+        "period": period,
+        "start_date": start_date,
+        "end_date": end_date,
+        "summary": period_summary,
+        "expense_categories": expense_categories,
+        "income_sources": income_sources,
+        "daily_income_average": daily_average_income,
+        "cash_on_hand": cash_on_hand,
+        "global_summary": global_summary,
+        "daily_income": daily_income,
+        "recent": {
+            "income": [AggregatedIncome.model_validate(row._asdict()) for row in recent_income],
+            "daily_expenses": [DailyExpense.model_validate(expense) for expense in recent_daily_expenses],
+            "fixed_costs": [FixedCost.model_validate(cost) for cost in recent_fixed_costs],
+        },
     }
-    logger.info(f"Generated global summary: {summary}")
-    return summary
 
 def create_all_tables(engine_param=None):
     target_engine = engine_param if engine_param else engine
     Base.metadata.create_all(bind=target_engine)
+    with target_engine.begin() as connection:
+        search_index.create_search_index(connection)
     logger.info("Database tables created successfully (if they didn't already exist).")
+    upgrade_schema(target_engine)
+
+# Arbitrary key of the PostgreSQL advisory lock held while the database is initialised.
+STARTUP_LOCK_KEY = 720_125
+
+@contextmanager
+def startup_lock(engine_param=None):
+    """
+    Serialises database initialisation across worker processes. On PostgreSQL it
+    holds a session-level advisory lock on a dedicated connection, so one worker
+    initialises while the others wait and then find the work done. SQLite has no
+    such lock; there app.server initialises once before starting the workers.
+    """
+    target_engine = engine_param if engine_param else engine
+    if target_engine.dialect.name != "postgresql":
+        yield
+        return
+    with target_engine.connect() as connection:
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": STARTUP_LOCK_KEY})
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": STARTUP_LOCK_KEY})
+
+# Date columns that were stored as strings before the schema moved to native DATE columns.
+LEGACY_STRING_DATE_COLUMNS = {
+    "fixed_costs": "cost_date",
+    "daily_expenses": "cost_date",
+    "income": "income_date",
+}
+
+def _parse_legacy_date_string(value: str) -> date:
+    """
+    Parses a legacy string date such as '2025-03-04', '2025-3-4' or '2025-03-04T10:00:00'.
+    """
+    return datetime.strptime(value.strip().split("T")[0].split(" ")[0], "%Y-%m-%d").date()
+
+def _normalize_legacy_date_strings(connection, table_name: str, column_name: str):
+    """
+    Rewrites any string dates that are not already in canonical YYYY-MM-DD form,
+    so they compare and parse correctly once the column is treated as DATE.
+    """
+    rows = connection.execute(text(
+        f"SELECT id, {column_name} FROM {table_name} "
+        f"WHERE date({column_name}) IS NULL OR date({column_name}) != {column_name}"
+    )).all()
+    for row_id, value in rows:
+        try:
+            normalized = _parse_legacy_date_string(value).isoformat()
+        except (AttributeError, ValueError):
+            raise ValueError(f"Cannot migrate {table_name}.{column_name} for row {row_id}: unrecognized date {value!r}")
+        connection.execute(
+            text(f"UPDATE {table_name} SET {column_name} = :value WHERE id = :row_id"),
+            {"value": normalized, "row_id": row_id}
+        )
+    if rows:
+        logger.info("Normalized %s legacy date values in %s.%s.", len(rows), table_name, column_name)
+
+def _rebuild_sqlite_table(connection, table_name: str):
+    """
+    Recreates a SQLite table from the current model definition and copies its rows over.
+    SQLite cannot ALTER a column's type, so this is the in-place upgrade path.
+    """
+    table = Base.metadata.tables[table_name]
+    legacy_table_name = f"{table_name}_legacy"
+    for index_row in connection.execute(text(f"PRAGMA index_list({table_name})")).mappings():
+        if index_row["origin"] == "c":
+            connection.execute(text(f'DROP INDEX "{index_row["name"]}"'))
+    connection.execute(text(f"ALTER TABLE {table_name} RENAME TO {legacy_table_name}"))
+    table.create(bind=connection)
+    column_list = ", ".join(column.name for column in table.columns)
+    connection.execute(text(f"INSERT INTO {table_name} ({column_list}) SELECT {column_list} FROM {legacy_table_name}"))
+    connection.execute(text(f"DROP TABLE {legacy_table_name}"))
+
+def upgrade_schema(engine_param=None):
+    """
+    Upgrades tables created by earlier versions in place: converts the string
+    date columns to DATE (migrating the existing values) and creates any
+    indexes that are missing. Safe to run on every startup.
+    """
+    target_engine = engine_param if engine_param else engine
+    inspector = inspect(target_engine)
+    with target_engine.begin() as connection:
+        for table_name, column_name in LEGACY_STRING_DATE_COLUMNS.items():
+            if not inspector.has_table(table_name):
+                continue
+            column_type = next(column["type"] for column in inspector.get_columns(table_name) if column["name"] == column_name)
+            if isinstance(column_type, Date):
+                continue
+            logger.info("Migrating %s.%s from %s to DATE.", table_name, column_name, column_type)
+            if connection.dialect.name == "postgresql":
+                connection.execute(text(
+                    f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE DATE USING {column_name}::date"
+                ))
+            else:
+                _normalize_legacy_date_strings(connection, table_name, column_name)
+                _rebuild_sqlite_table(connection, table_name)
+
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+    logger.info("Database schema is up to date.")
 
+@cached_summary(lambda target_date: _day_range(target_date, target_date))
 def get_single_day_income_summary(db_session: Session, target_date: datetime) -> AggregatedIncome:
-    logger.info(f"DB: Attempting to retrieve single day income summary for {target_date.date()}")
+    logger.info("DB: Attempting to retrieve single day income summary for %s", target_date.date())
 
-    # Use the helper function to get the appropriate date column expression
-    income_date_col = _get_date_column_expression(db_session, DBIncome.income_date)
+    income_date_col = DBIncome.income_date
 
     income_summary_query = db_session.query(
         func.sum(DBIncome.tours_revenue_eur).label('total_tours_revenue_eur'),
@@ -821,9 +1933,9 @@ def get_single_day_income_summary(db_session: Session, target_date: datetime) ->
 
     # Handle case where no income entries exist for the day
     if income_summary_query is None or (income_summary_query.total_tours_revenue_eur is None and income_summary_query.total_transfers_revenue_eur is None):
-        logger.info(f"DB: No income entries found for {target_date.date()}. Returning zero summary.")
+        logger.info("DB: No income entries found for %s. Returning zero summary.", target_date.date())
         return AggregatedIncome(
-            income_date=target_date.strftime("%Y-%m-%d"),
+            income_date=target_date.date(),
             total_tours_revenue_eur=0.0,
             total_transfers_revenue_eur=0.0,
             total_daily_income_eur=0.0,
@@ -837,11 +1949,11 @@ def get_single_day_income_summary(db_session: Session, target_date: datetime) ->
     total_daily_income = total_tours_revenue + total_transfers_revenue
 
     summary = AggregatedIncome(
-        income_date=target_date.strftime("%Y-%m-%d"),
+        income_date=target_date.date(),
         total_tours_revenue_eur=round(total_tours_revenue, 2),
         total_transfers_revenue_eur=round(total_transfers_revenue, 2),
         total_daily_income_eur=round(total_daily_income, 2),
         total_hours_worked=round(total_hours_worked, 2)
     )
-    logger.info(f"DB: Generated single day income summary for {target_date.date()}: {summary.total_daily_income_eur:.2f} EUR")
+    logger.info("DB: Generated single day income summary for %s: %.2f EUR", target_date.date(), summary.total_daily_income_eur)
     return summary
\ No newline at end of file
@@ -0,0 +1,104 @@
+# app/db_pool.py
+# Connection pool configuration and checkout statistics for the database engines.
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+from app.config import settings
+
+class PoolCheckoutStats:
+    """
+    Thread-safe counters for connection checkouts from a pool, including how
+    long callers waited for a connection to become available.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_total_ms": round(self.total_wait_seconds * 1000, 3),
+                "checkout_wait_avg_ms": round(self.total_wait_seconds * 1000 / attempts, 3) if attempts else 0.0,
+                "checkout_wait_max_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+class _TimedCheckoutMixin:
+    """
+    Times every checkout that goes through the pool queue. Pools are recreated
+    on engine.dispose(), so the counters start fresh with the new pool.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolCheckoutStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.checkout_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+def get_engine_pool_options(database_url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Returns the create_engine() pool keyword arguments built from Settings.
+    In-memory SQLite databases keep SQLAlchemy's default single-connection
+    pool, since every new connection would open an empty database.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def get_pool_stats(pool) -> Dict[str, Any]:
+    """
+    Returns the live occupancy of a pool together with its checkout wait statistics.
+    """
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        })
+    checkout_stats = getattr(pool, "checkout_stats", None)
+    stats.update(checkout_stats.snapshot() if checkout_stats else PoolCheckoutStats().snapshot())
+    return stats
@@ -1,26 +1,103 @@
 # app/logging.py
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-def configure_logging():
+from app.config import settings
+
+_listener: Optional[QueueListener] = None
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class SamplingFilter(logging.Filter):
+    """
+    Lets through one in every 1/rate records from each logging call site, the
+    first one included. rates maps logger names to rates; a record takes the rate
+    of its logger or of the nearest configured ancestor, and is not sampled if
+    there is none. Warnings and errors always pass.
+    """
+    # Call sites counted before the counts start over, so the table stays bounded.
+    MAX_CALL_SITES = 10_000
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.intervals = {name: max(1, round(1 / rate)) if rate > 0 else 0 for name, rate in rates.items()}
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, int], int] = {}
+
+    def _interval(self, logger_name: str) -> Optional[int]:
+        name = logger_name
+        while name not in self.intervals:
+            if "." not in name:
+                return None
+            name = name.rsplit(".", 1)[0]
+        return self.intervals[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        interval = self._interval(record.name)
+        if interval is None:
+            return True
+        if not interval:
+            return False
+        key = (record.pathname, record.lineno)
+        # Records come from request threads and the async session's worker threads.
+        with self._lock:
+            if key not in self._counts and len(self._counts) >= self.MAX_CALL_SITES:
+                self._counts.clear()
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % interval == 0
+
+def configure_logging(log_dir: Optional[Path] = None):
     """
     Configures application-wide logging to a file and the console.
     Logs are written to 'app.log' within a 'logs' directory located
     one level up from the 'app' directory (i.e., in the 'site' directory).
+
+    The file and console handlers run on a QueueListener thread; request code
+    only puts records on an in-memory queue, so disk I/O and rotation never block
+    it. LOG_FORMAT selects plain text or JSON lines, and LOG_SAMPLE_RATES thins
+    out info messages of individual loggers and their children.
     """
+    global _listener
     logger = logging.getLogger()
-    logger.setLevel(logging.WARNING)
+    logger.setLevel(settings.LOG_LEVEL)
 
     # Prevent adding duplicate handlers, especially important with uvicorn's --reload
     if not logger.handlers:
-        log_dir = Path(__file__).parent.parent / 'logs'
+        log_dir = log_dir or Path(__file__).parent.parent / 'logs'
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file_path = log_dir / 'app.log'
 
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        if settings.LOG_FORMAT == "json":
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
 
         file_handler = RotatingFileHandler(
             log_file_path,
@@ -28,10 +105,35 @@ def configure_logging():
             backupCount=5             # Keep 5 backup log files
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
 
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        if settings.LOG_SAMPLE_RATES:
+            # On the handler rather than the named loggers, so records of their child
+            # loggers are sampled too.
+            queue_handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATES))
+        logger.addHandler(queue_handler)
+        _listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
 
     logging.info("Logging configuration complete.")
+
+def stop_logging():
+    """
+    Writes out every queued record, then detaches the handlers that
+    configure_logging installed.
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    root = logging.getLogger()
+    for handler in [handler for handler in root.handlers if isinstance(handler, QueueHandler)]:
+        root.removeHandler(handler)
+    _listener = None
@@ -0,0 +1,309 @@
+# app/metrics.py
+# In-process request and database metrics in the Prometheus text exposition format.
+#
+# MetricsMiddleware records per-route latency, response size, in-flight requests
+# and the SQL time spent inside each request; instrument_engine() hooks the
+# cursor events of an engine to time every statement. render_metrics() writes
+# all series out for the /metrics endpoint. Routes are labelled with their path
+# template (/income/{doc_id}), never the raw path, to keep the number of series
+# bounded.
+#
+# The same hooks count the statements and commits of each request, which can be
+# returned in a Server-Timing header, and write statements slower than
+# SLOW_QUERY_THRESHOLD_MS to the "app.slow_queries" logger, with their bound
+# parameters left out and optionally with the database's query plan.
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+SQL_OPERATIONS = frozenset({
+    "SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "CREATE", "DROP", "ALTER", "PRAGMA", "SAVEPOINT", "RELEASE", "ROLLBACK",
+})
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)) + "}"
+
+class Histogram:
+    """
+    Thread-safe histogram with fixed bucket upper bounds, one series per
+    combination of label values.
+    """
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self._lock = threading.Lock()
+        # label values -> (per-bucket counts with a trailing +Inf slot, [sum])
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *label_values: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def expose(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [(label_values, list(counts), total[0]) for label_values, (counts, total) in sorted(self._series.items())]
+        bucket_names = self.label_names + ("le",)
+        for label_values, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_names, label_values + (le,))} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {total!r}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+class Gauge:
+    """
+    Thread-safe gauge, one value per combination of label values.
+    """
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float, *label_values: str):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def expose(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            values = sorted(self._values.items())
+        lines.extend(f"{self.name}{_format_labels(self.label_names, label_values)} {value!r}" for label_values, value in values)
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time from receiving a request to sending the last byte of its response.",
+    ("method", "route", "status"), LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "Size of response bodies.", ("method", "route"), SIZE_BUCKETS,
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "Time spent executing SQL statements while handling a request.",
+    ("method", "route"), LATENCY_BUCKETS,
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements", "SQL statements executed while handling a request.",
+    ("method", "route"), STATEMENT_COUNT_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requests currently being handled.", ("method",),
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds", "Execution time of SQL statements, by engine and leading keyword.",
+    ("engine", "operation"), DB_LATENCY_BUCKETS,
+)
+
+METRICS = [REQUESTS_IN_PROGRESS, REQUEST_DURATION, RESPONSE_SIZE, REQUEST_DB_TIME, REQUEST_DB_STATEMENTS, DB_STATEMENT_DURATION]
+
+slow_query_logger = logging.getLogger("app.slow_queries")
+
+class RequestDBStats:
+    """
+    SQL statements executed on behalf of the current request. The object is
+    shared by reference, so statements run in worker threads or in SQLAlchemy's
+    async greenlets are counted as well.
+    """
+    __slots__ = ("request_line", "statements", "commits", "seconds")
+
+    def __init__(self, request_line: str = ""):
+        self.request_line = request_line
+        self.statements = 0
+        self.commits = 0
+        self.seconds = 0.0
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.statements} statements, {self.commits} commits"'
+
+_request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+def current_request_db_stats() -> Optional[RequestDBStats]:
+    """
+    Returns the statistics of the request being handled, or None outside of one.
+    """
+    return _request_db_stats.get()
+
+def _sql_operation(statement: str) -> str:
+    keyword = statement.lstrip()[:16].split(None, 1)
+    operation = keyword[0].upper() if keyword else ""
+    return operation if operation in SQL_OPERATIONS else "OTHER"
+
+def _explain(conn, statement: str, parameters) -> str:
+    """
+    Returns the database's plan for a slow SELECT, run on the same DBAPI
+    connection with the same parameters, or a note when it cannot be captured.
+    """
+    prefix = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}.get(conn.dialect.name)
+    if prefix is None:
+        return f"(no EXPLAIN support for {conn.dialect.name})"
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return "\n".join(" | ".join(str(value) for value in row) for row in cursor.fetchall())
+    except Exception as exc:
+        return f"(EXPLAIN failed: {exc})"
+    finally:
+        cursor.close()
+
+def _log_slow_statement(conn, statement: str, parameters, executemany: bool, elapsed: float, request_line: str):
+    if executemany:
+        redacted = f"{len(parameters)} parameter sets redacted"
+    else:
+        redacted = f"{len(parameters) if parameters else 0} parameters redacted"
+    plan = ""
+    if settings.SLOW_QUERY_EXPLAIN and not executemany and _sql_operation(statement) in ("SELECT", "WITH"):
+        plan = "\nPlan:\n" + _explain(conn, statement, parameters)
+    slow_query_logger.warning(
+        "Slow statement (%.1f ms, %s) during %s:\n%s%s",
+        elapsed * 1000, redacted, request_line or "no request", statement.strip(), plan,
+    )
+
+def instrument_engine(engine: Engine, engine_label: str):
+    """
+    Times every statement executed through `engine` (for an AsyncEngine, pass
+    its sync_engine) into db_statement_duration_seconds and the statistics of
+    the current request. Does nothing with METRICS_ENABLED off.
+    """
+    if not settings.METRICS_ENABLED:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info["metrics_statement_started"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("metrics_statement_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        DB_STATEMENT_DURATION.observe(elapsed, engine_label, _sql_operation(statement))
+        request_stats = _request_db_stats.get()
+        if request_stats is not None:
+            request_stats.statements += 1
+            request_stats.seconds += elapsed
+        threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        if threshold_ms and elapsed * 1000 >= threshold_ms:
+            _log_slow_statement(conn, statement, parameters, executemany, elapsed,
+                                request_stats.request_line if request_stats is not None else "")
+
+    @event.listens_for(engine, "commit")
+    def _count_commit(conn):
+        request_stats = _request_db_stats.get()
+        if request_stats is not None:
+            request_stats.commits += 1
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if "endpoint" in scope:
+        # Matched a Mount (static files), which sets root_path to the mount point.
+        return f"{scope.get('root_path', '')}/{{path}}"
+    return "<unmatched>"
+
+class MetricsMiddleware:
+    """
+    Plain ASGI middleware that records the request metrics above. Add it last,
+    so it is outermost and its timings include the other middleware.
+
+    With SERVER_TIMING_HEADER on, responses carry the SQL time, statement and
+    commit count of the request as `Server-Timing: db;dur=...`. The header is
+    sent with the status line, so statements run while a response body is still
+    streaming are not included in it.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        started = time.perf_counter()
+        status_code = 500
+        response_size = 0
+        request_stats = RequestDBStats(f"{method} {scope['path']}")
+        token = _request_db_stats.set(request_stats)
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SERVER_TIMING_HEADER:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", request_stats.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.inc(1, method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_PROGRESS.inc(-1, method)
+            _request_db_stats.reset(token)
+            route = _route_label(scope)
+            REQUEST_DURATION.observe(time.perf_counter() - started, method, route, str(status_code))
+            RESPONSE_SIZE.observe(response_size, method, route)
+            REQUEST_DB_TIME.observe(request_stats.seconds, method, route)
+            REQUEST_DB_STATEMENTS.observe(request_stats.statements, method, route)
+
+def render_metrics() -> str:
+    """
+    Returns every metric in the Prometheus text exposition format (version 0.0.4).
+    """
+    lines: List[str] = []
+    for metric in METRICS:
+        lines.extend(metric.expose())
+    return "\n".join(lines) + "\n"
+
+def reset_metrics():
+    """
+    Drops all recorded series (used by the benchmark scripts between runs).
+    """
+    for metric in METRICS:
+        metric.clear()
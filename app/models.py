@@ -1,7 +1,7 @@
 # app/models.py
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
-from datetime import datetime
+from typing import Optional, List, Dict, Union
+from datetime import datetime, date
 from enum import Enum
 
 # Enum for Fixed Cost Frequencies
@@ -43,7 +43,7 @@ class FixedCost(BaseModel):
     cost_frequency: CostFrequency = Field(..., description="Frequency of the fixed cost (Annual, Monthly, One-Off, Initial Investment)")
     category: ExpenseCategory = Field(..., description="Category of the fixed cost")
     recipient: Optional[str] = Field(None, max_length=100, description="Recipient of the fixed cost")
-    cost_date: str = Field(..., description="Date of the fixed cost (YYYY-MM-DD)")
+    cost_date: date = Field(..., description="Date of the fixed cost (YYYY-MM-DD)")
     payment_method: PaymentMethod = Field(..., description="Method of payment for the fixed cost") # New field
     timestamp: Optional[datetime] = Field(None, description="Timestamp of creation/last update")
 
@@ -57,7 +57,7 @@ class DailyExpense(BaseModel):
     amount: float = Field(..., gt=0, description="Amount of the daily expense in Euros")
     description: str = Field(..., min_length=3, max_length=200, description="Description of the daily expense")
     category: ExpenseCategory = Field(..., description="Category of the daily expense")
-    cost_date: str = Field(..., description="Date of the daily expense (YYYY-MM-DD)")
+    cost_date: date = Field(..., description="Date of the daily expense (YYYY-MM-DD)")
     payment_method: PaymentMethod = Field(..., description="Method of payment for the daily expense") # New field
     timestamp: Optional[datetime] = Field(None, description="Timestamp of creation/last update")
 
@@ -68,7 +68,7 @@ class Income(BaseModel):
     Represents an income entry.
     """
     doc_id: Optional[int] = Field(None, validation_alias='id' ,description="Document ID from TinyDB (auto-generated)")
-    income_date: str = Field(..., description="Date of the income (YYYY-MM-DD)")
+    income_date: date = Field(..., description="Date of the income (YYYY-MM-DD)")
     tours_revenue_eur: float = Field(..., ge=0, description="Revenue from tours in Euros")
     transfers_revenue_eur: float = Field(..., ge=0, description="Revenue from transfers in Euros")
     daily_total_eur: Optional[float] = Field(None, description="Calculated daily total income in Euros (not stored in DB)")
@@ -82,7 +82,7 @@ class AggregatedIncome(BaseModel):
     Represents an aggregated income entry for a specific date.
     Note: doc_id is not included as it aggregates multiple records.
     """
-    income_date: str = Field(..., description="Date of the aggregated income (YYYY-MM-DD)")
+    income_date: date = Field(..., description="Date of the aggregated income (YYYY-MM-DD)")
     total_tours_revenue_eur: float = Field(..., ge=0, description="Total revenue from tours for the day in Euros")
     total_transfers_revenue_eur: float = Field(..., ge=0, description="Total revenue from transfers for the day in Euros")
     total_daily_income_eur: float = Field(..., ge=0, description="Total income for the day in Euros")
@@ -100,4 +100,69 @@ class CashOnHand(BaseModel):
     last_updated: Optional[datetime] = Field(None, description="Timestamp of the last update")
 
     model_config = ConfigDict(from_attributes=True)
-    
\ No newline at end of file
+
+class DashboardRecentEntries(BaseModel):
+    """
+    The most recent entries shown in the dashboard tables.
+    """
+    income: List[AggregatedIncome] = Field(..., description="Most recent income, aggregated by date")
+    daily_expenses: List[DailyExpense] = Field(..., description="Most recent daily expenses")
+    fixed_costs: List[FixedCost] = Field(..., description="Most recent fixed costs")
+
+class DashboardSummary(BaseModel):
+    """
+    Represents every figure the dashboard needs for one period, computed in a single request.
+    """
+    period: str = Field(..., description="Summary period ('month' or 'week')")
+    start_date: date = Field(..., description="First day of the period (YYYY-MM-DD)")
+    end_date: date = Field(..., description="Last day of the period (YYYY-MM-DD)")
+    summary: Dict[str, float] = Field(..., description="Expenses, income and net profit/loss for the period")
+    expense_categories: Dict[str, float] = Field(..., description="Expenses by category for the period")
+    income_sources: Dict[str, float] = Field(..., description="Income by source for the period")
+    daily_income_average: float = Field(..., description="Average income over the days with income in the period")
+    cash_on_hand: CashOnHand = Field(..., description="Current cash on hand balance")
+    global_summary: Dict[str, float] = Field(..., description="Expenses, income and net profit/loss across all records")
+    daily_income: Dict[str, AggregatedIncome] = Field(..., description="Income for today and the comparison days")
+    recent: DashboardRecentEntries = Field(..., description="Most recent entries for the dashboard tables")
+
+class CashHistory(BaseModel):
+    """
+    Cash on hand over time as parallel arrays: for every bucket with cash movements,
+    its first day, the net change within it and the balance at its end. Buckets
+    without movements are left out; the balance carries over unchanged.
+    """
+    bucket: str = Field(..., description="Bucket size: 'day', 'week' (starting Monday) or 'month'")
+    start_date: date = Field(..., description="First day of the period (YYYY-MM-DD)")
+    end_date: date = Field(..., description="Last day of the period (YYYY-MM-DD)")
+    opening_balance: float = Field(..., description="Cash on hand at the end of the day before start_date")
+    closing_balance: float = Field(..., description="Cash on hand at the end of end_date")
+    dates: List[date] = Field(..., description="First day of each bucket")
+    changes: List[float] = Field(..., description="Net cash movement within each bucket")
+    balances: List[float] = Field(..., description="Cash on hand at the end of each bucket (or of end_date)")
+
+class SearchHit(BaseModel):
+    """
+    One full-text search result: the matching entry and its relevance score.
+    """
+    entry_type: str = Field(..., description="Table of the entry: 'fixed-costs', 'daily-expenses' or 'income'")
+    doc_id: int = Field(..., description="ID of the entry in its table")
+    entry_date: date = Field(..., description="Date of the entry (YYYY-MM-DD)")
+    score: float = Field(..., description="Relevance of the match; higher is better")
+    entry: Union[FixedCost, DailyExpense, Income] = Field(..., description="The matching entry")
+
+class ImportRowError(BaseModel):
+    """
+    Validation errors of one row of an imported CSV file.
+    """
+    row: int = Field(..., description="Line number of the row in the file (the header is row 1)")
+    errors: List[str] = Field(..., description="What is wrong with the row, one message per field")
+
+class ImportResult(BaseModel):
+    """
+    Outcome of a CSV import. An import is all or nothing: if any row is invalid,
+    nothing is imported and the invalid rows are listed.
+    """
+    table: str = Field(..., description="Table imported into: 'fixed-costs', 'daily-expenses' or 'income'")
+    imported: int = Field(..., description="Number of entries imported")
+    cash_on_hand_delta: float = Field(..., description="Net change applied to the cash on hand balance")
+    errors: List[ImportRowError] = Field(default_factory=list, description="Invalid rows (at most the first 100)")
@@ -0,0 +1,112 @@
+# app/search_index.py
+# Full-text index over the searchable text of every entry.
+#
+# SQLite stores it in an FTS5 virtual table ranked with bm25(); Postgres stores it
+# in a table with a generated tsvector column behind a GIN index, ranked with
+# ts_rank(). Each document is addressed by an integer key that encodes the entry
+# type and ID (see app.database), so updates and deletes touch a single row.
+
+import re
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+SEARCH_TABLE = "search_documents"
+
+_SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+    "content, entry_date UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')",
+]
+
+_POSTGRES_DDL = [
+    f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+    "doc_key BIGINT PRIMARY KEY, content TEXT NOT NULL, entry_date DATE NOT NULL, "
+    "document TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple', content)) STORED)",
+    f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document ON {SEARCH_TABLE} USING GIN (document)",
+]
+
+def _is_postgres(bind) -> bool:
+    return bind.dialect.name == "postgresql"
+
+def create_search_index(connection):
+    """
+    Creates the search table if it does not exist yet.
+    """
+    for statement in (_POSTGRES_DDL if _is_postgres(connection) else _SQLITE_DDL):
+        connection.execute(text(statement))
+
+def index_document(db_session: Session, doc_key: int, content: str, entry_date: date):
+    """
+    Inserts or replaces one document in the caller's transaction.
+    """
+    params = {"doc_key": doc_key, "content": content, "entry_date": entry_date}
+    if _is_postgres(db_session.bind):
+        db_session.execute(text(
+            f"INSERT INTO {SEARCH_TABLE} (doc_key, content, entry_date) VALUES (:doc_key, :content, :entry_date) "
+            "ON CONFLICT (doc_key) DO UPDATE SET content = EXCLUDED.content, entry_date = EXCLUDED.entry_date"
+        ), params)
+    else:
+        db_session.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :doc_key"), params)
+        db_session.execute(text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, content, entry_date) VALUES (:doc_key, :content, :entry_date)"
+        ), {**params, "entry_date": entry_date.isoformat()})
+
+def index_documents(db_session: Session, documents: List[Dict[str, Any]]):
+    """
+    Inserts or replaces many documents (dicts with doc_key, content and entry_date)
+    with one executemany per statement, in the caller's transaction.
+    """
+    if not documents:
+        return
+    if _is_postgres(db_session.bind):
+        db_session.execute(text(
+            f"INSERT INTO {SEARCH_TABLE} (doc_key, content, entry_date) VALUES (:doc_key, :content, :entry_date) "
+            "ON CONFLICT (doc_key) DO UPDATE SET content = EXCLUDED.content, entry_date = EXCLUDED.entry_date"
+        ), documents)
+    else:
+        db_session.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :doc_key"), [{"doc_key": document["doc_key"]} for document in documents])
+        db_session.execute(text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, content, entry_date) VALUES (:doc_key, :content, :entry_date)"
+        ), [{**document, "entry_date": document["entry_date"].isoformat()} for document in documents])
+
+def remove_document(db_session: Session, doc_key: int):
+    key_column = "doc_key" if _is_postgres(db_session.bind) else "rowid"
+    db_session.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE {key_column} = :doc_key"), {"doc_key": doc_key})
+
+def clear_documents(db_session: Session):
+    db_session.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+
+def has_documents(db_session: Session) -> bool:
+    return db_session.execute(text(f"SELECT 1 FROM {SEARCH_TABLE} LIMIT 1")).first() is not None
+
+def _query_terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query.lower())
+
+def match_documents(db_session: Session, query: str, limit: int, offset: int = 0) -> List[Tuple[int, float]]:
+    """
+    Returns (doc_key, score) pairs for documents containing every term of the query
+    (each term also matches as a prefix), best match first. Higher scores are better.
+    """
+    terms = _query_terms(query)
+    if not terms:
+        return []
+    params = {"limit": limit, "offset": offset}
+    if _is_postgres(db_session.bind):
+        params["query"] = " & ".join(f"{term}:*" for term in terms)
+        rows = db_session.execute(text(
+            f"SELECT doc_key, ts_rank(document, query) AS score "
+            f"FROM {SEARCH_TABLE}, to_tsquery('simple', :query) AS query "
+            "WHERE document @@ query ORDER BY score DESC, entry_date DESC, doc_key DESC "
+            "LIMIT :limit OFFSET :offset"
+        ), params).all()
+    else:
+        params["query"] = " ".join(f'"{term}"*' for term in terms)
+        # bm25() is lower for better matches, so it is negated into a score.
+        rows = db_session.execute(text(
+            f"SELECT rowid, -bm25({SEARCH_TABLE}) AS score FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH :query ORDER BY score DESC, entry_date DESC, rowid DESC "
+            "LIMIT :limit OFFSET :offset"
+        ), params).all()
+    return [(int(doc_key), float(score)) for doc_key, score in rows]
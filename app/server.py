@@ -0,0 +1,50 @@
+# app/server.py
+# Production entry point: runs the API in SERVER_WORKERS uvicorn worker processes.
+#
+# The database is initialised once here, before the workers start, and the
+# workers are told to skip the startup hook's initialisation. Each worker keeps
+# its own summary cache; with more than one worker they stay coherent through
+# the cache_invalidations table (see app.database). The workers load main:app,
+# which sets up the application's logging like the development entry point.
+#
+# Usage (from the repository root):
+#   python -m app.server
+#   SERVER_WORKERS=4 python -m app.server
+
+import logging
+import os
+
+import uvicorn
+
+from app.config import settings
+from app.logging import configure_logging
+
+# Named explicitly: under `python -m app.server` __name__ is "__main__".
+logger = logging.getLogger("app.server")
+
+def main():
+    configure_logging()
+    # LOG_LEVEL defaults to WARNING; the server's own messages follow uvicorn's level.
+    logger.setLevel(settings.SERVER_LOG_LEVEL.upper())
+    from app.api.routes import initialize_database
+    from app.database import async_engine, engine
+
+    initialize_database()
+    # Workers are separate interpreters that read their settings from the environment.
+    os.environ["DATABASE_INIT_ON_STARTUP"] = "false"
+    settings.DATABASE_INIT_ON_STARTUP = False
+    engine.dispose()
+    async_engine.sync_engine.dispose()
+
+    logger.info("Starting %d worker(s) on %s:%d.", settings.SERVER_WORKERS, settings.SERVER_HOST, settings.SERVER_PORT)
+    uvicorn.run(
+        "main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=settings.SERVER_WORKERS,
+        access_log=settings.SERVER_ACCESS_LOG,
+        log_level=settings.SERVER_LOG_LEVEL.lower(),
+    )
+
+if __name__ == "__main__":
+    main()
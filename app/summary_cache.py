@@ -0,0 +1,129 @@
+# app/summary_cache.py
+# Bounded in-process LRU cache for the summary functions in app.database.
+#
+# Entries are keyed by function name and the inclusive date range they cover.
+# Writes evict only the entries whose range contains a written date; entries
+# without a range (all-time totals) are evicted by every write.
+
+import copy
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from app.config import settings
+
+DateRange = Optional[Tuple[date, date]]
+
+class SummaryCache:
+    """
+    Thread-safe LRU cache. A generation counter, bumped on every invalidation,
+    keeps a value computed concurrently with a write from being stored after
+    that write has already evicted the range.
+    """
+    def __init__(self, max_entries: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        # Called with the summary function's session before every lookup; lets
+        # app.database apply invalidations made by other worker processes.
+        self.sync_hook: Optional[Callable[[Any], None]] = None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[DateRange, Any]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, key: Hashable, date_range: DateRange, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+            generation = self._generation
+
+        value = compute()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (date_range, copy.deepcopy(value))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate_dates(self, dates: Iterable[date]):
+        """
+        Evicts every entry whose date range contains one of the given dates.
+        """
+        dates = set(dates)
+        with self._lock:
+            self._generation += 1
+            stale_keys = [
+                key for key, (date_range, _) in self._entries.items()
+                if date_range is None or any(date_range[0] <= day <= date_range[1] for day in dates)
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += len(stale_keys)
+
+    def invalidate_range(self, start_date: date, end_date: date):
+        """
+        Evicts every entry whose date range overlaps start_date..end_date.
+        """
+        with self._lock:
+            self._generation += 1
+            stale_keys = [
+                key for key, (date_range, _) in self._entries.items()
+                if date_range is None or (date_range[0] <= end_date and start_date <= date_range[1])
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += len(stale_keys)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+summary_cache = SummaryCache(settings.SUMMARY_CACHE_MAX_ENTRIES, enabled=settings.SUMMARY_CACHE_ENABLED)
+
+def cached_summary(date_range: Callable[..., DateRange]):
+    """
+    Caches a `fn(db_session, *args)` summary function. `date_range` receives the
+    remaining arguments and returns the inclusive (start, end) dates the result
+    depends on, or None if it depends on every date.
+    """
+    def decorator(summary_fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(summary_fn)
+        def wrapper(db_session, *args: Any, **kwargs: Any) -> Any:
+            if not summary_cache.enabled:
+                return summary_fn(db_session, *args, **kwargs)
+            if summary_cache.sync_hook is not None:
+                summary_cache.sync_hook(db_session)
+            period = date_range(*args, **kwargs)
+            return summary_cache.get_or_compute(
+                (summary_fn.__name__, period), period, lambda: summary_fn(db_session, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
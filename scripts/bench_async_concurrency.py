@@ -0,0 +1,124 @@
+# scripts/bench_async_concurrency.py
+# Before/after benchmark for the async database path.
+#
+# Runs the same burst of concurrent dashboard-style summary queries twice inside
+# one event loop: first with the synchronous app.database functions called
+# directly from coroutines (the old `async def` router behaviour), then through
+# app.async_database on the asyncio engine. A probe coroutine measures how long
+# the event loop is stalled, which is what every other request on the worker
+# would have to wait for.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_async_concurrency --rows 200000 --clients 20
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+parser = argparse.ArgumentParser(description="Benchmark sync vs async database access under concurrency.")
+parser.add_argument("--rows", type=int, default=200_000, help="Number of daily expense rows to seed.")
+parser.add_argument("--clients", type=int, default=20, help="Number of concurrent dashboard loads.")
+parser.add_argument("--rounds", type=int, default=3, help="Summary calls per dashboard load.")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_async.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+# Measure the queries themselves, not summary cache hits.
+os.environ.setdefault("SUMMARY_CACHE_ENABLED", "false")
+
+from sqlalchemy import insert
+
+from app import database, async_database
+from app.database import SessionLocal, AsyncSessionLocal, DBDailyExpense, create_all_tables
+from app.models import ExpenseCategory, PaymentMethod
+
+def seed(rows: int):
+    create_all_tables()
+    with SessionLocal() as db_session:
+        if db_session.query(DBDailyExpense).count() >= rows:
+            return
+        rng = random.Random(42)
+        categories = list(ExpenseCategory)
+        payment_methods = list(PaymentMethod)
+        start = date.today() - timedelta(days=730)
+        batch = []
+        for _ in range(rows):
+            batch.append({
+                "amount": round(rng.uniform(5, 150), 2),
+                "description": "Benchmark expense",
+                "category": rng.choice(categories),
+                "cost_date": start + timedelta(days=rng.randrange(730)),
+                "payment_method": rng.choice(payment_methods),
+            })
+            if len(batch) == 10_000:
+                db_session.execute(insert(DBDailyExpense), batch)
+                batch = []
+        if batch:
+            db_session.execute(insert(DBDailyExpense), batch)
+        db_session.commit()
+        database.rebuild_daily_rollup(db_session)
+
+async def probe_loop_lag(stop: asyncio.Event, lags: list):
+    interval = 0.005
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - started - interval) * 1000)
+
+async def blocking_dashboard_load(rounds: int):
+    # The pre-async router pattern: synchronous session inside a coroutine.
+    db_session = SessionLocal()
+    try:
+        for _ in range(rounds):
+            database.get_global_summary(db_session)
+            database.get_yearly_summary(db_session, date.today().year)
+    finally:
+        db_session.close()
+
+async def async_dashboard_load(rounds: int):
+    async with AsyncSessionLocal() as db_session:
+        for _ in range(rounds):
+            await async_database.get_global_summary(db_session)
+            await async_database.get_yearly_summary(db_session, date.today().year)
+
+async def run_scenario(name: str, load, clients: int, rounds: int) -> dict:
+    stop = asyncio.Event()
+    lags: list = []
+    probe = asyncio.create_task(probe_loop_lag(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(load(rounds) for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    lags = lags or [0.0]
+    return {
+        "scenario": name,
+        "wall_s": round(elapsed, 3),
+        "loads_per_s": round(clients / elapsed, 2),
+        "probe_ticks": len(lags),
+        "loop_lag_p50_ms": round(statistics.median(lags), 2),
+        "loop_lag_max_ms": round(max(lags), 2),
+    }
+
+async def main():
+    seed(args.rows)
+    # Warm both connection pools before measuring.
+    await blocking_dashboard_load(1)
+    await async_dashboard_load(1)
+    results = [
+        await run_scenario("before: sync session in async def", blocking_dashboard_load, args.clients, args.rounds),
+        await run_scenario("after: AsyncSession", async_dashboard_load, args.clients, args.rounds),
+    ]
+    print(f"rows={args.rows} clients={args.clients} rounds={args.rounds} db={database.SQLALCHEMY_DATABASE_URL}")
+    for result in results:
+        print(result)
+    await database.async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
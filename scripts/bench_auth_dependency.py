@@ -0,0 +1,73 @@
+# scripts/bench_auth_dependency.py
+# Microbenchmark of the per-request cost of the authentication dependencies.
+#
+# Calls get_current_user and get_current_user_optional directly on requests
+# carrying the same cookie or bearer token over and over, the way the
+# dashboard's burst of API calls does, first with the verified-token cache
+# disabled (a full jwt.decode every time) and then with it enabled.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_auth_dependency --calls 20000
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(description="Benchmark the authentication dependency per request.")
+parser.add_argument("--calls", type=int, default=20_000, help="Dependency calls per scenario.")
+parser.add_argument("--repeats", type=int, default=5, help="Timed repetitions per scenario (the median is reported).")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_auth.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from starlette.requests import Request
+
+from app.api.auth_utils import create_access_token, get_current_user, get_current_user_optional, token_cache
+
+logging.disable(logging.WARNING)
+
+def build_scope(headers: dict) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/summary/dashboard",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    }
+
+async def time_calls(dependency, scope: dict, calls: int) -> float:
+    # A fresh Request per call, so header and cookie parsing is measured too.
+    started = time.perf_counter()
+    for _ in range(calls):
+        await dependency(Request(scope))
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+async def main():
+    token = create_access_token(data={"sub": "bench_user"})
+    scopes = {
+        "cookie": build_scope({"Cookie": f"access_token={token}"}),
+        "bearer": build_scope({"Authorization": f"Bearer {token}"}),
+    }
+    dependencies = {"get_current_user": get_current_user, "get_current_user_optional": get_current_user_optional}
+
+    print(f"calls={args.calls} repeats={args.repeats} (median microseconds per call)")
+    for dependency_name, dependency in dependencies.items():
+        for source, scope in scopes.items():
+            timings = {}
+            for cached in (False, True):
+                token_cache.enabled = cached
+                token_cache.clear()
+                timings[cached] = statistics.median([
+                    await time_calls(dependency, scope, args.calls) for _ in range(args.repeats)
+                ])
+            print(f"{dependency_name:<26} {source:<7} uncached {timings[False]:8.2f} us   "
+                  f"cached {timings[True]:6.2f} us   {timings[False] / timings[True]:5.1f}x")
+    print(token_cache.stats())
+
+if __name__ == "__main__":
+    asyncio.run(main())
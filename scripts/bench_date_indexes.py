@@ -0,0 +1,154 @@
+# scripts/bench_date_indexes.py
+# Benchmarks the summary functions against large tables with and without the
+# date indexes on fixed_costs, daily_expenses and income.
+#
+# Seeds --rows rows per table (1M by default) spread over several years, then
+# times each summary function with the composite (date, category) / (date)
+# indexes in place and again after dropping them, and prints the query plan
+# the database chose for a monthly range filter.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_date_indexes --rows 1000000
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+parser = argparse.ArgumentParser(description="Benchmark summary queries with and without date indexes.")
+parser.add_argument("--rows", type=int, default=1_000_000, help="Rows to seed per table.")
+parser.add_argument("--years", type=int, default=5, help="Number of years the seeded dates span.")
+parser.add_argument("--repeat", type=int, default=5, help="Timed runs per summary function.")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_date_indexes.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+# Measure the queries themselves, not summary cache hits.
+os.environ.setdefault("SUMMARY_CACHE_ENABLED", "false")
+
+from sqlalchemy import insert, select, func
+
+from app import database
+from app.database import SessionLocal, engine, create_all_tables, DBFixedCost, DBDailyExpense, DBIncome, DBDailyRollup, Base
+from app.models import ExpenseCategory, PaymentMethod, CostFrequency
+
+BATCH_SIZE = 50_000
+
+def seed(rows: int, years: int):
+    create_all_tables()
+    rng = random.Random(1234)
+    first_day = date.today().replace(month=1, day=1) - timedelta(days=365 * (years - 1))
+    span_days = 365 * years
+    categories = list(ExpenseCategory)
+    payment_methods = list(PaymentMethod)
+    frequencies = list(CostFrequency)
+
+    def random_day() -> date:
+        return first_day + timedelta(days=rng.randrange(span_days))
+
+    generators = {
+        DBDailyExpense: lambda: {
+            "amount": round(rng.uniform(5, 150), 2), "description": "Benchmark expense",
+            "category": rng.choice(categories), "cost_date": random_day(),
+            "payment_method": rng.choice(payment_methods),
+        },
+        DBFixedCost: lambda: {
+            "amount_eur": round(rng.uniform(50, 1000), 2), "description": "Benchmark fixed cost",
+            "cost_frequency": rng.choice(frequencies), "category": rng.choice(categories),
+            "recipient": "Vendor", "cost_date": random_day(), "payment_method": rng.choice(payment_methods),
+        },
+        DBIncome: lambda: {
+            "income_date": random_day(), "tours_revenue_eur": round(rng.uniform(20, 500), 2),
+            "transfers_revenue_eur": round(rng.uniform(10, 300), 2), "hours_worked": round(rng.uniform(2, 10), 2),
+        },
+    }
+    with SessionLocal() as db_session:
+        for model, make_row in generators.items():
+            existing = db_session.scalar(select(func.count()).select_from(model))
+            remaining = rows - existing
+            started = time.perf_counter()
+            while remaining > 0:
+                batch_size = min(BATCH_SIZE, remaining)
+                db_session.execute(insert(model), [make_row() for _ in range(batch_size)])
+                remaining -= batch_size
+            db_session.commit()
+            if existing < rows:
+                print(f"seeded {model.__tablename__}: {rows - existing} rows in {time.perf_counter() - started:.1f}s")
+        database.rebuild_daily_rollup(db_session)
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    with SessionLocal() as db_session:
+        fn(db_session)  # warm the page cache
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn(db_session)
+            samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+def run_suite(repeat: int) -> dict:
+    today = datetime.now()
+    week_start = today - timedelta(days=today.weekday())
+    week_end = week_start + timedelta(days=6)
+    suite = {
+        "monthly": lambda s: database.get_monthly_summary(s, today.year, today.month),
+        "expense_categories": lambda s: database.get_expense_categories_summary(s, today.year, today.month),
+        "income_sources": lambda s: database.get_income_sources_summary(s, today.year, today.month),
+        "weekly": lambda s: database.get_weekly_summary(s, week_start, week_end),
+        "weekly_expense_categories": lambda s: database.get_weekly_expense_categories_summary(s, week_start, week_end),
+        "daily_income_average": lambda s: database.get_daily_income_average_for_period(s, today - timedelta(days=30), today),
+        "single_day_income": lambda s: database.get_single_day_income_summary(s, today),
+        "yearly": lambda s: database.get_yearly_summary(s, today.year),
+        "global": lambda s: database.get_global_summary(s),
+    }
+    return {name: round(timed(fn, repeat), 2) for name, fn in suite.items()}
+
+def explain_monthly_filter() -> str:
+    today = date.today()
+    query = select(func.sum(DBDailyExpense.amount)).where(
+        DBDailyExpense.cost_date >= today.replace(day=1),
+        DBDailyExpense.cost_date <= today,
+    )
+    with engine.connect() as connection:
+        compiled = query.compile(connection, compile_kwargs={"literal_binds": True})
+        prefix = "EXPLAIN QUERY PLAN" if connection.dialect.name == "sqlite" else "EXPLAIN"
+        rows = connection.exec_driver_sql(f"{prefix} {compiled}").all()
+    return " | ".join(str(row[-1]) for row in rows)
+
+def date_indexes():
+    # Only the entry tables; the daily_rollup index is not a date index.
+    return [
+        index for table in Base.metadata.sorted_tables for index in table.indexes
+        if not index.name.endswith("_id") and table.name != DBDailyRollup.__tablename__
+    ]
+
+def main():
+    seed(args.rows, args.years)
+    print(f"rows per table={args.rows} db={database.SQLALCHEMY_DATABASE_URL}")
+
+    with_indexes = run_suite(args.repeat)
+    plan_with = explain_monthly_filter()
+
+    for index in date_indexes():
+        index.drop(bind=engine, checkfirst=True)
+    try:
+        without_indexes = run_suite(args.repeat)
+        plan_without = explain_monthly_filter()
+    finally:
+        for index in date_indexes():
+            index.create(bind=engine, checkfirst=True)
+
+    print(f"{'summary':<28}{'no index (ms)':>16}{'indexed (ms)':>16}{'speedup':>10}")
+    for name, indexed_ms in with_indexes.items():
+        baseline_ms = without_indexes[name]
+        speedup = baseline_ms / indexed_ms if indexed_ms else float("inf")
+        print(f"{name:<28}{baseline_ms:>16.2f}{indexed_ms:>16.2f}{speedup:>9.1f}x")
+    print(f"plan without indexes: {plan_without}")
+    print(f"plan with indexes:    {plan_with}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# scripts/bench_json_responses.py
+# Before/after benchmark for JSON serialization of large list responses.
+#
+# Seeds every entry table up to each requested size and times full in-process
+# GET requests against the list endpoints, once with FAST_JSON_RESPONSES off
+# (the rows become models, which FastAPI re-validates against response_model and
+# encodes with json.dumps) and once on (a single typed dump_json of the rows).
+# Both bodies are checked to decode to the same JSON. The serialization step
+# alone is timed too, since loading the rows is the same in both modes.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_json_responses --rows 10000 100000
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import get_args
+
+parser = argparse.ArgumentParser(description="Benchmark standard vs fast JSON list responses.")
+parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Table sizes to measure at.")
+parser.add_argument("--repeats", type=int, default=3, help="Requests per endpoint and mode (the median is reported).")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_json.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+# Measure serialization, not summary cache hits.
+os.environ.setdefault("SUMMARY_CACHE_ENABLED", "false")
+
+import httpx
+from fastapi.routing import serialize_response
+from sqlalchemy import func, insert
+
+from app import database
+from app.api.auth_utils import create_access_token
+from app.api.fast_json import _row_list_adapter, _type_adapter
+from app.api.routes import app
+from app.config import settings
+from app.database import SessionLocal, DBDailyExpense, DBFixedCost, DBIncome, create_all_tables
+from app.models import CostFrequency, ExpenseCategory, PaymentMethod
+
+logging.disable(logging.INFO)
+
+ENDPOINTS = {
+    "/daily-expenses/": database.get_daily_expenses_page,
+    "/fixed-costs/": database.get_fixed_costs_page,
+    "/income/all-individual": database.get_income_page,
+    "/income/": database.get_aggregated_income_by_date,
+}
+
+def random_rows(model, count: int, rng: random.Random) -> list:
+    start = date.today() - timedelta(days=1095)
+    rows = []
+    for _ in range(count):
+        day = start + timedelta(days=rng.randrange(1095))
+        if model is DBDailyExpense:
+            rows.append({"amount": round(rng.uniform(5, 150), 2), "description": "Benchmark expense",
+                         "category": rng.choice(list(ExpenseCategory)), "cost_date": day,
+                         "payment_method": rng.choice(list(PaymentMethod))})
+        elif model is DBFixedCost:
+            rows.append({"amount_eur": round(rng.uniform(20, 900), 2), "description": "Benchmark fixed cost",
+                         "cost_frequency": rng.choice(list(CostFrequency)), "category": rng.choice(list(ExpenseCategory)),
+                         "recipient": "Benchmark recipient", "cost_date": day, "payment_method": rng.choice(list(PaymentMethod))})
+        else:
+            rows.append({"income_date": day, "tours_revenue_eur": round(rng.uniform(0, 400), 2),
+                         "transfers_revenue_eur": round(rng.uniform(0, 100), 2), "hours_worked": round(rng.uniform(1, 10), 1)})
+    return rows
+
+def seed(rows: int):
+    rng = random.Random(rows)
+    with SessionLocal() as db_session:
+        for model in (DBDailyExpense, DBFixedCost, DBIncome):
+            missing = rows - db_session.query(func.count(model.id)).scalar()
+            while missing > 0:
+                batch = min(missing, 10_000)
+                db_session.execute(insert(model), random_rows(model, batch, rng))
+                missing -= batch
+        db_session.commit()
+
+async def time_endpoint(client: httpx.AsyncClient, path: str, headers: dict, fast: bool):
+    settings.FAST_JSON_RESPONSES = fast
+    timings, body = [], None
+    for _ in range(args.repeats):
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        body = response.content
+    return statistics.median(timings), body
+
+async def time_serialization(path: str) -> tuple:
+    """
+    Milliseconds to turn the endpoint's rows into JSON bytes: building the models
+    plus FastAPI's response model validation and json.dumps, and a single typed
+    dump_json of the rows.
+    """
+    route = next(route for route in app.routes if getattr(route, "path", None) == path and "GET" in route.methods)
+    (model,) = get_args(route.response_model)
+    with SessionLocal() as db_session:
+        rows = ENDPOINTS[path](db_session)
+    started = time.perf_counter()
+    content = _type_adapter(route.response_model).validate_python(rows, by_name=True)
+    encoded = await serialize_response(field=route.response_field, response_content=content, is_coroutine=True)
+    json.dumps(encoded, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    standard_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    _row_list_adapter(model).dump_json(rows)
+    return standard_ms, (time.perf_counter() - started) * 1000
+
+async def main():
+    create_all_tables()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'bench_user'})}"}
+    transport = httpx.ASGITransport(app=app)
+    print(f"repeats={args.repeats} db={database.SQLALCHEMY_DATABASE_URL} (median milliseconds per request)")
+    async with httpx.AsyncClient(transport=transport, base_url="https://testserver", timeout=None) as client:
+        for rows in sorted(args.rows):
+            seed(rows)
+            for path in ENDPOINTS:
+                standard_ms, standard_body = await time_endpoint(client, path, headers, fast=False)
+                fast_ms, fast_body = await time_endpoint(client, path, headers, fast=True)
+                same = json.loads(standard_body) == json.loads(fast_body)
+                standard_serialize_ms, fast_serialize_ms = await time_serialization(path)
+                print(f"rows={rows:<7} {path:<24} {len(fast_body) / 1e6:5.1f} MB   request: standard {standard_ms:7.1f} ms "
+                      f"fast {fast_ms:7.1f} ms   serialization: standard {standard_serialize_ms:6.1f} ms "
+                      f"fast {fast_serialize_ms:6.1f} ms   identical={same}")
+    await database.async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
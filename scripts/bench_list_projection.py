@@ -0,0 +1,112 @@
+# scripts/bench_list_projection.py
+# Before/after benchmark for reading the list endpoints' rows.
+#
+# For each entry table, loads every row and serializes it to JSON twice: the old
+# way (ORM entities through the session, Model.model_validate per row, the
+# income total added in Python, TypeAdapter.dump_json of the models) and through
+# the column projections of app.database (plain dicts, typed dump_json). Reports
+# wall time and, in a separate traced run, peak Python memory.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_list_projection --rows 10000 100000
+
+import argparse
+import gc
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import List
+
+parser = argparse.ArgumentParser(description="Benchmark ORM vs projected reads for the list endpoints.")
+parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Table sizes to measure at.")
+parser.add_argument("--repeats", type=int, default=3, help="Timed runs per table and method (the median is reported).")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_projection.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import func, insert
+
+from app import database
+from app.api.fast_json import _row_list_adapter, _type_adapter
+from app.database import SessionLocal, DBDailyExpense, DBFixedCost, DBIncome, create_all_tables
+from app.models import CostFrequency, DailyExpense, ExpenseCategory, FixedCost, Income, PaymentMethod
+
+logging.disable(logging.INFO)
+
+TABLES = {
+    "daily_expenses": (DBDailyExpense, DailyExpense, database.get_daily_expenses_page),
+    "fixed_costs": (DBFixedCost, FixedCost, database.get_fixed_costs_page),
+    "income": (DBIncome, Income, database.get_income_page),
+}
+
+def random_row(model, day: date, rng: random.Random) -> dict:
+    if model is DBDailyExpense:
+        return {"amount": round(rng.uniform(5, 150), 2), "description": "Benchmark expense",
+                "category": rng.choice(list(ExpenseCategory)), "cost_date": day, "payment_method": rng.choice(list(PaymentMethod))}
+    if model is DBFixedCost:
+        return {"amount_eur": round(rng.uniform(20, 900), 2), "description": "Benchmark fixed cost",
+                "cost_frequency": rng.choice(list(CostFrequency)), "category": rng.choice(list(ExpenseCategory)),
+                "recipient": "Benchmark recipient", "cost_date": day, "payment_method": rng.choice(list(PaymentMethod))}
+    return {"income_date": day, "tours_revenue_eur": round(rng.uniform(0, 400), 2),
+            "transfers_revenue_eur": round(rng.uniform(0, 100), 2), "hours_worked": round(rng.uniform(1, 10), 1)}
+
+def seed(rows: int):
+    rng = random.Random(rows)
+    start = date.today() - timedelta(days=1095)
+    with SessionLocal() as db_session:
+        for model, _, _ in TABLES.values():
+            missing = rows - db_session.query(func.count(model.id)).scalar()
+            while missing > 0:
+                batch = min(missing, 10_000)
+                db_session.execute(insert(model), [random_row(model, start + timedelta(days=rng.randrange(1095)), rng) for _ in range(batch)])
+                missing -= batch
+        db_session.commit()
+
+def orm_read(db_model, schema) -> bytes:
+    # The pre-projection read path.
+    with SessionLocal() as db_session:
+        entries = [schema.model_validate(entry) for entry in db_session.query(db_model).order_by(db_model.id.desc()).all()]
+        if schema is Income:
+            for entry in entries:
+                entry.daily_total_eur = entry.tours_revenue_eur + entry.transfers_revenue_eur
+        return _type_adapter(List[schema]).dump_json(entries)
+
+def projected_read(schema, page_function) -> bytes:
+    with SessionLocal() as db_session:
+        return _row_list_adapter(schema).dump_json(page_function(db_session))
+
+def measure(read) -> tuple:
+    timings = []
+    for _ in range(args.repeats):
+        gc.collect()
+        started = time.perf_counter()
+        read()
+        timings.append((time.perf_counter() - started) * 1000)
+    gc.collect()
+    tracemalloc.start()
+    read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1e6
+
+def main():
+    create_all_tables()
+    print(f"repeats={args.repeats} db={database.SQLALCHEMY_DATABASE_URL} (median ms, peak traced MB)")
+    for rows in sorted(args.rows):
+        seed(rows)
+        for table, (db_model, schema, page_function) in TABLES.items():
+            orm_ms, orm_mb = measure(lambda: orm_read(db_model, schema))
+            projected_ms, projected_mb = measure(lambda: projected_read(schema, page_function))
+            print(f"rows={rows:<7} {table:<15} ORM + models {orm_ms:8.1f} ms {orm_mb:7.1f} MB   "
+                  f"projection {projected_ms:8.1f} ms {projected_mb:7.1f} MB   "
+                  f"{orm_ms / projected_ms:4.1f}x faster, {orm_mb / projected_mb:4.1f}x less memory")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# scripts/bench_logging.py
+# Before/after benchmark for the logging cost of a request.
+#
+# Replays the log calls of a typical write request (router plus database lines,
+# including the dict of updates) and measures the time they take in the calling
+# thread under several setups: the old synchronous RotatingFileHandler and
+# StreamHandler with eager f-strings, the queued handlers of app.logging in text
+# and JSON mode, per-logger sampling, and the default WARNING level, where eager
+# f-strings are still built although nothing is written. The console handler
+# writes to os.devnull so the terminal does not skew the numbers.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_logging --requests 20000
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+parser = argparse.ArgumentParser(description="Benchmark per-request logging cost.")
+parser.add_argument("--requests", type=int, default=20_000, help="Simulated requests per scenario.")
+parser.add_argument("--repeats", type=int, default=3, help="Timed runs per scenario (the median is reported).")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_logging.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app import logging as app_logging
+from app.config import settings
+
+router_logger = logging.getLogger("app.api.routers.daily_expenses")
+database_logger = logging.getLogger("app.database")
+
+UPDATES = {"amount": 42.5, "description": "Groceries at the market", "category": "Food", "payment_method": "Cash"}
+
+def eager_request(doc_id: int):
+    # The pre-change call sites.
+    router_logger.info(f"Attempting to update daily expense with ID {doc_id} with updates: {UPDATES}")
+    database_logger.info(f"Updated daily expense with ID {doc_id}. Changes: {UPDATES}")
+    database_logger.info(f"Daily expense {doc_id} update adjusted cash on hand by {-12.5:.2f}.")
+    database_logger.info(f"Cash on hand updated by {-12.5:.2f}.")
+    router_logger.info(f"Daily expense with ID {doc_id} updated successfully.")
+
+def lazy_request(doc_id: int):
+    router_logger.info("Attempting to update daily expense with ID %s with updates: %s", doc_id, UPDATES)
+    database_logger.info("Updated daily expense with ID %s. Changes: %s", doc_id, UPDATES)
+    database_logger.info("Daily expense %s update adjusted cash on hand by %.2f.", doc_id, -12.5)
+    database_logger.info("Cash on hand updated by %.2f.", -12.5)
+    router_logger.info("Daily expense with ID %s updated successfully.", doc_id)
+
+def configure_legacy(log_dir: Path, level: str):
+    # The pre-change configure_logging, with the console sent to os.devnull.
+    root = logging.getLogger()
+    root.setLevel(level)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = RotatingFileHandler(log_dir / 'app.log', maxBytes=1024 * 1024 * 5, backupCount=5)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(open(os.devnull, "w"))
+    stream_handler.setFormatter(formatter)
+    root.addHandler(file_handler)
+    root.addHandler(stream_handler)
+    return lambda: [(root.removeHandler(handler), handler.close()) for handler in (file_handler, stream_handler)]
+
+def configure_queued(log_dir: Path, level: str, log_format: str = "text", sample_rates: dict = None):
+    settings.LOG_LEVEL = level
+    settings.LOG_FORMAT = log_format
+    settings.LOG_SAMPLE_RATES = sample_rates or {}
+    console, sys.stderr = sys.stderr, open(os.devnull, "w")
+    try:
+        # The StreamHandler binds sys.stderr when it is created.
+        app_logging.configure_logging(log_dir)
+    finally:
+        sys.stderr = console
+    return app_logging.stop_logging
+
+SCENARIOS = [
+    ("sync handlers, f-strings, INFO (before)", configure_legacy, eager_request, {"level": "INFO"}),
+    ("queue, lazy, INFO", configure_queued, lazy_request, {"level": "INFO"}),
+    ("queue, lazy, INFO, JSON", configure_queued, lazy_request, {"level": "INFO", "log_format": "json"}),
+    ("queue, lazy, INFO, sampled 0.1", configure_queued, lazy_request,
+     {"level": "INFO", "sample_rates": {"app.database": 0.1, "app.api.routers.daily_expenses": 0.1}}),
+    ("sync handlers, f-strings, WARNING (before)", configure_legacy, eager_request, {"level": "WARNING"}),
+    ("queue, lazy, WARNING", configure_queued, lazy_request, {"level": "WARNING"}),
+]
+
+def run(configure, request, options) -> float:
+    with tempfile.TemporaryDirectory() as log_dir:
+        teardown = configure(Path(log_dir), **options)
+        try:
+            for doc_id in range(200):
+                request(doc_id)
+            started = time.perf_counter()
+            for doc_id in range(args.requests):
+                request(doc_id)
+            elapsed = time.perf_counter() - started
+        finally:
+            # Draining the queue is deliberately left out of the timing: it runs
+            # on the listener thread, not the request's.
+            teardown()
+    return elapsed / args.requests * 1_000_000
+
+def main():
+    print(f"requests={args.requests} repeats={args.repeats} (microseconds of logging per request, median)")
+    results = {name: [] for name, *_ in SCENARIOS}
+    # Alternate the scenarios so machine noise affects them alike.
+    for _ in range(args.repeats):
+        for name, configure, request, options in SCENARIOS:
+            results[name].append(run(configure, request, options))
+    for name, timings in results.items():
+        print(f"{name:<45} {statistics.median(timings):8.2f} us")
+
+if __name__ == "__main__":
+    main()
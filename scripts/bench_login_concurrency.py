@@ -0,0 +1,121 @@
+# scripts/bench_login_concurrency.py
+# Before/after benchmark for the login path under mixed traffic.
+#
+# Runs a burst of concurrent logins while other clients keep calling an ordinary
+# authenticated endpoint, all in-process against the ASGI app. The "before"
+# scenario uses a copy of the old handler, which hashed the demo password and
+# verified it with bcrypt inline in the coroutine; the "after" scenario uses the
+# real /login/token. The latency of the ordinary requests shows how much the
+# logins hold up everyone else on the worker.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_login_concurrency --logins 40 --api-clients 8 --rounds 12
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(description="Benchmark logins alongside normal API traffic.")
+parser.add_argument("--logins", type=int, default=40, help="Total number of logins in the burst.")
+parser.add_argument("--login-clients", type=int, default=8, help="Concurrent clients sharing the logins.")
+parser.add_argument("--api-clients", type=int, default=8, help="Concurrent clients calling /summary/cash-on-hand.")
+parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor (PASSWORD_HASH_ROUNDS).")
+parser.add_argument("--verify-workers", type=int, default=2, help="Password verification threads (PASSWORD_VERIFY_WORKERS).")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_login.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["DEMO_USERNAME"] = "bench_user"
+os.environ["DEMO_PASSWORD"] = "bench-password"
+os.environ["PASSWORD_HASH_ROUNDS"] = str(args.rounds)
+os.environ["PASSWORD_VERIFY_WORKERS"] = str(args.verify_workers)
+
+import httpx
+from fastapi import Depends, HTTPException, Response
+from fastapi.security import OAuth2PasswordRequestForm
+
+from app import database
+from app.api.routes import app, startup_event
+from app.api.auth_utils import create_access_token, get_password_hash, verify_password
+from app.config import settings
+
+logging.disable(logging.INFO)
+
+@app.post("/bench/login-inline", include_in_schema=False)
+async def login_inline(response: Response, form_data: OAuth2PasswordRequestForm = Depends()):
+    # The pre-change handler: two bcrypt computations on the event loop per attempt.
+    hashed_password_from_db = get_password_hash(settings.DEMO_PASSWORD)
+    if form_data.username == settings.DEMO_USERNAME and verify_password(form_data.password, hashed_password_from_db):
+        return {"access_token": create_access_token(data={"sub": form_data.username}), "token_type": "bearer"}
+    raise HTTPException(status_code=401, detail="Incorrect username or password")
+
+async def login_client(client: httpx.AsyncClient, path: str, logins: int, durations: list):
+    form = {"username": settings.DEMO_USERNAME, "password": settings.DEMO_PASSWORD}
+    for _ in range(logins):
+        started = time.perf_counter()
+        response = await client.post(path, data=form)
+        response.raise_for_status()
+        durations.append((time.perf_counter() - started) * 1000)
+
+async def api_client(client: httpx.AsyncClient, headers: dict, stop: asyncio.Event, durations: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get("/summary/cash-on-hand", headers=headers)
+        response.raise_for_status()
+        durations.append((time.perf_counter() - started) * 1000)
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+async def run_scenario(name: str, client: httpx.AsyncClient, login_path: str, headers: dict) -> dict:
+    stop = asyncio.Event()
+    login_ms: list = []
+    api_ms: list = []
+    api_tasks = [asyncio.create_task(api_client(client, headers, stop, api_ms)) for _ in range(args.api_clients)]
+    share, extra = divmod(args.logins, args.login_clients)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        login_client(client, login_path, share + (1 if index < extra else 0), login_ms)
+        for index in range(args.login_clients)
+    ))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await asyncio.gather(*api_tasks)
+    return {
+        "scenario": name,
+        "wall_s": round(elapsed, 2),
+        "logins_per_s": round(args.logins / elapsed, 1),
+        "login_p50_ms": round(statistics.median(login_ms), 1),
+        "api_requests": len(api_ms),
+        "api_per_s": round(len(api_ms) / elapsed, 1),
+        "api_p50_ms": round(statistics.median(api_ms), 1),
+        "api_p95_ms": round(percentile(api_ms, 0.95), 1),
+        "api_max_ms": round(max(api_ms), 1),
+    }
+
+async def main():
+    await startup_event()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': settings.DEMO_USERNAME})}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="https://testserver") as client:
+        # Warm the connection pools and the verification threads.
+        await client.get("/summary/cash-on-hand", headers=headers)
+        await client.post("/login/token", data={"username": settings.DEMO_USERNAME, "password": settings.DEMO_PASSWORD})
+        results = [
+            await run_scenario("before: hash + verify inline", client, "/bench/login-inline", headers),
+            await run_scenario("after: pre-hashed, verified in pool", client, "/login/token", headers),
+        ]
+    print(f"logins={args.logins} login_clients={args.login_clients} api_clients={args.api_clients} "
+          f"rounds={args.rounds} verify_workers={args.verify_workers} cpus={os.cpu_count()}")
+    for result in results:
+        print(result)
+    await database.async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+# scripts/bench_middleware.py
+# Before/after benchmark for the HTTP middleware stack.
+#
+# Sends the same sequential requests through the app twice, in-process: once
+# with a copy of the old BaseHTTPMiddleware-based ForceHTTPSMiddleware swapped
+# into the stack, once with the current pure ASGI one. Each request carries
+# X-Forwarded-Proto: https, so both versions do their rewrite. Requests are
+# sequential so the timings show per-request overhead rather than concurrency.
+#
+# Usage (from the repository root):
+#   python -m scripts.bench_middleware --requests 2000
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+parser = argparse.ArgumentParser(description="Benchmark the old and new ForceHTTPSMiddleware.")
+parser.add_argument("--requests", type=int, default=2000, help="Requests per path and stack.")
+parser.add_argument("--repeats", type=int, default=3, help="Timed repetitions per path and stack (the best is reported).")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_middleware.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import httpx
+from fastapi import Request
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api import routes
+from app.api.routes import app
+
+logging.disable(logging.INFO)
+
+PATHS = ["/health", "/static/css/main.css", "/static/js/plugins/chart-umd-min.js"]
+
+class LegacyForceHTTPSMiddleware(BaseHTTPMiddleware):
+    # The pre-change implementation.
+    async def dispatch(self, request: Request, call_next):
+        if "x-forwarded-proto" in request.headers and request.headers["x-forwarded-proto"] == "https":
+            request.scope["scheme"] = "https"
+        response = await call_next(request)
+        return response
+
+def use_middleware(middleware_class):
+    for index, middleware in enumerate(app.user_middleware):
+        if middleware.cls in (routes.ForceHTTPSMiddleware, LegacyForceHTTPSMiddleware):
+            app.user_middleware[index] = Middleware(middleware_class)
+    # Starlette builds the stack on the first request; force a rebuild.
+    app.middleware_stack = None
+
+async def time_path(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    headers = {"X-Forwarded-Proto": "https"}
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+async def run_stack(middleware_class, timings: dict):
+    use_middleware(middleware_class)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        for path in PATHS:
+            await time_path(client, path, 50)
+            timings.setdefault(path, []).append(await time_path(client, path, args.requests))
+
+async def main():
+    before, after = {}, {}
+    # Alternate the stacks so machine noise affects both alike.
+    for _ in range(args.repeats):
+        await run_stack(LegacyForceHTTPSMiddleware, before)
+        await run_stack(routes.ForceHTTPSMiddleware, after)
+    print(f"requests={args.requests} repeats={args.repeats} (microseconds per request, best run)")
+    for path in PATHS:
+        old, new = min(before[path]), min(after[path])
+        print(f"{path:<40} BaseHTTPMiddleware {old:8.1f} us   ASGI {new:8.1f} us   "
+              f"saved {old - new:7.1f} us ({(old - new) / old:.0%})")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,13 +1,33 @@
 # scripts/populate_demo_data.py
+# Fills the database with random demo data, replacing every existing entry.
+#
+# By default a few dozen entries are added one by one through the same functions
+# the API uses. --bulk generates a multi-year dataset instead: rows are built
+# column by column in batches from a deterministic seed, inserted with one
+# executemany per batch (COPY on PostgreSQL), and the search index, cash ledger
+# and final cash balance are produced in the same pass. --workers generates the
+# batches in parallel processes; inserting stays in the main process.
+#
+# Usage (from the repository root):
+#   python -m scripts.populate_demo_data
+#   python -m scripts.populate_demo_data --bulk --scale 100 --years 3 --seed 42 --workers 4
+
+import argparse
+import multiprocessing
 import random
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 import logging
+from typing import Dict, List, Tuple
 
+from app import search_index
 from app.database import SessionLocal, create_all_tables, get_cash_on_hand_balance, set_initial_cash_on_hand
 from app.models import FixedCost, DailyExpense, Income, CostFrequency, ExpenseCategory, PaymentMethod
 from app.database import (
-    add_fixed_cost, add_daily_expense, add_income,
-    clear_all_fixed_costs, clear_all_daily_expenses, clear_all_income, reset_cash_on_hand_balance # Import new functions
+    add_fixed_cost, add_daily_expense, add_income, clear_all_entries,
+    bulk_insert_rows, rebuild_daily_rollup, take_cash_snapshots, DBCashMovement, DBCashOnHand,
+    IMPORT_TABLES, SEARCH_TYPE_FIXED_COST, SEARCH_TYPE_DAILY_EXPENSE, SEARCH_TYPE_INCOME,
+    _entry_cash_movement, _search_content, _search_key,
 )
 
 # Configure a basic logger for this script
@@ -105,47 +125,170 @@ def populate_fake_data(num_fixed_costs: int = 5, num_daily_expenses: int = 30, n
         create_all_tables() # Ensure tables exist
         logger.info("Database tables ensured to be created.")
 
-        # --- NEW: Clear existing data ---
         logger.info("Clearing existing data from tables...")
-        clear_all_fixed_costs(db_session)
-        clear_all_daily_expenses(db_session)
-        clear_all_income(db_session)
-        reset_cash_on_hand_balance(db_session, 1000.0) # Reset cash on hand to initial value
+        clear_all_entries(db_session, 1000.0) # Reset cash on hand to initial value
         logger.info("Existing data cleared and cash on hand reset.")
-        # --- END NEW ---
 
         # Add Fixed Costs
-        logger.info(f"Generating {num_fixed_costs} fake fixed costs...")
+        logger.info("Generating %s fake fixed costs...", num_fixed_costs)
         for _ in range(num_fixed_costs):
             fixed_cost = generate_random_fixed_cost()
             add_fixed_cost(db_session, fixed_cost)
-        logger.info(f"Finished generating {num_fixed_costs} fixed costs.")
+        logger.info("Finished generating %s fixed costs.", num_fixed_costs)
 
         # Add Daily Expenses
-        logger.info(f"Generating {num_daily_expenses} fake daily expenses...")
+        logger.info("Generating %s fake daily expenses...", num_daily_expenses)
         for _ in range(num_daily_expenses):
             daily_expense = generate_random_daily_expense()
             add_daily_expense(db_session, daily_expense)
-        logger.info(f"Finished generating {num_daily_expenses} daily expenses.")
+        logger.info("Finished generating %s daily expenses.", num_daily_expenses)
 
         # Add Income Entries
-        logger.info(f"Generating {num_income_entries} fake income entries...")
+        logger.info("Generating %s fake income entries...", num_income_entries)
         for _ in range(num_income_entries):
             income_entry = generate_random_income()
             add_income(db_session, income_entry)
-        logger.info(f"Finished generating {num_income_entries} income entries.")
+        logger.info("Finished generating %s income entries.", num_income_entries)
 
         logger.info("Fake data population complete.")
 
     except Exception as e:
-        logger.error(f"An error occurred during fake data population: {e}", exc_info=True)
+        logger.error("An error occurred during fake data population: %s", e, exc_info=True)
     finally:
         db_session.close()
         logger.info("Database session closed.")
 
+# --- Bulk mode ---
+
+# Entries per year of data at scale 1.
+BULK_ENTRIES_PER_YEAR = {SEARCH_TYPE_FIXED_COST: 50, SEARCH_TYPE_DAILY_EXPENSE: 2000, SEARCH_TYPE_INCOME: 700}
+BULK_BATCH_SIZE = 20_000
+
+FIXED_COST_DESCRIPTIONS = ["Office Rent", "Software Subscription", "Vehicle Insurance", "Annual License Fee", "Marketing Campaign", "Garage Rental"]
+FIXED_COST_RECIPIENTS = ["Vendor A", "Supplier B", "Service Co.", "Landlord LLC"]
+DAILY_EXPENSE_DESCRIPTIONS = ["Lunch", "Diesel refill", "Small repair", "Office supplies", "Snacks for trip", "Electricity bill (daily portion)", "Tuk wash"]
+DAILY_EXPENSE_CATEGORIES = [e for e in ExpenseCategory if e not in [
+    ExpenseCategory.INSURANCE, ExpenseCategory.LICENSES, ExpenseCategory.VEHICLE_PURCHASE, ExpenseCategory.MARKETING
+]]
+
+class _Entry:
+    """
+    Attribute view of a generated row, for the app.database helpers that read entries.
+    """
+    def __init__(self, row: dict):
+        self.__dict__.update(row)
+
+def _amounts(rng: random.Random, count: int, min_val: float, max_val: float) -> List[float]:
+    return [round(rng.uniform(min_val, max_val), 2) for _ in range(count)]
+
+def generate_bulk_batch(task: Tuple[str, int, int, int, str, date, int]) -> Tuple[str, List[dict], List[dict], List[dict]]:
+    """
+    Generates one batch of a table: `count` rows with IDs from `first_id`, their search
+    documents and their cash movements. The batch's random generator is seeded from
+    the run's seed, the table and the batch number, so the output does not depend on
+    which process builds it or in what order.
+    """
+    entry_type, batch_number, first_id, count, seed, first_day, days = task
+    rng = random.Random(f"{seed}:{entry_type}:{batch_number}")
+    now = datetime.now()
+    ids = range(first_id, first_id + count)
+    dates = [first_day + timedelta(days=offset) for offset in rng.choices(range(days), k=count)]
+    if entry_type == SEARCH_TYPE_FIXED_COST:
+        columns = {
+            "amount_eur": _amounts(rng, count, 50.0, 1000.0),
+            "description": rng.choices(FIXED_COST_DESCRIPTIONS, k=count),
+            "cost_frequency": rng.choices([f for f in CostFrequency if f != CostFrequency.INITIAL_INVESTMENT], k=count),
+            "category": rng.choices(list(ExpenseCategory), k=count),
+            "recipient": rng.choices(FIXED_COST_RECIPIENTS, k=count),
+            "cost_date": dates,
+            "payment_method": rng.choices(list(PaymentMethod), k=count),
+        }
+    elif entry_type == SEARCH_TYPE_DAILY_EXPENSE:
+        columns = {
+            "amount": _amounts(rng, count, 5.0, 150.0),
+            "description": rng.choices(DAILY_EXPENSE_DESCRIPTIONS, k=count),
+            "category": rng.choices(DAILY_EXPENSE_CATEGORIES, k=count),
+            "cost_date": dates,
+            "payment_method": rng.choices(list(PaymentMethod), k=count),
+        }
+    else:
+        columns = {
+            "income_date": dates,
+            "tours_revenue_eur": _amounts(rng, count, 20.0, 500.0),
+            "transfers_revenue_eur": _amounts(rng, count, 10.0, 300.0),
+            "hours_worked": [round(rng.uniform(2.0, 10.0), 2) for _ in range(count)],
+        }
+    names = ["id", *columns, "timestamp"]
+    rows = [dict(zip(names, values)) for values in zip(ids, *columns.values(), [now] * count)]
+    entries = [_Entry(row) for row in rows]
+    documents = [
+        {"doc_key": _search_key(entry_type, entry.id), "content": _search_content(entry_type, entry), "entry_date": date_value}
+        for entry, date_value in zip(entries, dates)
+    ]
+    movements = [_entry_cash_movement(entry_type, entry.id, entry) for entry in entries]
+    movements = [dict(movement, recorded_at=now) for movement in movements if movement["amount"]]
+    return entry_type, rows, documents, movements
+
+def bulk_populate(counts: Dict[str, int], years: int = 3, seed: str = "42", workers: int = 1,
+                  batch_size: int = BULK_BATCH_SIZE, initial_balance: float = 1000.0) -> Dict[str, int]:
+    """
+    Replaces every entry with `counts` generated entries per table (keyed by
+    fixed-costs / daily-expenses / income) spread over the last `years` years, and
+    rebuilds the rollup, search index, cash ledger, snapshots and cash on hand to
+    match. Returns the counts.
+    """
+    create_all_tables()
+    days = 365 * years
+    first_day = date.today() - timedelta(days=days - 1)
+    tasks = []
+    for entry_type, count in counts.items():
+        for batch_number, first_offset in enumerate(range(0, count, batch_size)):
+            tasks.append((entry_type, batch_number, first_offset + 1, min(batch_size, count - first_offset), str(seed), first_day, days))
+
+    db_session = SessionLocal()
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        started = time.perf_counter()
+        clear_all_entries(db_session, initial_balance, opening_date=first_day)
+        cash_balance = initial_balance
+        batches = pool.imap(generate_bulk_batch, tasks) if pool else map(generate_bulk_batch, tasks)
+        for entry_type, rows, documents, movements in batches:
+            bulk_insert_rows(db_session, IMPORT_TABLES[entry_type][0], rows)
+            search_index.index_documents(db_session, documents)
+            bulk_insert_rows(db_session, DBCashMovement, movements)
+            cash_balance += sum(movement["amount"] for movement in movements)
+            logger.info("Inserted %s %s entries.", len(rows), entry_type)
+        db_session.query(DBCashOnHand).update({"balance": round(cash_balance, 2), "last_updated": datetime.now()}, synchronize_session=False)
+        db_session.commit()
+        logger.info("Inserted %s entries in %.1f s.", sum(counts.values()), time.perf_counter() - started)
+        rebuild_daily_rollup(db_session)
+        take_cash_snapshots(db_session)
+        logger.info("Bulk population complete in %.1f s; cash on hand is %.2f.", time.perf_counter() - started, cash_balance)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        db_session.close()
+    return counts
+
 if __name__ == "__main__":
-    populate_fake_data(
-        num_fixed_costs=10,
-        num_daily_expenses=50,
-        num_income_entries=30
-    )
+    parser = argparse.ArgumentParser(description="Replace all entries with random demo data.")
+    parser.add_argument("--bulk", action="store_true", help="Generate a large dataset with batched inserts.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Bulk mode: multiplies the entries per year (about 2,750 at scale 1).")
+    parser.add_argument("--years", type=int, default=3, help="Bulk mode: years of history to generate.")
+    parser.add_argument("--seed", default="42", help="Bulk mode: random seed; the same seed and scale give the same data.")
+    parser.add_argument("--workers", type=int, default=1, help="Bulk mode: processes generating batches in parallel.")
+    parser.add_argument("--batch-size", type=int, default=BULK_BATCH_SIZE, help="Bulk mode: rows per generated and inserted batch.")
+    args = parser.parse_args()
+
+    if args.bulk:
+        bulk_populate(
+            {entry_type: round(per_year * args.scale * args.years) for entry_type, per_year in BULK_ENTRIES_PER_YEAR.items()},
+            years=args.years, seed=args.seed, workers=args.workers, batch_size=args.batch_size,
+        )
+    else:
+        populate_fake_data(
+            num_fixed_costs=10,
+            num_daily_expenses=50,
+            num_income_entries=30
+        )
@@ -0,0 +1,18 @@
+# scripts/rebuild_daily_rollup.py
+# Rebuilds the daily_rollup table from the fixed_costs, daily_expenses and income
+# tables. Run it after editing entries directly in the database, or to repair
+# the rollup if it ever drifts from the entry tables.
+#
+# Usage (from the repository root, with DATABASE_URL and SECRET_KEY set):
+#   python -m scripts.rebuild_daily_rollup
+
+from app.database import SessionLocal, create_all_tables, rebuild_daily_rollup
+
+def main():
+    create_all_tables()
+    with SessionLocal() as db_session:
+        row_count = rebuild_daily_rollup(db_session)
+    print(f"daily_rollup rebuilt with {row_count} rows.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# scripts/rebuild_search_index.py
+# Rebuilds the full-text search index from the fixed_costs, daily_expenses and
+# income tables. Run it after editing entries directly in the database.
+#
+# Usage (from the repository root, with DATABASE_URL and SECRET_KEY set):
+#   python -m scripts.rebuild_search_index
+
+from app.database import SessionLocal, create_all_tables, rebuild_search_index
+
+def main():
+    create_all_tables()
+    with SessionLocal() as db_session:
+        document_count = rebuild_search_index(db_session)
+    print(f"search index rebuilt with {document_count} documents.")
+
+if __name__ == "__main__":
+    main()
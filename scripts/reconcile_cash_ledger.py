@@ -0,0 +1,36 @@
+# scripts/reconcile_cash_ledger.py
+# Takes any missing month-end cash snapshots, then verifies the snapshots and the
+# cash on hand balance against the cash ledger. Meant to run periodically (e.g.
+# daily from cron); by default only snapshots affected by movements recorded
+# since the previous run are rechecked.
+#
+# Usage (from the repository root, with DATABASE_URL and SECRET_KEY set):
+#   python -m scripts.reconcile_cash_ledger [--full] [--repair]
+
+import argparse
+import sys
+
+from app.database import SessionLocal, create_all_tables, ensure_cash_ledger, take_cash_snapshots, reconcile_cash_ledger
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify cash snapshots and balance against the cash ledger.")
+    parser.add_argument("--full", action="store_true", help="Recheck every snapshot.")
+    parser.add_argument("--repair", action="store_true", help="Overwrite wrong values with those derived from the ledger.")
+    args = parser.parse_args()
+
+    create_all_tables()
+    with SessionLocal() as db_session:
+        ensure_cash_ledger(db_session)
+        snapshot_count = take_cash_snapshots(db_session)
+        report = reconcile_cash_ledger(db_session, full=args.full, repair=args.repair)
+    print(f"{snapshot_count} new snapshots; {report['snapshots_checked']} of {report['snapshots']} snapshots checked "
+          f"against {report['movements']} movements.")
+    for mismatch in report["snapshot_mismatches"]:
+        print(f"  snapshot {mismatch['snapshot_date']}: recorded {mismatch['recorded']:.2f}, ledger {mismatch['expected']:.2f}")
+    print(f"Cash on hand {report['cash_on_hand_balance']:.2f}, ledger {report['ledger_balance']:.2f}, "
+          f"drift {report['cash_on_hand_drift']:+.2f}{' (repaired)' if report['repaired'] else ''}")
+    if (report["snapshot_mismatches"] or report["cash_on_hand_drift"]) and not args.repair:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# scripts/stress_cash_on_hand.py
+# Parallel-writer stress test for the cash on hand balance.
+#
+# Several threads add, update and delete fixed costs, daily expenses and income
+# at the same time, each through its own session, exactly like concurrent API
+# requests. Afterwards the balance must equal the starting balance plus the cash
+# effect of every entry left in the database; any lost update shows up as a
+# difference. Reports write throughput and exits with status 1 on a mismatch.
+#
+# Usage (from the repository root):
+#   python -m scripts.stress_cash_on_hand --workers 8 --ops 250
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+parser = argparse.ArgumentParser(description="Stress-test cash on hand updates with parallel writers.")
+parser.add_argument("--workers", type=int, default=8, help="Number of concurrent writer threads.")
+parser.add_argument("--ops", type=int, default=250, help="Writes per worker.")
+parser.add_argument("--initial-balance", type=float, default=1000.0, help="Cash on hand before the run.")
+args = parser.parse_args()
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/stress_cash.db"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+
+from app import database
+from app.database import SessionLocal, DBFixedCost, DBDailyExpense, DBIncome, create_all_tables
+from app.models import FixedCost, DailyExpense, Income, CostFrequency, ExpenseCategory, PaymentMethod
+
+logging.disable(logging.INFO)
+
+MAX_RETRIES = 20
+
+def random_expense(rng: random.Random) -> DailyExpense:
+    return DailyExpense(
+        amount=round(rng.uniform(1, 80), 2),
+        description="Stress expense",
+        category=rng.choice(list(ExpenseCategory)),
+        cost_date=date.today() - timedelta(days=rng.randrange(60)),
+        payment_method=rng.choice(list(PaymentMethod)),
+    )
+
+def random_fixed_cost(rng: random.Random) -> FixedCost:
+    return FixedCost(
+        amount_eur=round(rng.uniform(10, 300), 2),
+        description="Stress fixed cost",
+        cost_frequency=rng.choice(list(CostFrequency)),
+        category=rng.choice(list(ExpenseCategory)),
+        cost_date=date.today() - timedelta(days=rng.randrange(60)),
+        payment_method=rng.choice(list(PaymentMethod)),
+    )
+
+def random_income(rng: random.Random) -> Income:
+    return Income(
+        income_date=date.today() - timedelta(days=rng.randrange(60)),
+        tours_revenue_eur=round(rng.uniform(0, 400), 2),
+        transfers_revenue_eur=round(rng.uniform(0, 100), 2),
+        hours_worked=round(rng.uniform(1, 10), 1),
+    )
+
+def one_write(db_session, rng: random.Random, owned: dict):
+    """
+    Performs one random write. Updates and deletes pick from the entries this worker
+    added; `owned` maps entry kinds to their IDs.
+    """
+    roll = rng.random()
+    if roll < 0.35:
+        owned["daily_expense"].append(database.add_daily_expense(db_session, random_expense(rng)).doc_id)
+    elif roll < 0.55:
+        owned["income"].append(database.add_income(db_session, random_income(rng)).doc_id)
+    elif roll < 0.65:
+        owned["fixed_cost"].append(database.add_fixed_cost(db_session, random_fixed_cost(rng)).doc_id)
+    elif roll < 0.80 and owned["daily_expense"]:
+        database.update_daily_expense(db_session, rng.choice(owned["daily_expense"]), {
+            "amount": round(rng.uniform(1, 80), 2), "payment_method": rng.choice(list(PaymentMethod)).value
+        })
+    elif roll < 0.90 and owned["income"]:
+        database.update_income(db_session, rng.choice(owned["income"]), {"tours_revenue_eur": round(rng.uniform(0, 400), 2)})
+    elif owned["daily_expense"]:
+        database.delete_daily_expense(db_session, owned["daily_expense"].pop(rng.randrange(len(owned["daily_expense"]))))
+    elif owned["income"]:
+        database.delete_income(db_session, owned["income"].pop())
+
+def worker(seed: int, ops: int, barrier: threading.Barrier, retries: list, failures: list):
+    rng = random.Random(seed)
+    owned = {"daily_expense": [], "income": [], "fixed_cost": []}
+    barrier.wait()
+    with SessionLocal() as db_session:
+        for _ in range(ops):
+            for attempt in range(MAX_RETRIES):
+                try:
+                    one_write(db_session, rng, owned)
+                    break
+                except OperationalError:
+                    # SQLite reports lock contention instead of waiting in some cases.
+                    db_session.rollback()
+                    retries.append(1)
+                    time.sleep(0.001 * (attempt + 1))
+            else:
+                failures.append(1)
+
+def expected_balance(initial_balance: float) -> float:
+    with SessionLocal() as db_session:
+        income = db_session.query(func.sum(DBIncome.tours_revenue_eur + DBIncome.transfers_revenue_eur)).scalar() or 0.0
+        fixed_costs = db_session.query(func.sum(DBFixedCost.amount_eur)).filter(DBFixedCost.payment_method == PaymentMethod.CASH).scalar() or 0.0
+        daily_expenses = db_session.query(func.sum(DBDailyExpense.amount)).filter(DBDailyExpense.payment_method == PaymentMethod.CASH).scalar() or 0.0
+    return round(initial_balance + income - fixed_costs - daily_expenses, 2)
+
+def main():
+    create_all_tables()
+    with SessionLocal() as db_session:
+        database.set_initial_cash_on_hand(db_session, args.initial_balance)
+
+    barrier = threading.Barrier(args.workers + 1)
+    retries, failures = [], []
+    threads = [
+        threading.Thread(target=worker, args=(seed, args.ops, barrier, retries, failures))
+        for seed in range(args.workers)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    with SessionLocal() as db_session:
+        balance = database.get_cash_on_hand_balance(db_session).balance
+    expected = expected_balance(args.initial_balance)
+    writes = args.workers * args.ops - len(failures)
+    print(f"Database: {database.engine.url.render_as_string(hide_password=True)}")
+    print(f"{args.workers} workers x {args.ops} writes: {writes} writes in {elapsed:.2f} s "
+          f"({writes / elapsed:.0f} writes/s), {len(retries)} lock retries, {len(failures)} abandoned")
+    print(f"Balance: {balance:.2f}  expected from entries: {expected:.2f}  difference: {balance - expected:+.2f}")
+    if abs(balance - expected) > 0.005:
+        print("FAIL: cash on hand does not match the entries (lost update).")
+        sys.exit(1)
+    print("OK: cash on hand matches the entries.")
+
+if __name__ == "__main__":
+    main()
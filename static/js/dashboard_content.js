@@ -51,13 +51,10 @@ document.addEventListener('DOMContentLoaded', async () => {
         };
     }
 
-    async function fetchData(endpoint, tableId, noDataMessageId, headers) {
+    // Renders one of the "recent entries" tables. Rows arrive from /summary/dashboard
+    // already sorted newest first and limited to the most recent entries.
+    function renderTable(data, tableId, noDataMessageId, headers) {
         try {
-            const response = await fetch(endpoint);
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            let data = await response.json();
             const tableBody = document.getElementById(tableId).querySelector('tbody');
             const noDataMessage = document.getElementById(noDataMessageId);
 
@@ -70,18 +67,6 @@ document.addEventListener('DOMContentLoaded', async () => {
                 noDataMessage.classList.add('hidden');
             }
 
-            data.sort((a, b) => {
-                const dateA = new Date(a.cost_date || a.income_date);
-                const dateB = new Date(b.cost_date || b.income_date);
-
-                if (dateA.getTime() !== dateB.getTime()) {
-                    return dateB - dateA;
-                }
-                return b.doc_id - a.doc_id;
-            });
-
-            data = data.slice(0, 10);
-
             data.forEach(item => {
                 const row = tableBody.insertRow();
                 headers.forEach(headerKey => {
@@ -114,21 +99,16 @@ document.addEventListener('DOMContentLoaded', async () => {
                 });
             });
         } catch (error) {
-            console.error(`Error fetching data for ${tableId}:`, error);
+            console.error(`Error rendering data for ${tableId}:`, error);
             document.getElementById(noDataMessageId).textContent = `Error loading data: ${error.message}`;
             document.getElementById(noDataMessageId).classList.remove('hidden');
         }
     }
 
-    async function fetchAndRenderChart(endpoint, chartId, noDataMessageId, chartType, dataProcessor, options = {}) {
+    function renderChart(rawData, chartId, noDataMessageId, chartType, dataProcessor, options = {}) {
+        const canvas = document.getElementById(chartId);
         try {
-            const response = await fetch(endpoint);
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            const rawData = await response.json();
             const noDataMessage = document.getElementById(noDataMessageId);
-            const canvas = document.getElementById(chartId);
             
             // Refine totalDisplayDiv identification for weekly summaries
             let totalDisplayDiv = null;
@@ -312,7 +292,7 @@ document.addEventListener('DOMContentLoaded', async () => {
                 });
             }
         } catch (error) {
-            console.error(`Error fetching or rendering chart for ${chartId}:`, error);
+            console.error(`Error rendering chart for ${chartId}:`, error);
             if (canvas) canvas.style.display = 'none';
             document.getElementById(noDataMessageId).textContent = `Error loading data: ${error.message}`;
             document.getElementById(noDataMessageId).classList.remove('hidden');
@@ -328,109 +308,68 @@ document.addEventListener('DOMContentLoaded', async () => {
         }
     }
 
-    async function fetchAndDisplayProfitLossAverageAndCashOnHand(year, month, startDate = null, endDate = null) {
-        let summaryEndpoint;
-        let averageIncomeEndpoint;
+    function displayProfitLossAverageAndCashOnHand(data) {
+        const isWeekly = data.period === 'week';
         const averageIncomeTitle = document.getElementById('monthlyAverageProfitLossTitle');
         const monthlyAverageValueDisplay = document.getElementById('monthlyAverageValueDisplay');
         const netProfitLossDisplay = document.getElementById('netProfitLossDisplay');
         const cashOnHandDisplay = document.getElementById('cashOnHandDisplay');
         const noDataMessage = document.getElementById('noNetProfitLossChart');
 
-        if (netProfitLossDisplay) netProfitLossDisplay.textContent = '';
-        if (monthlyAverageValueDisplay) monthlyAverageValueDisplay.textContent = '';
-        if (cashOnHandDisplay) cashOnHandDisplay.textContent = '';
         if (noDataMessage) noDataMessage.classList.add('hidden');
-
-        if (startDate && endDate) {
-            const formattedStartDate = startDate.toISOString().split('T')[0];
-            const formattedEndDate = endDate.toISOString().split('T')[0];
-            summaryEndpoint = `/summary/weekly?start_date=${formattedStartDate}&end_date=${formattedEndDate}`;
-            averageIncomeEndpoint = `/summary/daily-income-average?start_date=${formattedStartDate}&end_date=${formattedEndDate}`;
-            if (averageIncomeTitle) {
-                averageIncomeTitle.textContent = 'Weekly Daily Income Average';
-            }
-        } else {
-            summaryEndpoint = `/summary/monthly?year=${year}&month=${month}`;
-            
-            const firstDayOfMonth = new Date(year, month - 1, 1);
-            const lastDayOfMonth = new Date(year, month, 0);
-            const formattedStartDate = firstDayOfMonth.toISOString().split('T')[0];
-            const formattedEndDate = lastDayOfMonth.toISOString().split('T')[0];
-            
-            averageIncomeEndpoint = `/summary/daily-income-average?start_date=${formattedStartDate}&end_date=${formattedEndDate}`;
-            if (averageIncomeTitle) {
-                averageIncomeTitle.textContent = 'Monthly Daily Income Average';
-            }
+        if (averageIncomeTitle) {
+            averageIncomeTitle.textContent = isWeekly ? 'Weekly Daily Income Average' : 'Monthly Daily Income Average';
         }
 
-        try {
-            const summaryResponse = await fetch(summaryEndpoint);
-            if (!summaryResponse.ok) {
-                throw new Error(`HTTP error! status: ${summaryResponse.status}`);
-            }
-            const summaryData = await summaryResponse.json();
-
-            if (netProfitLossDisplay) {
-                let netProfitToDisplay;
-
-                if (startDate && endDate) {
-                    netProfitToDisplay = summaryData.net_weekly_profit;
-                } else {
-                    netProfitToDisplay = summaryData.net_monthly_profit;
-                }
+        if (netProfitLossDisplay) {
+            const netProfitToDisplay = isWeekly ? data.summary.net_weekly_profit : data.summary.net_monthly_profit;
 
-                if (netProfitToDisplay !== undefined && netProfitToDisplay !== null) {
-                    netProfitLossDisplay.textContent = formatCurrency(netProfitToDisplay);
-                    netProfitLossDisplay.style.color = netProfitToDisplay >= 0 ? 'green' : 'red';
-                } else {
-                    netProfitLossDisplay.textContent = 'N/A';
-                }
+            if (netProfitToDisplay !== undefined && netProfitToDisplay !== null) {
+                netProfitLossDisplay.textContent = formatCurrency(netProfitToDisplay);
+                netProfitLossDisplay.style.color = netProfitToDisplay >= 0 ? 'green' : 'red';
+            } else {
+                netProfitLossDisplay.textContent = 'N/A';
             }
+        }
 
-            const averageIncomeResponse = await fetch(averageIncomeEndpoint);
-            if (!averageIncomeResponse.ok) {
-                throw new Error(`HTTP error! status: ${averageIncomeResponse.status}`);
-            }
-            const averageIncomeData = await averageIncomeResponse.json();
-            
-            if (monthlyAverageValueDisplay) { 
-                if (averageIncomeData.daily_average_income !== undefined && averageIncomeData.daily_average_income !== null) {
-                    monthlyAverageValueDisplay.textContent = formatCurrency(averageIncomeData.daily_average_income);
-                    monthlyAverageValueDisplay.style.color = averageIncomeData.daily_average_income >= 0 ? 'green' : 'red';
-                } else {
-                    monthlyAverageValueDisplay.textContent = 'N/A';
-                }
+        if (monthlyAverageValueDisplay) { 
+            if (data.daily_income_average !== undefined && data.daily_income_average !== null) {
+                monthlyAverageValueDisplay.textContent = formatCurrency(data.daily_income_average);
+                monthlyAverageValueDisplay.style.color = data.daily_income_average >= 0 ? 'green' : 'red';
+            } else {
+                monthlyAverageValueDisplay.textContent = 'N/A';
             }
+        }
 
-            const cashOnHandResponse = await fetch('/summary/cash-on-hand');
-            if (!cashOnHandResponse.ok) {
-                throw new Error(`HTTP error! status: ${cashOnHandResponse.status}`);
-            }
-            const cashOnHandData = await cashOnHandResponse.json();
-            if (cashOnHandDisplay) {
-                if (cashOnHandData.balance !== undefined && cashOnHandData.balance !== null) {
-                    cashOnHandDisplay.textContent = formatCurrency(cashOnHandData.balance);
-                    cashOnHandDisplay.style.color = cashOnHandData.balance >= 0 ? 'green' : 'red';
-                } else {
-                    cashOnHandDisplay.textContent = 'N/A'; // Or an appropriate default
-                }
+        if (cashOnHandDisplay) {
+            if (data.cash_on_hand && data.cash_on_hand.balance !== undefined && data.cash_on_hand.balance !== null) {
+                cashOnHandDisplay.textContent = formatCurrency(data.cash_on_hand.balance);
+                cashOnHandDisplay.style.color = data.cash_on_hand.balance >= 0 ? 'green' : 'red';
+            } else {
+                cashOnHandDisplay.textContent = 'N/A'; // Or an appropriate default
             }
+        }
+    }
 
-        } catch (error) {
-            console.error('Error fetching dashboard summary data or daily average income:', error);
-            if (netProfitLossDisplay) netProfitLossDisplay.textContent = 'Error';
-            if (monthlyAverageValueDisplay) monthlyAverageValueDisplay.textContent = 'Error';
-            if (cashOnHandDisplay) cashOnHandDisplay.textContent = 'Error';
-            
-            if (averageIncomeTitle) {
-                averageIncomeTitle.textContent = (startDate && endDate) ? 'Weekly Daily Income Average (Error)' : 'Monthly Daily Income Average (Error)';
-            }
-            if (noDataMessage) {
-                noDataMessage.textContent = `Error loading summary data: ${error.message}`;
-                noDataMessage.classList.remove('hidden');
-            }
+    function displayDashboardError(error, isWeekly) {
+        console.error('Error fetching dashboard data:', error);
+        const message = `Error loading data: ${error.message}`;
+        ['netProfitLossDisplay', 'monthlyAverageValueDisplay', 'cashOnHandDisplay'].forEach(id => {
+            const element = document.getElementById(id);
+            if (element) element.textContent = 'Error';
+        });
+        const averageIncomeTitle = document.getElementById('monthlyAverageProfitLossTitle');
+        if (averageIncomeTitle) {
+            averageIncomeTitle.textContent = isWeekly ? 'Weekly Daily Income Average (Error)' : 'Monthly Daily Income Average (Error)';
         }
+        ['noNetProfitLossChart', 'noMonthlyExpenseCategoriesPieChart', 'noMonthlyIncomeChart', 'noGlobalSummaryChart',
+         'noIncome', 'noDailyExpenses', 'noFixedCosts'].forEach(id => {
+            const element = document.getElementById(id);
+            if (element) {
+                element.textContent = message;
+                element.classList.remove('hidden');
+            }
+        });
     }
 
     const originalColors = [
@@ -543,29 +482,58 @@ document.addEventListener('DOMContentLoaded', async () => {
         };
     };
 
-    async function updateDashboardChartsAndCards(year, month, startDate = null, endDate = null) {
-        const periodText = (startDate && endDate) ? "Weekly" : "Monthly";
-        
-        document.getElementById('expensesChartTitle').textContent = `${periodText} Expenses`;
-        document.getElementById('incomeChartTitle').textContent = `${periodText} Income`;
-        
-        let expenseCategoriesEndpoint;
-        let incomeSourcesEndpoint;
+    // Latest /summary/dashboard response and the period it was requested for.
+    let dashboardData = null;
+    let currentStartDate = null;
+    let currentEndDate = null;
 
+    // Fetches every dashboard figure for the selected period in a single request.
+    async function fetchDashboardData(year, month, startDate = null, endDate = null) {
+        const params = new URLSearchParams({ today: formatLocalDateToYYYYMMDD(new Date()) });
         if (startDate && endDate) {
-            const formattedStartDate = startDate.toISOString().split('T')[0];
-            const formattedEndDate = endDate.toISOString().split('T')[0];
-            expenseCategoriesEndpoint = `/summary/weekly-expense-categories?start_date=${formattedStartDate}&end_date=${formattedEndDate}`;
-            incomeSourcesEndpoint = `/summary/weekly-income-sources?start_date=${formattedStartDate}&end_date=${formattedEndDate}`;
+            params.set('period', 'week');
+            params.set('start_date', startDate.toISOString().split('T')[0]);
+            params.set('end_date', endDate.toISOString().split('T')[0]);
         } else {
-            expenseCategoriesEndpoint = `/summary/expense-categories?year=${year}&month=${month}`;
-            incomeSourcesEndpoint = `/summary/income-sources?year=${year}&month=${month}`;
+            params.set('period', 'month');
+            params.set('year', year);
+            params.set('month', month);
         }
+        const response = await fetch(`/summary/dashboard?${params.toString()}`);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        return response.json();
+    }
 
-        await fetchAndRenderChart(expenseCategoriesEndpoint, 'monthlyExpenseCategoriesPieChart', 'noMonthlyExpenseCategoriesPieChart', 'pie', processCategoryData);
-        await fetchAndRenderChart(incomeSourcesEndpoint, 'monthlyIncomeChart', 'noMonthlyIncomeChart', 'pie', processMonthlyIncomeData);
+    function renderDashboard(data) {
+        const periodText = data.period === 'week' ? "Weekly" : "Monthly";
         
-        await fetchAndDisplayProfitLossAverageAndCashOnHand(year, month, startDate, endDate);
+        document.getElementById('expensesChartTitle').textContent = `${periodText} Expenses`;
+        document.getElementById('incomeChartTitle').textContent = `${periodText} Income`;
+
+        renderChart(data.expense_categories, 'monthlyExpenseCategoriesPieChart', 'noMonthlyExpenseCategoriesPieChart', 'pie', processCategoryData);
+        renderChart(data.income_sources, 'monthlyIncomeChart', 'noMonthlyIncomeChart', 'pie', processMonthlyIncomeData);
+        displayProfitLossAverageAndCashOnHand(data);
+        renderGlobalSummaryChart(data.global_summary);
+        renderTables(data);
+    }
+
+    function renderTables(data) {
+        renderTable(data.recent.income, 'incomeTable', 'noIncome', incomeHeaders);
+        renderTable(data.recent.daily_expenses, 'dailyExpensesTable', 'noDailyExpenses', dailyExpensesHeaders);
+        renderTable(data.recent.fixed_costs, 'fixedCostsTable', 'noFixedCosts', fixedCostsHeaders);
+    }
+
+    async function updateDashboardChartsAndCards(year, month, startDate = null, endDate = null) {
+        currentStartDate = startDate;
+        currentEndDate = endDate;
+        try {
+            dashboardData = await fetchDashboardData(year, month, startDate, endDate);
+            renderDashboard(dashboardData);
+        } catch (error) {
+            displayDashboardError(error, Boolean(startDate && endDate));
+        }
     }
 
     async function fetchAndCompareDailyIncome(comparisonType) {
@@ -594,7 +562,6 @@ document.addEventListener('DOMContentLoaded', async () => {
 
         // Use the new local date formatter for fetching data to ensure consistency
         const todayFormatted = formatLocalDateToYYYYMMDD(today);
-        const comparisonDateFormatted = formatLocalDateToYYYYMMDD(comparisonDate);
 
         const incomeComparisonMessageDiv = document.getElementById('incomeComparisonMessage');
         const comparisonMessageTextP = document.getElementById('comparisonMessageText');
@@ -610,13 +577,13 @@ document.addEventListener('DOMContentLoaded', async () => {
 
 
         try {
-            const todayIncomeResponse = await fetch(`/income/daily-summary?date_param=${todayFormatted}`);
-            if (!todayIncomeResponse.ok) throw new Error(`HTTP error! status: ${todayIncomeResponse.status} for today's income`);
-            const todayIncomeData = await todayIncomeResponse.json();
-
-            const comparisonIncomeResponse = await fetch(`/income/daily-summary?date_param=${comparisonDateFormatted}`);
-            if (!comparisonIncomeResponse.ok) throw new Error(`HTTP error! status: ${comparisonIncomeResponse.status} for comparison day's income`);
-            const comparisonIncomeData = await comparisonIncomeResponse.json();
+            // The dashboard response already carries today's and the comparison days' income;
+            // only re-fetch it if the page has been open since before midnight.
+            if (!dashboardData || dashboardData.daily_income.today.income_date !== todayFormatted) {
+                dashboardData = await fetchDashboardData(currentYear, currentMonth, currentStartDate, currentEndDate);
+            }
+            const todayIncomeData = dashboardData.daily_income.today;
+            const comparisonIncomeData = comparisonType === 'lastWeek' ? dashboardData.daily_income.last_week : dashboardData.daily_income.last_month;
 
             const todayTotal = todayIncomeData.total_daily_income_eur || 0;
             const comparisonTotal = comparisonIncomeData.total_daily_income_eur || 0;
@@ -667,10 +634,8 @@ document.addEventListener('DOMContentLoaded', async () => {
         }
     }
 
-    async function renderAllDashboardElements() {
-        await updateDashboardChartsAndCards(currentYear, currentMonth);
-
-        await fetchAndRenderChart(`/summary/global`, 'globalSummaryChart', 'noGlobalSummaryChart', 'bar', processGlobalSummary, {
+    function renderGlobalSummaryChart(globalSummary) {
+        renderChart(globalSummary, 'globalSummaryChart', 'noGlobalSummaryChart', 'bar', processGlobalSummary, {
                 indexAxis: 'y',
                 scales: {
                     x: {
@@ -723,10 +688,7 @@ document.addEventListener('DOMContentLoaded', async () => {
     const fixedCostsHeaders = ['doc_id', 'cost_date', 'description', 'cost_frequency', 'category', 'recipient', 'payment_method', 'amount_eur'];
 
     // Initial data fetch and render for all elements
-    await fetchData('/income/', 'incomeTable', 'noIncome', incomeHeaders);
-    await fetchData('/daily-expenses/', 'dailyExpensesTable', 'noDailyExpenses', dailyExpensesHeaders);
-    await fetchData('/fixed-costs/', 'fixedCostsTable', 'noFixedCosts', fixedCostsHeaders);
-    renderAllDashboardElements();
+    await updateDashboardChartsAndCards(currentYear, currentMonth);
 
     // Event Listeners for Date Range Buttons
     document.getElementById('currentMonthBtn').addEventListener('click', async () => {
@@ -812,14 +774,8 @@ document.addEventListener('DOMContentLoaded', async () => {
     const observer = new MutationObserver((mutations) => {
         mutations.forEach((mutation) => {
             if (mutation.type === 'attributes' && mutation.attributeName === 'class') {
-                // Only re-fetch tables as charts/cards are handled by updateDashboardChartsAndCards
-                fetchData('/income/', 'incomeTable', 'noIncome', incomeHeaders);
-                fetchData('/daily-expenses/', 'dailyExpensesTable', 'noDailyExpenses', dailyExpensesHeaders);
-                fetchData('/fixed-costs/', 'fixedCostsTable', 'noFixedCosts', fixedCostsHeaders);
-                // Call updateDashboardChartsAndCards with current selected month/year
-                // Note: currentMonth and currentYear will hold the last selected value from the buttons
-                // if a button was clicked. Otherwise, it's the initial current month.
-                updateDashboardChartsAndCards(currentYear, currentMonth);
+                // Re-render with the new theme colors from the data already loaded for the selected period
+                if (dashboardData) renderDashboard(dashboardData);
             }
         });
     });
@@ -831,9 +787,7 @@ document.addEventListener('DOMContentLoaded', async () => {
     window.addEventListener('resize', () => {
         clearTimeout(resizeTimeout);
         resizeTimeout = setTimeout(() => {
-            fetchData('/income/', 'incomeTable', 'noIncome', incomeHeaders);
-            fetchData('/daily-expenses/', 'dailyExpensesTable', 'noDailyExpenses', dailyExpensesHeaders);
-            fetchData('/fixed-costs/', 'fixedCostsTable', 'noFixedCosts', fixedCostsHeaders);
+            if (dashboardData) renderTables(dashboardData);
         }, 200);
     });
 });
\ No newline at end of file
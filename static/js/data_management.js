@@ -353,6 +353,28 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
+    const PAGE_SIZE = 500;
+
+    // Follows the X-Next-Cursor header until the last page of a list endpoint.
+    async function fetchAllPages(endpoint, params) {
+        let rows = [];
+        let cursor = null;
+        do {
+            const pageParams = new URLSearchParams(params);
+            pageParams.set('limit', PAGE_SIZE);
+            if (cursor) {
+                pageParams.set('cursor', cursor);
+            }
+            const response = await fetch(`${endpoint}?${pageParams.toString()}`);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            rows = rows.concat(await response.json());
+            cursor = response.headers.get('X-Next-Cursor');
+        } while (cursor);
+        return rows;
+    }
+
     async function loadTableData() {
         const selectedTable = tableSelect.value;
         const selectedYear = yearSelect.value;
@@ -364,33 +386,14 @@ document.addEventListener('DOMContentLoaded', () => {
             endpoint = '/income/all-individual';
         }
 
-        try {
-            const response = await fetch(endpoint);
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            let data = await response.json();
-
-            data = data.filter(item => {
-                const itemDate = new Date((item.cost_date || item.income_date) + 'T00:00:00');
-                const itemYear = itemDate.getFullYear();
-                const itemMonth = itemDate.getMonth() + 1;
-
-                const yearMatch = itemYear == selectedYear;
-                const monthMatch = (selectedMonth === '0' || itemMonth == selectedMonth);
-
-                return yearMatch && monthMatch;
-            });
-
-            data.sort((a, b) => {
-                const dateA = new Date((a.cost_date || a.income_date) + 'T00:00:00');
-                const dateB = new Date((b.cost_date || b.income_date) + 'T00:00:00');
+        // Filtering by year/month and sorting (newest first) happen on the server.
+        const params = new URLSearchParams({ year: selectedYear, order: 'desc' });
+        if (selectedMonth !== '0') {
+            params.set('month', selectedMonth);
+        }
 
-                if (dateA.getTime() !== dateB.getTime()) {
-                    return dateB - dateA;
-                }
-                return b.doc_id - a.doc_id;
-            });
+        try {
+            const data = await fetchAllPages(endpoint, params);
 
             currentTableData = data.map(item => ({ ...item, sourceTable: selectedTable }));
 
@@ -402,64 +405,24 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    const SEARCH_RESULT_LIMIT = 200;
+
     async function performGlobalSearch() {
-        const query = globalSearchInput.value.toLowerCase().trim();
+        const query = globalSearchInput.value.trim();
         if (!query) {
             showMessage('Please enter a search query.', 'error');
             return;
         }
 
-        let allResults = [];
-        const tableTypes = ['daily-expenses', 'fixed-costs', 'income']; // 'income' here will fetch individual
-
         try {
-            for (const tableType of tableTypes) {
-                let endpoint = `/${tableType}/`;
-                // For global search, always fetch individual income entries
-                if (tableType === 'income') {
-                    endpoint = '/income/all-individual';
-                }
-
-                const response = await fetch(endpoint);
-                if (!response.ok) {
-                    throw new Error(`HTTP error! status: ${response.status} for ${tableType}`);
-                }
-                const data = await response.json();
-
-                data.forEach(item => {
-                    let match = false;
-                    for (const key in item) {
-                        if (typeof item[key] === 'string' && item[key].toLowerCase().includes(query)) {
-                            match = true;
-                            break;
-                        }
-                        if (typeof item[key] === 'number' && String(item[key]).includes(query)) {
-                            match = true;
-                            break;
-                        }
-                        // Handle enum values for search
-                        if (['payment_method', 'category', 'cost_frequency'].includes(key) && item[key]) {
-                            if (String(item[key]).toLowerCase().replace(/_/g, ' ').includes(query)) {
-                                match = true;
-                                break;
-                            }
-                        }
-                    }
-                    if (match) {
-                        allResults.push({ ...item, sourceTable: tableType });
-                    }
-                });
+            // Matching and ranking happen on the server's full-text index.
+            const params = new URLSearchParams({ q: query, limit: SEARCH_RESULT_LIMIT });
+            const response = await fetch(`/search?${params.toString()}`);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
             }
-
-            allResults.sort((a, b) => {
-                const dateA = new Date((a.cost_date || a.income_date) + 'T00:00:00');
-                const dateB = new Date((b.cost_date || b.income_date) + 'T00:00:00');
-
-                if (dateA.getTime() !== dateB.getTime()) {
-                    return dateB - dateA;
-                }
-                return b.doc_id - a.doc_id;
-            });
+            const hits = await response.json();
+            const allResults = hits.map(hit => ({ ...hit.entry, sourceTable: hit.entry_type }));
 
             currentTableData = allResults;
             renderTable(allResults, null, true);
@@ -0,0 +1,99 @@
+# tests/conftest.py
+# Shared fixtures: every test runs against a fresh in-memory SQLite database.
+#
+# The database is a named shared-cache in-memory database, so the app's own sync
+# and async engines (created when app.database is imported) see the same data.
+#
+# Needs pytest and httpx (for FastAPI's TestClient) on top of requirements.txt.
+#
+# Usage (from the repository root):
+#   python -m pytest -q
+
+import os
+
+os.environ["DATABASE_URL"] = "sqlite:///file:finance_tests?mode=memory&cache=shared&uri=true"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app import database, search_index
+from app.models import CostFrequency, DailyExpense, ExpenseCategory, FixedCost, Income, PaymentMethod
+from app.summary_cache import summary_cache
+
+@pytest.fixture(scope="session", autouse=True)
+def _keep_database_alive():
+    # An in-memory database is dropped when its last connection closes.
+    connection = database.engine.connect()
+    yield
+    connection.close()
+
+@pytest.fixture
+def db_session():
+    database.Base.metadata.drop_all(database.engine)
+    with database.engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {search_index.SEARCH_TABLE}"))
+    database.create_all_tables()
+    summary_cache.clear()
+    db_session = database.SessionLocal()
+    database.set_initial_cash_on_hand(db_session, 1000.00)
+    yield db_session
+    db_session.close()
+
+@pytest.fixture
+def client(db_session):
+    from app.api.auth_utils import create_access_token
+    from app.api.routes import app
+
+    # Not used as a context manager, so the startup hook does not run.
+    test_client = TestClient(app)
+    test_client.headers["Authorization"] = f"Bearer {create_access_token({'sub': 'demo'})}"
+    return test_client
+
+def daily_expense(amount: float, cost_date: date, category: ExpenseCategory = ExpenseCategory.DIESEL,
+                  payment_method: PaymentMethod = PaymentMethod.CASH) -> DailyExpense:
+    return DailyExpense(amount=amount, description=f"{category.value} expense", category=category,
+                        cost_date=cost_date, payment_method=payment_method)
+
+def fixed_cost(amount_eur: float, cost_date: date, category: ExpenseCategory = ExpenseCategory.INSURANCE,
+               payment_method: PaymentMethod = PaymentMethod.BANK_TRANSFER) -> FixedCost:
+    return FixedCost(amount_eur=amount_eur, description=f"{category.value} cost", cost_frequency=CostFrequency.MONTHLY,
+                     category=category, recipient="Insurer", cost_date=cost_date, payment_method=payment_method)
+
+def income(income_date: date, tours: float, transfers: float, hours: float = 8.0) -> Income:
+    return Income(income_date=income_date, tours_revenue_eur=tours, transfers_revenue_eur=transfers, hours_worked=hours)
+
+@pytest.fixture
+def mixed_writes(db_session):
+    """
+    Adds, updates and deletes entries of every type across two months, including
+    updates that move an entry to another day, category or payment method.
+    """
+    expenses = [database.add_daily_expense(db_session, expense) for expense in (
+        daily_expense(12.50, date(2025, 3, 3)),
+        daily_expense(40.00, date(2025, 3, 3), ExpenseCategory.FOOD, PaymentMethod.DEBIT_CARD),
+        daily_expense(7.25, date(2025, 3, 17), ExpenseCategory.GARAGE),
+        daily_expense(99.99, date(2025, 4, 2), ExpenseCategory.TUK_MAINTENANCE),
+    )]
+    costs = [database.add_fixed_cost(db_session, cost) for cost in (
+        fixed_cost(120.00, date(2025, 3, 1)),
+        fixed_cost(35.00, date(2025, 4, 1), ExpenseCategory.LICENSES, PaymentMethod.CASH),
+    )]
+    incomes = [database.add_income(db_session, entry) for entry in (
+        income(date(2025, 3, 3), 180.0, 45.5),
+        income(date(2025, 3, 18), 210.0, 0.0, 6.5),
+        income(date(2025, 4, 2), 95.0, 60.0),
+    )]
+
+    database.update_daily_expense(db_session, expenses[0].doc_id, {"amount": 15.75, "cost_date": "2025-03-04"})
+    database.update_daily_expense(db_session, expenses[2].doc_id, {"category": "Food", "payment_method": "Bank Transfer"})
+    database.update_fixed_cost(db_session, costs[1].doc_id, {"amount_eur": 42.0, "payment_method": "Debit Card"})
+    database.update_income(db_session, incomes[1].doc_id, {"tours_revenue_eur": 150.0, "income_date": date(2025, 4, 18)})
+
+    database.delete_daily_expense(db_session, expenses[1].doc_id)
+    database.delete_fixed_cost(db_session, costs[0].doc_id)
+    database.delete_income(db_session, incomes[0].doc_id)
@@ -0,0 +1,42 @@
+# tests/test_cash_ledger.py
+
+from datetime import date
+
+from app import database
+from tests.conftest import daily_expense, income
+
+def _entries_balance(db_session):
+    incomes = sum(entry.tours_revenue_eur + entry.transfers_revenue_eur for entry in db_session.query(database.DBIncome))
+    costs = sum(entry.amount_eur for entry in db_session.query(database.DBFixedCost)
+                if entry.payment_method == database.PaymentMethod.CASH)
+    expenses = sum(entry.amount for entry in db_session.query(database.DBDailyExpense)
+                   if entry.payment_method == database.PaymentMethod.CASH)
+    return round(1000.00 + incomes - costs - expenses, 2)
+
+def test_no_drift_after_mixed_writes(db_session, mixed_writes):
+    assert database.take_cash_snapshots(db_session) > 0
+    # Writes dated inside snapshotted months shift the snapshots they precede.
+    expense = database.add_daily_expense(db_session, daily_expense(18.40, date(2025, 3, 9)))
+    database.update_daily_expense(db_session, expense.doc_id, {"cost_date": "2025-04-11", "amount": 21.0})
+    database.add_income(db_session, income(date(2025, 3, 21), 64.0, 12.0))
+
+    result = database.reconcile_cash_ledger(db_session, full=True)
+
+    assert result["cash_on_hand_drift"] == 0.0
+    assert result["snapshot_mismatches"] == []
+    assert result["ledger_balance"] == _entries_balance(db_session)
+    assert database.get_cash_on_hand_balance(db_session).balance == _entries_balance(db_session)
+
+def test_reports_and_repairs_drift(db_session, mixed_writes):
+    database.take_cash_snapshots(db_session)
+    db_session.query(database.DBCashOnHand).update({"balance": 1.23})
+    db_session.query(database.DBCashSnapshot).update({"balance": 0.0})
+    db_session.commit()
+
+    result = database.reconcile_cash_ledger(db_session, full=True, repair=True)
+
+    assert result["cash_on_hand_drift"] != 0.0
+    assert result["snapshot_mismatches"]
+    result = database.reconcile_cash_ledger(db_session, full=True)
+    assert result["cash_on_hand_drift"] == 0.0
+    assert result["snapshot_mismatches"] == []
@@ -0,0 +1,37 @@
+# tests/test_daily_rollup.py
+
+from app import database
+
+def _rollup_rows(db_session):
+    return sorted(
+        (row.rollup_date, row.category, row.payment_method, row.source,
+         round(row.amount, 2), round(row.hours_worked, 2), row.entry_count)
+        for row in db_session.query(database.DBDailyRollup)
+    )
+
+def _summaries(db_session):
+    database.summary_cache.clear()
+    return [
+        database.get_monthly_summary(db_session, 2025, 3),
+        database.get_monthly_summary(db_session, 2025, 4),
+        database.get_yearly_summary(db_session, 2025),
+    ]
+
+def test_rebuild_matches_incremental_rollup(db_session, mixed_writes):
+    incremental_rows = _rollup_rows(db_session)
+    incremental_summaries = _summaries(db_session)
+    assert incremental_rows
+
+    database.rebuild_daily_rollup(db_session)
+
+    assert _rollup_rows(db_session) == incremental_rows
+    assert _summaries(db_session) == incremental_summaries
+
+def test_delete_removes_empty_rollup_rows(db_session, mixed_writes):
+    for model, delete in ((database.DBFixedCost, database.delete_fixed_cost),
+                          (database.DBDailyExpense, database.delete_daily_expense),
+                          (database.DBIncome, database.delete_income)):
+        for (entry_id,) in db_session.query(model.id).all():
+            delete(db_session, entry_id)
+
+    assert _rollup_rows(db_session) == []
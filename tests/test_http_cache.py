@@ -0,0 +1,21 @@
+# tests/test_http_cache.py
+
+import pytest
+
+NEW_EXPENSE = {"amount": 9.5, "description": "Fuel", "category": "Diesel", "cost_date": "2025-03-03", "payment_method": "Cash"}
+
+@pytest.mark.parametrize("path", ["/daily-expenses/", "/summary/monthly?year=2025&month=3"])
+def test_revalidation(client, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    repeat = client.get(path, headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["ETag"] == etag
+
+    assert client.post("/daily-expenses/", json=NEW_EXPENSE).status_code == 201
+
+    after_write = client.get(path, headers={"If-None-Match": etag})
+    assert after_write.status_code == 200
+    assert after_write.headers["ETag"] != etag
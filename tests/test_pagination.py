@@ -0,0 +1,33 @@
+# tests/test_pagination.py
+
+from datetime import date, timedelta
+
+import pytest
+
+from app import database
+from tests.conftest import daily_expense
+
+PAGE_SIZE = 4
+
+@pytest.fixture
+def expenses(db_session):
+    # Several entries share each date, so pages have to break ties on the ID.
+    for index in range(23):
+        database.add_daily_expense(db_session, daily_expense(1.0 + index, date(2025, 5, 1) + timedelta(days=index % 6)))
+
+def _all_pages(db_session, **filters):
+    rows, after = [], None
+    while True:
+        page = database.get_daily_expenses_page(db_session, after=after, limit=PAGE_SIZE, **filters)
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        after = (page[-1]["cost_date"], page[-1]["doc_id"])
+
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("date_range", [{}, {"start_date": date(2025, 5, 2), "end_date": date(2025, 5, 4)}])
+def test_pages_match_unpaged_query(db_session, expenses, descending, date_range):
+    unpaged = database.get_daily_expenses_page(db_session, descending=descending, **date_range)
+
+    assert unpaged
+    assert _all_pages(db_session, descending=descending, **date_range) == unpaged